@@ -0,0 +1,272 @@
+"""Throughput and memory benchmarks for every whywhytools read/write entry point.
+
+Each case runs in a fresh process so its peak RSS is not polluted by earlier cases, and
+reports the best time over several runs as records/s and MB/s. The input files of the
+read cases are generated beforehand in another process, so their peak RSS only reflects
+the reader (e.g. iter_jsonl streams while read_jsonl holds every record). Results are saved as JSON
+so runs can be diffed between releases.
+
+Usage:
+    python benchmarks/bench_io.py [--records 100000] [--fields 8] [--str-len 32] [--tensor-mb 64]
+                                  [--repeat 3] [--filter jsonl] [--output bench_results.json]
+                                  [--compare previous_results.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+import whywhytools as wt
+
+
+def make_records(n: int, fields: int, str_len: int, seed: int = 0) -> list[dict]:
+    """Generate n synthetic records with a mix of strings, numbers, lists and nested dicts."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + " éü你好"
+    records = []
+    for i in range(n):
+        obj: dict[str, Any] = {"id": i}
+        for j in range(fields - 1):
+            kind = j % 4
+            if kind == 0:
+                obj[f"text_{j}"] = "".join(rng.choices(alphabet, k=str_len))
+            elif kind == 1:
+                obj[f"score_{j}"] = rng.random()
+            elif kind == 2:
+                obj[f"tags_{j}"] = [rng.randrange(1000) for _ in range(4)]
+            else:
+                obj[f"meta_{j}"] = {"lang": rng.choice(["en", "zh", "fr"]), "len": rng.randrange(str_len)}
+        records.append(obj)
+    return records
+
+
+def make_tensors(size_mb: int) -> dict:
+    """Generate a state dict of float32 tensors totalling about size_mb megabytes."""
+    import torch
+
+    numel = size_mb * (1 << 20) // 4 // 16
+    return {f"layer_{i}.weight": torch.randn(numel) for i in range(16)}
+
+
+def _text_lines(records: list[dict]) -> list[str]:
+    return [json.dumps(obj, ensure_ascii=False) for obj in records]
+
+
+def _as_json(records: list[dict]) -> dict:
+    return {"data": records}
+
+
+# Read cases: the file is prepared in setup, and each run loads it.
+READERS: dict[str, tuple[str | None, str, Callable, Callable]] = {
+    # name: (required package, file name, save data, load and count)
+    "read_jsonl": (None, "data.jsonl", wt.write_jsonl, lambda p: len(wt.read_jsonl(p))),
+    "iter_jsonl": (None, "data.jsonl", wt.write_jsonl, lambda p: sum(1 for _ in wt.iter_jsonl(p))),
+    "read_json": (
+        None,
+        "data.json",
+        lambda r, p, **kwargs: wt.write_json(_as_json(r), p, **kwargs),
+        lambda p: len(wt.read_json(p)["data"]),
+    ),
+    "read_file": (
+        None,
+        "data.txt",
+        lambda r, p, **kwargs: wt.write_file(_text_lines(r), p, **kwargs),
+        lambda p: len(wt.read_file(p, lines=True)),
+    ),
+    "load_pickle": (None, "data.pkl", wt.save_pickle, lambda p: len(wt.load_pickle(p))),
+    "load_pt": ("torch", "model.pt", wt.save_pt, lambda p: len(wt.load_pt(p, weights_only=True))),
+    "load_safetensors": (
+        "safetensors",
+        "model.safetensors",
+        wt.save_safetensors,
+        lambda p: len(wt.load_safetensors(p)),
+    ),
+}
+
+# Write cases: the data is generated in setup, and each run saves it.
+WRITERS: dict[str, tuple[str | None, str, Callable | None, Callable]] = {
+    # name: (required package, file name, transform data, save data)
+    "write_jsonl": (None, "data.jsonl", None, wt.write_jsonl),
+    "write_json": (None, "data.json", _as_json, wt.write_json),
+    "write_file": (None, "data.txt", _text_lines, wt.write_file),
+    "save_pickle": (None, "data.pkl", None, wt.save_pickle),
+    "save_pt": ("torch", "model.pt", None, wt.save_pt),
+    "save_safetensors": ("safetensors", "model.safetensors", None, wt.save_safetensors),
+}
+
+# The modules the loaders of each requirement import lazily
+BACKEND_MODULES = {"torch": "torch", "safetensors": "safetensors.torch"}
+
+REQUIREMENTS = {name: case[0] for name, case in {**READERS, **WRITERS}.items()}
+REQUIREMENTS["append_jsonl"] = None
+
+
+def _make_data(config: dict, tensors: bool) -> Any:
+    if tensors:
+        return make_tensors(config["tensor_mb"])
+    return make_records(config["records"], config["fields"], config["str_len"])
+
+
+def prepare_inputs(name: str, workdir: Path, config: dict) -> None:
+    """Write the input file of a read case; meant to run in a process of its own."""
+    requirement, file_name, save, _ = READERS[name]
+    save(_make_data(config, tensors=requirement is not None), workdir / file_name, silent=True)
+
+
+def setup_case(name: str, workdir: Path, config: dict) -> Callable[[], tuple[int, Path]]:
+    """Prepare the inputs of a case and return a function performing one timed run."""
+    if name in READERS:
+        # The input file was written by prepare_inputs in another process
+        requirement, file_name, _, load = READERS[name]
+        path = workdir / file_name
+        if requirement is not None:
+            # The loaders import it lazily; keep that one-off cost out of the first timed run
+            import_module(BACKEND_MODULES[requirement])
+        return lambda: (load(path), path)
+
+    if name == "append_jsonl":
+        records = _make_data(config, tensors=False)
+        path = workdir / "data.jsonl"
+
+        def append() -> tuple[int, Path]:
+            path.unlink(missing_ok=True)
+            for start in range(0, len(records), 1000):
+                wt.append_jsonl(records[start : start + 1000], path)
+            return len(records), path
+
+        return append
+
+    requirement, file_name, wrap, save = WRITERS[name]
+    data = _make_data(config, tensors=requirement is not None)
+    payload = wrap(data) if wrap is not None else data
+    path = workdir / file_name
+
+    def write() -> tuple[int, Path]:
+        save(payload, path, force=True, silent=True)
+        return len(data), path
+
+    return write
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(name: str, workdir: Path, config: dict) -> dict:
+    """Run one benchmark case; meant to be called in a fresh process."""
+    run = setup_case(name, workdir, config)
+    # For write cases, this includes the generated data the runs save
+    rss_before = _peak_rss_mb()
+    times = []
+    for _ in range(config["repeat"]):
+        start = time.perf_counter()
+        n_records, path = run()
+        times.append(time.perf_counter() - start)
+    size_mb = os.path.getsize(path) / (1 << 20)
+
+    best = min(times)
+    return {
+        "records": n_records,
+        "size_mb": round(size_mb, 3),
+        "best_s": best,
+        "mean_s": sum(times) / len(times),
+        "records_per_s": n_records / best,
+        "mb_per_s": size_mb / best,
+        "peak_rss_mb_before": rss_before,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """Print the speed ratio of each case against a previous results file."""
+    print(f"\nComparison against {baseline['meta']['timestamp']} (>1.00 is faster)")
+    for name, result in results["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        speedup = previous["best_s"] / result["best_s"]
+        rss = ""
+        if result["peak_rss_mb"] and previous.get("peak_rss_mb"):
+            rss = f"  peak RSS {previous['peak_rss_mb']:.0f} -> {result['peak_rss_mb']:.0f} MB"
+        print(f"  {name:<18} {speedup:6.2f}x{rss}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000, help="number of synthetic records")
+    parser.add_argument("--fields", type=int, default=8, help="number of fields per record")
+    parser.add_argument("--str-len", type=int, default=32, help="length of the string fields")
+    parser.add_argument("--tensor-mb", type=int, default=64, help="size of the tensor state dict in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs per case")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this string")
+    parser.add_argument("--output", default="bench_results.json", help="where to save the JSON results")
+    parser.add_argument("--compare", help="a previous results file to compare against")
+    args = parser.parse_args()
+
+    config = {
+        "records": args.records,
+        "fields": args.fields,
+        "str_len": args.str_len,
+        "tensor_mb": args.tensor_mb,
+        "repeat": args.repeat,
+    }
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_backend": wt.get_json_backend().name,
+            "config": config,
+        },
+        "results": {},
+    }
+
+    # A fresh process per case keeps the peak RSS figures independent
+    context = multiprocessing.get_context("spawn")
+    print(f"{'case':<18} {'records/s':>12} {'MB/s':>9} {'best s':>9} {'peak RSS MB':>12}")
+    for name, requirement in REQUIREMENTS.items():
+        if args.filter not in name:
+            continue
+        if requirement is not None and find_spec(requirement) is None:
+            print(f"{name:<18} skipped ({requirement} is not installed)")
+            continue
+        with tempfile.TemporaryDirectory() as workdir:
+            if name in READERS:
+                with context.Pool(1) as pool:
+                    pool.apply(prepare_inputs, (name, Path(workdir), config))
+            with context.Pool(1) as pool:
+                result = pool.apply(run_case, (name, Path(workdir), config))
+        results["results"][name] = result
+        rss = f"{result['peak_rss_mb']:12.1f}" if result["peak_rss_mb"] is not None else f"{'n/a':>12}"
+        print(f"{name:<18} {result['records_per_s']:12,.0f} {result['mb_per_s']:9.1f} {result['best_s']:9.3f} {rss}")
+
+    with open(args.output, mode="w", encoding="utf-8") as fp:
+        json.dump(results, fp, indent=4)
+    print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fp:
+            compare(results, json.load(fp))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Microbenchmark for the happy path of check_list_type.
+
+Usage:
+    python benchmarks/bench_type_checker.py [--size 1000000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+from whywhytools.type_checker import check_list_type, get_var_name
+
+
+def eager_check(variable_list: list, expected_type: type) -> None:
+    """The previous check_list_type: eager name lookup followed by a Python loop."""
+    var_name = get_var_name(variable_list)
+    for item in variable_list:
+        if not isinstance(item, expected_type):
+            raise TypeError(var_name)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="number of list elements")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs (best is reported)")
+    args = parser.parse_args()
+
+    # Per-call overhead, as paid by every append_jsonl of a single record
+    record = [{"id": 0}]
+    number = 10_000
+    print(f"check_list_type on a 1-element list (best of {args.repeat}, {number:,} calls)")
+    for name, func in {
+        "eager name lookup (previous)": lambda: eager_check(record, dict),
+        "check_list_type": lambda: check_list_type(record, dict),
+    }.items():
+        best = min(timeit.repeat(func, number=number, repeat=args.repeat)) / number
+        print(f"  {name:<38} {best * 1e6:10.3f} us/call")
+
+    # Per-element cost; "full" is bound by memory traffic over the list's elements
+    records = [{"id": i} for i in range(args.size)]
+    cases = {
+        "eager name lookup (previous)": lambda: eager_check(records, dict),
+        'check_list_type(validate="full")': lambda: check_list_type(records, dict, validate="full"),
+        'check_list_type(validate="sample")': lambda: check_list_type(records, dict, validate="sample"),
+        'check_list_type(validate="off")': lambda: check_list_type(records, dict, validate="off"),
+    }
+
+    print(f"check_list_type on {args.size:,} dicts (best of {args.repeat})")
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"  {name:<38} {best * 1e3:10.3f} ms  {best / args.size * 1e9:8.2f} ns/element")
+
+
+if __name__ == "__main__":
+    main()
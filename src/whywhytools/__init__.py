@@ -2,51 +2,209 @@
 
 This module exposes functions for reading and writing various file formats including
 JSON, JSONL, Pickle, Text, PyTorch tensors, and Safetensors, along with common file system utilities.
+
+Submodules are imported lazily on first attribute access (PEP 562), so `import whywhytools`
+stays cheap and a program only pays for the managers it uses. The submodules themselves
+are attributes too, e.g. `whywhytools.json_manager`, loaded on first access.
 """
 
-from .json_manager import (
-    read_json,
-    write_json,
-)
-from .jsonl_manager import (
-    append_jsonl,
-    read_jsonl,
-    write_jsonl,
-)
-from .pickle_manager import (
-    load_pickle,
-    save_pickle,
-)
-from .safetensors_manager import (
-    load_safetensors,
-    save_safetensors,
-)
-from .text_manager import (
-    append_file,
-    read_file,
-    write_file,
-)
-from .torch_manager import (
-    load_pt,
-    save_pt,
-)
-from .utils import create_parent_dirs
+import importlib
+
+
+# Avoid importing typing at startup; static type checkers treat this name specially
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .appender import (
+        JsonlAppender,
+        TextAppender,
+    )
+    from .async_saver import AsyncSaver
+    from .bulk_manager import (
+        ReadManyError,
+        read_many,
+    )
+    from .compression import open_file
+    from .cache import disk_cache
+    from .follow import (
+        follow_file,
+        follow_jsonl,
+    )
+    from .json_backend import (
+        get_json_backend,
+        register_json_backend,
+        set_json_backend,
+    )
+    from .json_manager import (
+        read_json,
+        write_json,
+    )
+    from .jsonl_index import (
+        JsonlFile,
+        build_jsonl_index,
+    )
+    from .jsonl_manager import (
+        append_jsonl,
+        iter_jsonl,
+        parallel_iter_jsonl,
+        parallel_read_jsonl,
+        read_jsonl,
+        write_jsonl,
+    )
+    from .jsonl_shards import ShardedJsonlWriter
+    from .pickle_manager import (
+        load_pickle,
+        save_pickle,
+    )
+    from .read_cache import (
+        cache_clear,
+        cache_info,
+        set_cache_size,
+    )
+    from .safetensors_manager import (
+        load_safetensors,
+        open_safetensors,
+        save_safetensors,
+    )
+    from .text_manager import (
+        append_file,
+        iter_file,
+        read_file,
+        write_file,
+    )
+    from .torch_manager import (
+        inspect_pt,
+        load_pt,
+        save_pt,
+    )
+    from .utils import create_parent_dirs
 
 
+# Maps each public name to the submodule that defines it
+_EXPORTS = {
+    "read_jsonl": "jsonl_manager",
+    "iter_jsonl": "jsonl_manager",
+    "parallel_read_jsonl": "jsonl_manager",
+    "parallel_iter_jsonl": "jsonl_manager",
+    "write_jsonl": "jsonl_manager",
+    "append_jsonl": "jsonl_manager",
+    "JsonlAppender": "appender",
+    "build_jsonl_index": "jsonl_index",
+    "JsonlFile": "jsonl_index",
+    "ShardedJsonlWriter": "jsonl_shards",
+    "read_json": "json_manager",
+    "write_json": "json_manager",
+    "read_file": "text_manager",
+    "iter_file": "text_manager",
+    "write_file": "text_manager",
+    "append_file": "text_manager",
+    "TextAppender": "appender",
+    "load_pickle": "pickle_manager",
+    "save_pickle": "pickle_manager",
+    "load_pt": "torch_manager",
+    "inspect_pt": "torch_manager",
+    "save_pt": "torch_manager",
+    "load_safetensors": "safetensors_manager",
+    "open_safetensors": "safetensors_manager",
+    "save_safetensors": "safetensors_manager",
+    "create_parent_dirs": "utils",
+    "open_file": "compression",
+    "get_json_backend": "json_backend",
+    "set_json_backend": "json_backend",
+    "register_json_backend": "json_backend",
+    "read_many": "bulk_manager",
+    "ReadManyError": "bulk_manager",
+    "AsyncSaver": "async_saver",
+    "disk_cache": "cache",
+    "cache_info": "read_cache",
+    "cache_clear": "read_cache",
+    "set_cache_size": "read_cache",
+    "follow_file": "follow",
+    "follow_jsonl": "follow",
+}
+
 __all__ = [
     "read_jsonl",
+    "iter_jsonl",
+    "parallel_read_jsonl",
+    "parallel_iter_jsonl",
     "write_jsonl",
     "append_jsonl",
+    "JsonlAppender",
+    "build_jsonl_index",
+    "JsonlFile",
+    "ShardedJsonlWriter",
     "read_json",
     "write_json",
     "read_file",
+    "iter_file",
     "write_file",
     "append_file",
+    "TextAppender",
     "load_pickle",
     "save_pickle",
     "load_pt",
+    "inspect_pt",
     "save_pt",
     "load_safetensors",
+    "open_safetensors",
     "save_safetensors",
     "create_parent_dirs",
+    "open_file",
+    "get_json_backend",
+    "set_json_backend",
+    "register_json_backend",
+    "read_many",
+    "ReadManyError",
+    "AsyncSaver",
+    "disk_cache",
+    "cache_info",
+    "cache_clear",
+    "set_cache_size",
+    "follow_file",
+    "follow_jsonl",
 ]
+
+
+# Submodules reachable as attributes, e.g. `whywhytools.json_manager.read_json`, as they
+# were when this module imported them eagerly
+_SUBMODULES = frozenset(
+    {
+        "aio",
+        "appender",
+        "async_saver",
+        "bulk_manager",
+        "cache",
+        "compression",
+        "follow",
+        "json_backend",
+        "json_manager",
+        "jsonl_index",
+        "jsonl_manager",
+        "jsonl_shards",
+        "pickle_manager",
+        "read_cache",
+        "safetensors_manager",
+        "schema",
+        "text_manager",
+        "torch_manager",
+        "type_checker",
+        "utils",
+    }
+)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        # Importing a submodule also binds it in this module's namespace
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache the attribute so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -0,0 +1,389 @@
+"""This module provides asyncio counterparts of the whywhytools functions.
+
+Every blocking call runs in a bounded, shared thread pool so the event loop keeps serving
+other tasks. Each public function `f` has an awaitable twin `af` with the same arguments,
+JSONL and text files can be consumed with async iterators, and AsyncJsonlWriter and
+AsyncTextWriter stream records to a file with backpressure.
+
+Example:
+    from whywhytools import aio
+
+    config = await aio.aread_json("config.json")
+    async for record in aio.aiter_jsonl("data.jsonl"):
+        ...
+    async with aio.AsyncJsonlWriter("out.jsonl") as writer:
+        await writer.write({"id": 1})
+"""
+
+import abc
+import asyncio
+import functools
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from .bulk_manager import read_many
+from .compression import open_file, resolve_compression
+from .json_backend import get_json_backend
+from .json_manager import read_json, write_json
+from .jsonl_index import build_jsonl_index
+from .jsonl_manager import append_jsonl, iter_jsonl, parallel_read_jsonl, read_jsonl, write_jsonl
+from .pickle_manager import load_pickle, save_pickle
+from .safetensors_manager import load_safetensors, save_safetensors
+from .text_manager import append_file, iter_file, read_file, write_file
+from .torch_manager import inspect_pt, load_pt, save_pt
+from .type_checker import check_type
+from .utils import atomic_path, create_parent_dirs
+
+
+DEFAULT_MAX_WORKERS = 8
+
+_executor: ThreadPoolExecutor | None = None
+_max_workers = DEFAULT_MAX_WORKERS
+
+
+def set_max_workers(max_workers: int) -> None:
+    """
+    Set the size of the thread pool shared by all async functions.
+
+    Operations already running finish on the previous pool.
+
+    Args:
+        max_workers (int): The maximum number of blocking calls running at the same time.
+
+    Raises:
+        ValueError: If max_workers is less than 1.
+    """
+    global _executor, _max_workers
+    check_type(max_workers, int)
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    _max_workers = max_workers
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="whywhytools-aio")
+    return _executor
+
+
+async def run_in_thread(func: Callable, /, *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking function in the shared thread pool and await its result.
+
+    Args:
+        func (Callable): The function to call.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        Any: The return value of func.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def _to_async(func: Callable) -> Callable:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await run_in_thread(func, *args, **kwargs)
+
+    wrapper.__name__ = wrapper.__qualname__ = f"a{func.__name__}"
+    wrapper.__doc__ = f"Awaitable version of :func:`whywhytools.{func.__name__}`, run in the shared thread pool.\n"
+    return wrapper
+
+
+aread_jsonl = _to_async(read_jsonl)
+aparallel_read_jsonl = _to_async(parallel_read_jsonl)
+awrite_jsonl = _to_async(write_jsonl)
+aappend_jsonl = _to_async(append_jsonl)
+abuild_jsonl_index = _to_async(build_jsonl_index)
+aread_json = _to_async(read_json)
+awrite_json = _to_async(write_json)
+aread_file = _to_async(read_file)
+awrite_file = _to_async(write_file)
+aappend_file = _to_async(append_file)
+aload_pickle = _to_async(load_pickle)
+asave_pickle = _to_async(save_pickle)
+aload_pt = _to_async(load_pt)
+asave_pt = _to_async(save_pt)
+ainspect_pt = _to_async(inspect_pt)
+aload_safetensors = _to_async(load_safetensors)
+asave_safetensors = _to_async(save_safetensors)
+acreate_parent_dirs = _to_async(create_parent_dirs)
+aread_many = _to_async(read_many)
+
+
+async def _aiter_batches(make_iterator: Callable[[], Iterator], batch_size: int) -> AsyncIterator:
+    # Items are pulled in batches so the thread hop is paid once per batch, not per item
+    check_type(batch_size, int)
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    iterator = await run_in_thread(make_iterator)
+    try:
+        while True:
+            batch = await run_in_thread(lambda: list(islice(iterator, batch_size)))
+            if not batch:
+                return
+            for item in batch:
+                yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await run_in_thread(close)
+
+
+def aiter_jsonl(file: str | Path, batch_size: int = 1000, **kwargs: Any) -> AsyncIterator[dict]:
+    """
+    Asynchronously iterate over the records of a JSONL file.
+
+    Args:
+        file (Union[str, Path]): The path to the JSONL file.
+        batch_size (int, optional): Number of records decoded per thread hop. Defaults to 1000.
+        **kwargs: Additional keyword arguments to pass to iter_jsonl.
+
+    Returns:
+        AsyncIterator[dict]: An async iterator over the JSON objects in the file.
+    """
+    return _aiter_batches(functools.partial(iter_jsonl, file, **kwargs), batch_size)
+
+
+def aiter_file(file: str | Path, batch_size: int = 1000, **kwargs: Any) -> AsyncIterator[str]:
+    """
+    Asynchronously iterate over the lines of a text file.
+
+    Args:
+        file (Union[str, Path]): The path to the text file.
+        batch_size (int, optional): Number of lines read per thread hop. Defaults to 1000.
+        **kwargs: Additional keyword arguments to pass to iter_file.
+
+    Returns:
+        AsyncIterator[str]: An async iterator over the lines of the file, without newlines.
+    """
+    return _aiter_batches(functools.partial(iter_file, file, **kwargs), batch_size)
+
+
+_CLOSE = object()
+
+
+class _AsyncWriter(abc.ABC):
+    """Base class of the async writers: a bounded queue drained by one background task."""
+
+    def __init__(
+        self,
+        file: str | Path,
+        mode: str = "a",
+        force: bool = False,
+        max_pending: int = 10_000,
+        batch_size: int = 1000,
+        compression: str | None = "infer",
+        atomic: bool = True,
+    ):
+        check_type(file, (str, Path))
+        if mode not in ("w", "a"):
+            raise ValueError(f"mode must be 'w' or 'a', got {mode}")
+        for name, value in (("max_pending", max_pending), ("batch_size", batch_size)):
+            check_type(value, int, var_name=name)
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+        self.file = file
+        self._mode = mode
+        self._force = force
+        self._batch_size = batch_size
+        # Resolved from the final name, since mode "w" writes to a temporary one
+        self._compression = resolve_compression(file, compression)
+        self._atomic = atomic and mode == "w"
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._fp = None
+        self._target = None  # the atomic_path context of mode "w"
+        self._task: asyncio.Task | None = None
+        self._error: BaseException | None = None
+
+    def _open(self) -> None:
+        path = Path(self.file)
+        if self._mode == "w" and path.exists() and not self._force:
+            raise FileExistsError(f"[ERROR] {self.file} already exists.")
+        create_parent_dirs(self.file)
+        target = self.file
+        if self._atomic:
+            # Like write_jsonl, write to a temporary file renamed into place on close
+            self._target = atomic_path(self.file)
+            target = self._target.__enter__()
+        try:
+            self._fp = open_file(target, mode=f"{self._mode}b", compression=self._compression)
+        except BaseException as e:
+            self._finish_target(e)
+            raise
+
+    def _finish_target(self, error: BaseException | None) -> None:
+        """Rename the temporary file of mode "w" into place, or remove it after an error."""
+        target, self._target = self._target, None
+        if target is not None:
+            if error is None:
+                target.__exit__(None, None, None)
+            else:
+                target.__exit__(type(error), error, error.__traceback__)
+
+    def _close_file(self, error: BaseException | None) -> None:
+        try:
+            self._fp.close()
+        except BaseException as e:
+            self._finish_target(e)
+            raise
+        self._finish_target(error)
+
+    @abc.abstractmethod
+    def _encode(self, items: list) -> bytes:
+        """Encode a batch of queued items into the bytes to write."""
+
+    def _write_batch(self, items: list) -> None:
+        self._fp.write(self._encode(items))
+        self._fp.flush()
+
+    async def open(self) -> None:
+        """Open the file and start the background writer task."""
+        await run_in_thread(self._open)
+        self._task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        closing = False
+        while not closing:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if batch[-1] is _CLOSE:
+                batch.pop()
+                closing = True
+            try:
+                if batch and self._error is None:
+                    await run_in_thread(self._write_batch, batch)
+            except Exception as e:
+                # Keep draining so producers blocked on a full queue are released
+                self._error = e
+            finally:
+                for _ in range(len(batch) + closing):
+                    self._queue.task_done()
+
+    async def _put(self, item: Any) -> None:
+        if self._task is None:
+            raise RuntimeError("The writer is not open; use `async with` or await open() first")
+        if self._error is not None:
+            raise self._error
+        # Blocks while max_pending items are waiting, which is the backpressure signal
+        await self._queue.put(item)
+
+    async def flush(self) -> None:
+        """
+        Wait until every pending item has been written.
+
+        Raises:
+            Exception: The first error raised while writing.
+        """
+        await self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    async def close(self) -> None:
+        """
+        Write the pending items, stop the background task and close the file.
+
+        Raises:
+            Exception: The first error raised while writing.
+        """
+        await self._close(None)
+
+    async def _close(self, block_error: BaseException | None) -> None:
+        if self._task is None:
+            return
+        await self._queue.put(_CLOSE)
+        await self._task
+        self._task = None
+        await run_in_thread(self._close_file, self._error or block_error)
+        if self._error is not None:
+            raise self._error
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # In mode "w", an error in the block leaves the previous file untouched
+        await self._close(exc)
+
+
+class AsyncJsonlWriter(_AsyncWriter):
+    """
+    Stream dictionaries to a JSONL file from asyncio code with backpressure.
+
+    `write()` only waits when max_pending records are queued, and records are encoded and
+    written in batches by a background task running in the shared thread pool.
+
+    Args:
+        file (Union[str, Path]): The path to the JSONL file.
+        mode (str, optional): "a" to append or "w" to overwrite. Defaults to "a".
+        force (bool, optional): If True, overwrite the file in mode "w" if it exists. Defaults to False.
+        max_pending (int, optional): Maximum number of queued records. Defaults to 10000.
+        batch_size (int, optional): Maximum number of records per write. Defaults to 1000.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        atomic (bool, optional): In mode "w", if True, write to a temporary file in the same
+            directory and rename it into place on close, so the file is never left truncated;
+            if writing or the `async with` block fails, the temporary file is removed instead.
+            Records are then only visible once the writer is closed. Defaults to True.
+        backend (str | None, optional): The JSON backend to encode with. Defaults to None
+            (the globally selected backend).
+
+    Raises:
+        ValueError: If mode is not "w" or "a", or max_pending or batch_size is less than 1.
+        FileExistsError: On open, if mode is "w", the file exists and force is False.
+    """
+
+    def __init__(self, file: str | Path, *args: Any, backend: str | None = None, **kwargs: Any):
+        super().__init__(file, *args, **kwargs)
+        self._dumps = get_json_backend(backend).dumps
+
+    def _encode(self, items: list[dict]) -> bytes:
+        return "".join(self._dumps(obj, None) + "\n" for obj in items).encode("utf-8")
+
+    async def write(self, obj: dict) -> None:
+        """
+        Queue a dictionary for writing, waiting while the queue is full.
+
+        Args:
+            obj (dict): The dictionary to write.
+
+        Raises:
+            TypeError: If obj is not a dictionary.
+        """
+        check_type(obj, dict)
+        await self._put(obj)
+
+
+class AsyncTextWriter(_AsyncWriter):
+    """
+    Stream lines to a text file from asyncio code with backpressure.
+
+    Takes the same arguments as AsyncJsonlWriter, except backend.
+    """
+
+    def _encode(self, items: list[str]) -> bytes:
+        return "".join(line + "\n" for line in items).encode("utf-8")
+
+    async def write(self, line: str) -> None:
+        """
+        Queue a line for writing, waiting while the queue is full.
+
+        Args:
+            line (str): The line to write, without its newline.
+
+        Raises:
+            TypeError: If line is not a string.
+        """
+        check_type(line, str)
+        await self._put(line)
@@ -0,0 +1,236 @@
+"""This module provides appenders that keep a file open for high-rate appends."""
+
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from .compression import open_file, resolve_compression
+from .json_backend import get_json_backend
+from .jsonl_index import extend_jsonl_index, is_jsonl_index_valid
+from .type_checker import check_list_type, check_type
+from .utils import create_parent_dirs, file_lock
+
+
+FLUSH_BYTES = 1 << 16  # 64 KiB
+FLUSH_INTERVAL = 1.0  # seconds
+
+
+class _Appender:
+    """Base class of the appenders: an open handle in append mode and a write buffer."""
+
+    def __init__(
+        self,
+        file: str | Path,
+        flush_bytes: int = FLUSH_BYTES,
+        flush_interval: float | None = FLUSH_INTERVAL,
+        lock: bool = False,
+        compression: str | None = "infer",
+    ):
+        check_type(file, (str, Path))
+        check_type(flush_bytes, int)
+        if flush_interval is not None:
+            check_type(flush_interval, (int, float))
+        compression = resolve_compression(file, compression)
+        if lock and compression is not None:
+            # Each process would interleave its own compressed stream into the file
+            raise ValueError("lock cannot be used with compressed files")
+        create_parent_dirs(file)
+
+        self.file = file
+        self._flush_bytes = flush_bytes
+        self._flush_interval = flush_interval
+        self._lock = lock
+        self._compressed = compression is not None
+        self._fp = open_file(file, mode="ab", compression=compression)
+        self._buffer = bytearray()
+        self._mutex = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    @property
+    def closed(self) -> bool:
+        return self._fp.closed
+
+    def _append(self, data: bytes) -> None:
+        with self._mutex:
+            if self._fp.closed:
+                raise ValueError(f"I/O operation on closed {type(self).__name__}")
+            self._buffer += data
+            if len(self._buffer) >= self._flush_bytes or (
+                self._flush_interval is not None and time.monotonic() - self._last_flush >= self._flush_interval
+            ):
+                self._flush()
+
+    def _write_buffer(self) -> None:
+        self._fp.write(self._buffer)
+        if not self._compressed:
+            # Compressed streams are not flushed, which would degrade the compression ratio
+            self._fp.flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            if self._lock:
+                with file_lock(self._fp.fileno()):
+                    self._write_buffer()
+            else:
+                self._write_buffer()
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Write the buffered data to the file."""
+        with self._mutex:
+            if not self._fp.closed:
+                self._flush()
+
+    def close(self) -> None:
+        """Flush the buffered data and close the file."""
+        with self._mutex:
+            if self._fp.closed:
+                return
+            try:
+                self._flush()
+            finally:
+                self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # An appender dropped without close() still writes out its buffer
+        fp = getattr(self, "_fp", None)
+        if fp is not None and not fp.closed:
+            self.close()
+
+
+class JsonlAppender(_Appender):
+    """
+    Append dictionaries to a JSONL file through a handle that stays open.
+
+    Unlike append_jsonl, which opens the file and checks its arguments on every call,
+    records are encoded into a buffer that is written out once it holds flush_bytes bytes,
+    when a write happens flush_interval seconds or more after the last flush, and on
+    flush(), close() or context exit. The time threshold is only checked on write. For
+    compressed files, the data reaches the disk as the codec emits it and in full on close.
+    An appender that is garbage collected without being closed is closed then.
+
+    If the file has an up-to-date index sidecar (see build_jsonl_index), the index is
+    extended on each flush, as append_jsonl does.
+
+    Example:
+        with JsonlAppender("predictions.jsonl") as log:
+            for output in outputs:
+                log.write(output)
+    """
+
+    def __init__(
+        self,
+        file: str | Path,
+        flush_bytes: int = FLUSH_BYTES,
+        flush_interval: float | None = FLUSH_INTERVAL,
+        lock: bool = False,
+        compression: str | None = "infer",
+        backend: str | None = None,
+    ):
+        """
+        Open a JSONL file for appending.
+
+        Args:
+            file (Union[str, Path]): The path to the JSONL file, created if it does not exist.
+            flush_bytes (int, optional): Write the buffer out once it holds this many bytes.
+                Defaults to 64 KiB.
+            flush_interval (float | None, optional): Also write it out on the first write
+                this many seconds after the last flush; None disables it. Defaults to 1.0.
+            lock (bool, optional): If True, hold an exclusive fcntl lock during each flush, so
+                several processes can append to the same file without interleaving their
+                lines. Defaults to False.
+            compression (str | None, optional): The compression codec, "infer" to detect it
+                from the file extension, or None for no compression. Defaults to "infer".
+            backend (str | None, optional): The JSON backend to encode with. Defaults to None
+                (the globally selected backend).
+
+        Raises:
+            ValueError: If lock is True for a compressed file.
+        """
+        super().__init__(file, flush_bytes, flush_interval, lock, compression)
+        self._dumps = get_json_backend(backend).dumps
+        self._indexed = not self._compressed and is_jsonl_index_valid(file)
+
+    def _write_buffer(self) -> None:
+        super()._write_buffer()
+        if self._indexed:
+            # Still under the file lock, so the lines of other processes are complete
+            extend_jsonl_index(self.file)
+
+    def write(self, obj: dict) -> None:
+        """
+        Append one dictionary.
+
+        Args:
+            obj (dict): The dictionary to append.
+
+        Raises:
+            TypeError: If obj is not a dictionary.
+        """
+        check_type(obj, dict, var_name="obj")
+        self._append((self._dumps(obj, None) + "\n").encode("utf-8"))
+
+    def write_many(self, obj_list: Iterable[dict]) -> None:
+        """
+        Append every dictionary of an iterable.
+
+        Args:
+            obj_list (Iterable[dict]): The dictionaries to append.
+
+        Raises:
+            TypeError: If an element is not a dictionary. A list is checked before anything
+                is appended.
+        """
+        if isinstance(obj_list, list):
+            check_list_type(obj_list, dict, var_name="obj_list")
+            dumps = self._dumps
+            self._append("".join(dumps(obj, None) + "\n" for obj in obj_list).encode("utf-8"))
+            return
+        for obj in obj_list:
+            self.write(obj)
+
+
+class TextAppender(_Appender):
+    """
+    Append lines to a text file through a handle that stays open.
+
+    Takes the same arguments and flushes on the same thresholds as JsonlAppender, except backend.
+    """
+
+    def write(self, line: str) -> None:
+        """
+        Append one line; the newline is added.
+
+        Args:
+            line (str): The line to append.
+
+        Raises:
+            TypeError: If line is not a string.
+        """
+        check_type(line, str, var_name="line")
+        self._append((line + "\n").encode("utf-8"))
+
+    def write_many(self, lines: Iterable[str]) -> None:
+        """
+        Append every line of an iterable.
+
+        Args:
+            lines (Iterable[str]): The lines to append.
+
+        Raises:
+            TypeError: If a line is not a string. A list is checked before anything is appended.
+        """
+        if isinstance(lines, list):
+            check_list_type(lines, str, var_name="lines")
+            self._append("".join(line + "\n" for line in lines).encode("utf-8"))
+            return
+        for line in lines:
+            self.write(line)
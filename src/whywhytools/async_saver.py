@@ -0,0 +1,200 @@
+"""This module provides a background saver so that checkpoints do not block the caller."""
+
+import copy as copy_module
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextlib import suppress
+from typing import Any
+
+from .type_checker import check_type
+
+
+class AsyncSaver:
+    """
+    Run save calls on a background thread, handing them over through a bounded queue.
+
+    Each call returns a concurrent.futures.Future that raises the save's error when its
+    result is requested. Calls run one at a time in submission order, so successive saves
+    of the same file land in order. When max_pending calls are waiting, submitting blocks
+    until one completes, which bounds the memory held by queued objects.
+
+    The caller must not modify an object until its save completes, unless copy=True
+    (a deep copy is taken in the caller, which for large tensors costs memory and time).
+
+    The save methods pass raise_on_exists=True unless told otherwise, so an existing file
+    fails the future with FileExistsError instead of exiting the background thread.
+    The saver only keeps the futures of calls that have not completed or that failed,
+    so it can run for a whole training without accumulating them.
+
+    Example:
+        with AsyncSaver() as saver:
+            for step in range(steps):
+                train_step()
+                saver.save_pt(model.state_dict(), f"ckpt/{step}.pt", force=True, silent=True)
+        # leaving the block waits for the pending saves
+    """
+
+    def __init__(self, max_pending: int = 2, copy: bool = False):
+        """
+        Start the background saver.
+
+        Args:
+            max_pending (int, optional): Maximum number of saves waiting for the thread;
+                submitting more blocks. Defaults to 2.
+            copy (bool, optional): If True, deep-copy each object before queueing it, so the
+                caller may modify it right away. Defaults to False.
+
+        Raises:
+            ValueError: If max_pending is less than 1.
+        """
+        check_type(max_pending, int)
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be at least 1, got {max_pending}")
+        self._copy = copy
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        # Completed futures are dropped by _on_done, except failed ones kept for wait_all
+        self._pending: set[Future] = set()
+        self._failed: list[Future] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="whywhytools-saver", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                future, func, args, kwargs = item
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(func(*args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, func: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        """
+        Queue func(*args, **kwargs) to run on the background thread.
+
+        Args:
+            func (Callable): The function to call, e.g. save_pt.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            Future: The future of the call's result.
+
+        Raises:
+            RuntimeError: If the saver is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot submit to a closed AsyncSaver")
+        future: Future = Future()
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        self._queue.put((future, func, args, kwargs))
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+            if not future.cancelled() and future.exception() is not None:
+                self._failed.append(future)
+
+    def _submit_save(self, func: Callable, obj: Any, *args: Any, **kwargs: Any) -> Future:
+        # sys.exit in the background thread would only end that thread
+        kwargs.setdefault("raise_on_exists", True)
+        if self._copy:
+            obj = copy_module.deepcopy(obj)
+        return self.submit(func, obj, *args, **kwargs)
+
+    def save_pt(self, obj: Any, *args: Any, **kwargs: Any) -> Future:
+        """Queue a save_pt call; takes the same arguments as save_pt."""
+        from .torch_manager import save_pt
+
+        return self._submit_save(save_pt, obj, *args, **kwargs)
+
+    def save_safetensors(self, obj: Any, *args: Any, **kwargs: Any) -> Future:
+        """Queue a save_safetensors call; takes the same arguments as save_safetensors."""
+        from .safetensors_manager import save_safetensors
+
+        return self._submit_save(save_safetensors, obj, *args, **kwargs)
+
+    def save_pickle(self, obj: Any, *args: Any, **kwargs: Any) -> Future:
+        """Queue a save_pickle call; takes the same arguments as save_pickle."""
+        from .pickle_manager import save_pickle
+
+        return self._submit_save(save_pickle, obj, *args, **kwargs)
+
+    def write_json(self, obj: Any, *args: Any, **kwargs: Any) -> Future:
+        """Queue a write_json call; takes the same arguments as write_json."""
+        from .json_manager import write_json
+
+        return self._submit_save(write_json, obj, *args, **kwargs)
+
+    def write_jsonl(self, obj_list: Any, *args: Any, **kwargs: Any) -> Future:
+        """Queue a write_jsonl call; takes the same arguments as write_jsonl."""
+        from .jsonl_manager import write_jsonl
+
+        return self._submit_save(write_jsonl, obj_list, *args, **kwargs)
+
+    def wait_all(self, raise_on_error: bool = True) -> list[Future]:
+        """
+        Wait until every call submitted so far has completed.
+
+        Args:
+            raise_on_error (bool, optional): If True, raise the error of the first failed
+                call. Defaults to True.
+
+        Returns:
+            list[Future]: The futures of the calls that failed since the last wait_all(),
+            in completion order.
+
+        Raises:
+            Exception: The error of the first failed call, if raise_on_error is True.
+        """
+        self._queue.join()
+        with self._lock:
+            failed, self._failed = self._failed, []
+        if raise_on_error and failed:
+            raise failed[0].exception()
+        return failed
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop accepting calls and stop the background thread once the queue is drained.
+
+        Args:
+            wait (bool, optional): If True, wait for the pending calls and raise the error of
+                the first failed one. If False, cancel the calls that have not started.
+                Defaults to True.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not wait:
+            with self._lock:
+                pending = list(self._pending)
+            for future in pending:
+                future.cancel()
+        self._queue.put(None)
+        self._thread.join()
+        if wait:
+            self.wait_all()
+
+    def __enter__(self) -> "AsyncSaver":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Do not mask the error raised in the block with a save error
+        with suppress(Exception):
+            self.close()
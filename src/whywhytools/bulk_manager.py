@@ -0,0 +1,164 @@
+"""This module provides concurrent loading of many files at once."""
+
+import glob
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from .compression import EXTENSIONS
+from .type_checker import check_type
+
+
+EXECUTORS = ("thread", "process")
+ERROR_MODES = ("raise", "return")
+
+# Maps file extensions to the name of the loader used by read_many
+LOADERS = {
+    ".json": "read_json",
+    ".jsonl": "read_jsonl",
+    ".txt": "read_file",
+    ".pkl": "load_pickle",
+    ".pickle": "load_pickle",
+    ".pt": "load_pt",
+    ".pth": "load_pt",
+    ".safetensors": "load_safetensors",
+}
+
+
+class ReadManyError(Exception):
+    """
+    Raised by read_many after the whole batch ran, when some files failed to load.
+
+    Attributes:
+        errors (dict): Maps each failed path to its exception.
+        results (list): The loaded objects in input order, with the exception in place of
+            each failed file.
+    """
+
+    def __init__(self, errors: dict, results: list):
+        self.errors = errors
+        self.results = results
+        lines = [f"{path}: {type(e).__name__}: {e}" for path, e in errors.items()]
+        super().__init__(f"{len(errors)} of {len(results)} files failed to load\n" + "\n".join(lines))
+
+
+def infer_loader(file: str | Path) -> Callable:
+    """
+    Pick the whywhytools loader for a file from its extension, ignoring compression suffixes.
+
+    Args:
+        file (Union[str, Path]): The path to the file, e.g. `a.json` or `a.jsonl.gz`.
+
+    Returns:
+        Callable: The loader function, e.g. read_json.
+
+    Raises:
+        ValueError: If no loader handles the extension.
+    """
+    path = Path(file)
+    suffix = path.suffix.lower()
+    if suffix in EXTENSIONS:
+        suffix = Path(path.stem).suffix.lower()
+    name = LOADERS.get(suffix)
+    if name is None:
+        raise ValueError(f"Cannot infer a loader for {file}; pass loader= explicitly")
+
+    import whywhytools
+
+    return getattr(whywhytools, name)
+
+
+def _expand(paths: str | Path | Iterable[str | Path]) -> list[str | Path]:
+    if isinstance(paths, str):
+        if glob.has_magic(paths):
+            return sorted(glob.glob(paths, recursive=True))
+        return [paths]
+    if isinstance(paths, Path):
+        return [paths]
+    paths = list(paths)
+    for path in paths:
+        check_type(path, (str, Path))
+    return paths
+
+
+def _load_one(loader: Callable, file: str | Path) -> tuple[bool, Any]:
+    # Exceptions are returned rather than raised so one failure does not stop the batch
+    try:
+        return True, loader(file)
+    except Exception as e:
+        return False, e
+
+
+def read_many(
+    paths: str | Path | Iterable[str | Path],
+    loader: Callable | None = None,
+    workers: int | None = None,
+    executor: str = "thread",
+    as_dict: bool = False,
+    errors: str = "raise",
+) -> list | dict:
+    """
+    Load many files concurrently, preserving the input order.
+
+    Threads overlap the per-file latency of small files, which dominates on network
+    filesystems; processes also spread the decoding over several cores.
+
+    Args:
+        paths (Union[str, Path, Iterable[Union[str, Path]]]): A glob pattern such as
+            "data/**/*.json" (expanded recursively and sorted), a single path, or paths.
+        loader (Callable | None, optional): The function called with each path. Defaults to
+            None (picked per file from its extension, e.g. read_json for `.json` and
+            load_pickle for `.pkl.gz`). With executor="process" it must be picklable.
+        workers (int | None, optional): Number of threads or processes. 1 loads the files
+            in the calling thread. Defaults to None (the executor's default).
+        executor (str, optional): "thread" or "process". Defaults to "thread".
+        as_dict (bool, optional): If True, return a dict keyed by path instead of a list.
+            Defaults to False.
+        errors (str, optional): "raise" to raise ReadManyError once every file has been
+            attempted, or "return" to put the exception in place of each failed file.
+            Defaults to "raise".
+
+    Returns:
+        Union[list, dict]: The loaded objects in input order, or a dict keyed by path.
+
+    Raises:
+        ValueError: If an argument is invalid or no loader handles an extension.
+        ReadManyError: If some files failed to load and errors is "raise".
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {', '.join(EXECUTORS)}, got {executor}")
+    if errors not in ERROR_MODES:
+        raise ValueError(f"errors must be one of {', '.join(ERROR_MODES)}, got {errors}")
+    if workers is not None:
+        check_type(workers, int)
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+    files = _expand(paths)
+    loaders = [loader] * len(files) if loader is not None else [infer_loader(file) for file in files]
+
+    if workers == 1 or len(files) <= 1:
+        outcomes = list(map(_load_one, loaders, files))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        if executor == "thread":
+            pool = ThreadPoolExecutor(max_workers=workers)
+            chunksize = 1
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            # Batch small files per task to amortize the inter-process round trip
+            chunksize = max(1, len(files) // ((workers or os.cpu_count() or 1) * 4))
+        with pool:
+            outcomes = list(pool.map(_load_one, loaders, files, chunksize=chunksize))
+
+    results = [value for _, value in outcomes]
+    if errors == "raise":
+        failed = {file: value for file, (ok, value) in zip(files, outcomes) if not ok}
+        if failed:
+            raise ReadManyError(failed, results)
+
+    if as_dict:
+        return dict(zip(files, results))
+    return results
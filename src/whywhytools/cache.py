@@ -0,0 +1,196 @@
+"""This module provides a decorator caching function results on disk through the managers."""
+
+import functools
+import hashlib
+import os
+import pickle
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any
+
+from .type_checker import check_type
+from .utils import file_lock, parse_size
+
+
+# format: (file extension, loader name, saver name, manager module)
+FORMATS = {
+    "pickle": (".pkl", "load_pickle", "save_pickle", "pickle_manager"),
+    "json": (".json", "read_json", "write_json", "json_manager"),
+    "pt": (".pt", "load_pt", "save_pt", "torch_manager"),
+    "safetensors": (".safetensors", "load_safetensors", "save_safetensors", "safetensors_manager"),
+}
+_EXTENSIONS = tuple(ext for ext, *_ in FORMATS.values())
+
+
+def _function_identity(func: Callable) -> bytes:
+    """Identify a function by its qualified name and, when available, its source code."""
+    import inspect
+
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = ""
+    return f"{func.__module__}.{func.__qualname__}\n{source}".encode()
+
+
+@contextmanager
+def _key_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a per-key lock file, which is removed on release.
+
+    The holder unlinks the file before unlocking it, so a waiter that then acquires the
+    lock on the unlinked file checks that the path still names it, and otherwise retries
+    on the file now at the path. This keeps lock files from accumulating.
+    """
+    while True:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            lock = file_lock(fd)
+            lock.__enter__()
+        except NotImplementedError:
+            # Without fcntl, concurrent workers may compute the same key more than once
+            os.close(fd)
+            path.unlink(missing_ok=True)
+            yield
+            return
+        try:
+            current = os.stat(path).st_ino
+        except FileNotFoundError:
+            current = None
+        if current == os.fstat(fd).st_ino:
+            break
+        lock.__exit__(None, None, None)
+        os.close(fd)
+    try:
+        yield
+    finally:
+        try:
+            path.unlink(missing_ok=True)
+        finally:
+            lock.__exit__(None, None, None)
+            os.close(fd)
+
+
+def _evict(cache_dir: Path, max_size: int) -> None:
+    """Delete the least recently used entries until the cache holds at most max_size bytes."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(_EXTENSIONS) and not entry.name.startswith("."):
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        # Lock files are not touched: they only exist while a fill holds them
+        with suppress(FileNotFoundError):
+            os.remove(path)
+        total -= size
+
+
+def disk_cache(
+    cache_dir: str | Path,
+    format: str = "pickle",
+    max_size: int | str | None = None,
+) -> Callable[[Callable], Callable]:
+    """
+    Cache the results of a function on disk, keyed by a hash of the function and its arguments.
+
+    The key is the SHA-256 of the function's qualified name and source code and of its
+    arguments, bound to the signature so that `f(1, b=2)` and `f(1, 2)` share an entry,
+    then pickled. Arguments must therefore be picklable, and should pickle the same way in
+    every process (sets of strings, for instance, do not). Results are written atomically
+    through the manager of the format, and a per-key lock file, removed once the entry is
+    filled, makes concurrent callers of the same key wait for the first one to fill it
+    instead of computing it again.
+
+    Args:
+        cache_dir (Union[str, Path]): The directory holding the cache entries.
+        format (str, optional): How results are stored: "pickle", "json", "pt" or
+            "safetensors". The json and safetensors formats take a dict (of tensors, for
+            safetensors), as write_json and save_safetensors do. With "json", every call,
+            including the one filling the entry, returns the result as read back from
+            JSON, e.g. with lists instead of tuples and string keys. Defaults to "pickle".
+        max_size (Union[int, str, None], optional): The maximum total size of the entries,
+            in bytes or as a string such as "10GB". After each new entry, the least
+            recently used entries are deleted to fit. Defaults to None (unbounded).
+
+    Returns:
+        Callable[[Callable], Callable]: The decorator. The wrapped function has a
+        `cache_path(*args, **kwargs)` method returning the entry path of a call.
+
+    Raises:
+        ValueError: If format is not supported.
+
+    Example:
+        @disk_cache("cache/tokenize", max_size="20GB")
+        def tokenize(path: str, vocab: str = "base") -> list:
+            ...
+    """
+    check_type(cache_dir, (str, Path))
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}, got {format}")
+    if max_size is not None:
+        max_size = parse_size(max_size)
+    cache_dir = Path(cache_dir)
+    ext, loader_name, saver_name, module_name = FORMATS[format]
+
+    def decorator(func: Callable) -> Callable:
+        import importlib
+        import inspect
+
+        module = importlib.import_module(f".{module_name}", __package__)
+        load, save = getattr(module, loader_name), getattr(module, saver_name)
+        identity = hashlib.sha256(_function_identity(func)).digest()
+        signature = inspect.signature(func)
+
+        def cache_path(*args: Any, **kwargs: Any) -> Path:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            digest = hashlib.sha256(identity)
+            digest.update(pickle.dumps(tuple(bound.arguments.items()), protocol=4))
+            return cache_dir / f"{digest.hexdigest()}{ext}"
+
+        def load_entry(path: Path) -> tuple[bool, Any]:
+            if not path.exists():
+                return False, None
+            try:
+                result = load(path)
+                # Touch the entry so eviction sees it as recently used
+                os.utime(path)
+            except FileNotFoundError:
+                # Evicted by another worker in the meantime
+                return False, None
+            return True, result
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            path = cache_path(*args, **kwargs)
+            hit, result = load_entry(path)
+            if hit:
+                return result
+
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with _key_lock(path.with_suffix(".lock")):
+                # Another worker may have filled the entry while this one waited for the lock
+                hit, result = load_entry(path)
+                if hit:
+                    return result
+                result = func(*args, **kwargs)
+                save(result, path, force=True, silent=True)
+                if format == "json":
+                    # Return what later hits return, e.g. lists instead of tuples
+                    result = load(path)
+
+            if max_size is not None:
+                _evict(cache_dir, max_size)
+            return result
+
+        wrapper.cache_path = cache_path
+        return wrapper
+
+    return decorator
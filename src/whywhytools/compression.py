@@ -0,0 +1,143 @@
+"""This module provides transparent, streaming compression for the file managers."""
+
+import io
+from pathlib import Path
+from typing import IO
+
+from .type_checker import check_type
+
+
+# Maps file extensions to codec names; compound names such as `.jsonl.gz` match on the last suffix.
+EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+    ".lz4": "lz4",
+}
+COMPRESSIONS = ("gzip", "bz2", "xz", "zstd", "lz4")
+
+
+def infer_compression(file: str | Path) -> str | None:
+    """
+    Infer the compression codec of a file from its extension.
+
+    Args:
+        file (Union[str, Path]): The path to the file.
+
+    Returns:
+        str | None: The codec name, or None if the extension is not a known compressed format.
+    """
+    return EXTENSIONS.get(Path(file).suffix.lower())
+
+
+def resolve_compression(file: str | Path, compression: str | None) -> str | None:
+    """
+    Resolve the `compression` argument of the managers to a codec name.
+
+    Args:
+        file (Union[str, Path]): The path to the file.
+        compression (str | None): A codec name, "infer" to detect it from the extension,
+            or None for no compression.
+
+    Returns:
+        str | None: The codec name, or None for an uncompressed file.
+
+    Raises:
+        ValueError: If the compression is not supported.
+    """
+    if compression == "infer":
+        return infer_compression(file)
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}, expected one of {', '.join(COMPRESSIONS)}")
+    return compression
+
+
+def _open_zstd(file: str | Path, mode: str) -> IO[bytes]:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd compression requires the zstandard package: pip install zstandard") from e
+
+    # Handed to the zstandard stream with closefd=True, which closes it with the stream
+    fh = open(file, mode)  # noqa: SIM115
+    if mode == "rb":
+        # Appended data is stored as concatenated frames
+        reader = zstandard.ZstdDecompressor().stream_reader(fh, read_across_frames=True, closefd=True)
+        return io.BufferedReader(reader)
+    return zstandard.ZstdCompressor().stream_writer(fh, closefd=True)
+
+
+def _open_lz4(file: str | Path, mode: str) -> IO[bytes]:
+    try:
+        import lz4.frame
+    except ImportError as e:
+        raise ImportError("lz4 compression requires the lz4 package: pip install lz4") from e
+
+    return lz4.frame.open(file, mode)
+
+
+def _open_binary(file: str | Path, mode: str, compression: str | None, buffering: int) -> IO[bytes]:
+    if compression is None:
+        return open(file, mode, buffering=buffering)
+    if compression == "gzip":
+        import gzip
+
+        return gzip.open(file, mode, compresslevel=6)
+    if compression == "bz2":
+        import bz2
+
+        return bz2.open(file, mode)
+    if compression == "xz":
+        import lzma
+
+        return lzma.open(file, mode)
+    if compression == "zstd":
+        return _open_zstd(file, mode)
+    return _open_lz4(file, mode)
+
+
+def open_file(
+    file: str | Path,
+    mode: str = "rb",
+    compression: str | None = "infer",
+    encoding: str = "utf-8",
+    newline: str | None = None,
+    buffering: int = -1,
+) -> IO:
+    """
+    Open a file, compressing or decompressing it transparently as a stream.
+
+    Supported codecs are gzip, bz2 and xz from the standard library, and zstd and lz4 when
+    the zstandard and lz4 packages are installed. Append mode adds a new frame (or member)
+    to the file, and readers decode all concatenated frames.
+
+    Args:
+        file (Union[str, Path]): The path to the file.
+        mode (str, optional): One of "rb", "wb", "ab", "r", "w" or "a". Defaults to "rb".
+        compression (str | None, optional): A codec name, "infer" to detect it from the
+            extension (e.g. `.jsonl.gz`, `.pkl.zst`), or None for no compression. Defaults to "infer".
+        encoding (str, optional): The text encoding used in text modes. Defaults to "utf-8".
+        newline (str | None, optional): The newline argument used in text modes. Defaults to None.
+        buffering (int, optional): The buffering argument for uncompressed files. Defaults to -1.
+
+    Returns:
+        IO: A binary or text file object.
+
+    Raises:
+        ValueError: If the mode or compression is not supported.
+        ImportError: If the package required by the codec is not installed.
+    """
+    check_type(file, (str, Path))
+    if mode not in ("rb", "wb", "ab", "r", "w", "a"):
+        raise ValueError(f"Unsupported mode: {mode}")
+    codec = resolve_compression(file, compression)
+
+    if mode.endswith("b"):
+        return _open_binary(file, mode, codec, buffering)
+    if codec is None:
+        return open(file, mode, encoding=encoding, newline=newline, buffering=buffering)
+    return io.TextIOWrapper(_open_binary(file, mode + "b", codec, buffering), encoding=encoding, newline=newline)
@@ -0,0 +1,323 @@
+"""This module provides readers that follow files as they grow, like `tail -F`."""
+
+import os
+import select
+import time
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+from .json_backend import get_json_backend
+from .type_checker import check_type
+
+
+READ_SIZE = 1 << 16  # 64 KiB
+POLL_INTERVAL = 0.5  # seconds
+CHECKPOINT_INTERVAL = 1.0  # seconds
+FINGERPRINT_SIZE = 256  # bytes at the start of the file that identify it in a checkpoint
+
+# inotify(7) flags
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_EVENTS = 0x2 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200  # modify, close_write, moved_from/to, create, delete
+
+
+class _PollWatcher:
+    """Wait for changes by sleeping; used where inotify is unavailable."""
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(timeout)
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWatcher:
+    """Wait for changes in a directory through inotify, so new data is seen without delay."""
+
+    def __init__(self, directory: str):
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # Watching the directory, not the file, also reports the creation of a rotated file
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_EVENTS) < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def wait(self, timeout: float) -> None:
+        # The timeout still applies, so that events missed (e.g. on network filesystems)
+        # only delay the reader by one poll interval
+        if select.select([self._fd], [], [], timeout)[0]:
+            try:
+                while os.read(self._fd, 1 << 16):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _make_watcher(file: str, use_inotify: bool) -> _PollWatcher | _InotifyWatcher:
+    if use_inotify:
+        try:
+            return _InotifyWatcher(os.path.dirname(os.path.abspath(file)))
+        except (OSError, AttributeError):
+            # Not Linux, or out of inotify instances
+            pass
+    return _PollWatcher()
+
+
+def _fingerprint(f: BinaryIO, offset: int) -> int:
+    """Checksum the start of the file, since inodes are reused once a file is deleted."""
+    position = f.tell()
+    f.seek(0)
+    head = f.read(min(offset, FINGERPRINT_SIZE))
+    f.seek(position)
+    return zlib.crc32(head)
+
+
+def _resume_offset(checkpoint: str | Path, f: BinaryIO) -> int | None:
+    from .json_manager import read_json
+
+    try:
+        saved = read_json(checkpoint)
+        offset, inode, fingerprint = saved["offset"], saved["inode"], saved["fingerprint"]
+        check_type(offset, int)
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError):
+        # An empty or corrupt checkpoint (e.g. written by another tool) is ignored like a missing one
+        return None
+    st = os.fstat(f.fileno())
+    if inode == st.st_ino and 0 <= offset <= st.st_size and fingerprint == _fingerprint(f, offset):
+        return offset
+    # The file was replaced while the reader was stopped; read the new one from its beginning
+    return 0
+
+
+def _write_checkpoint(checkpoint: str | Path, f: BinaryIO, offset: int) -> None:
+    from .json_manager import write_json
+
+    state = {"inode": os.fstat(f.fileno()).st_ino, "offset": offset, "fingerprint": _fingerprint(f, offset)}
+    write_json(state, checkpoint, force=True, silent=True)
+
+
+def _follow_lines(
+    file: str | Path,
+    start: str | int,
+    poll_interval: float,
+    timeout: float | None,
+    checkpoint: str | Path | None,
+    inotify: bool,
+) -> Iterator[bytes]:
+    watcher = _make_watcher(os.fspath(file), inotify)
+    f = None
+    idle_since = time.monotonic()
+    try:
+        # Wait for the file to exist
+        while f is None:
+            try:
+                # Kept open across yields and rotations, and closed in the outer finally
+                f = open(file, "rb")  # noqa: SIM115
+            except FileNotFoundError:
+                if timeout is not None and time.monotonic() - idle_since >= timeout:
+                    return
+                watcher.wait(poll_interval)
+        inode = os.fstat(f.fileno()).st_ino
+
+        resumed = _resume_offset(checkpoint, f) if checkpoint is not None else None
+        if resumed is not None:
+            offset = resumed
+        elif start == "end":
+            offset = os.fstat(f.fileno()).st_size
+        elif start == "beginning":
+            offset = 0
+        else:
+            size = os.fstat(f.fileno()).st_size
+            if start > size:
+                # Reading from there would be taken for a truncation and restart from 0
+                raise ValueError(f"start is past the end of {file} ({start} > {size} bytes)")
+            offset = start
+        f.seek(offset)
+
+        pending = b""  # a trailing line the writer has not finished yet
+        consumed = offset  # end of the last line handed to and processed by the caller
+        saved_offset, saved_at = None, time.monotonic()
+
+        def save(force: bool = False) -> None:
+            nonlocal saved_offset, saved_at
+            if checkpoint is None or consumed == saved_offset:
+                return
+            now = time.monotonic()
+            if force or now - saved_at >= CHECKPOINT_INTERVAL:
+                _write_checkpoint(checkpoint, f, consumed)
+                saved_offset, saved_at = consumed, now
+
+        try:
+            while True:
+                chunk = f.read(READ_SIZE)
+                if chunk:
+                    idle_since = time.monotonic()
+                    lines = (pending + chunk).split(b"\n")
+                    pending = lines.pop()
+                    for line in lines:
+                        offset += len(line) + 1
+                        yield line
+                        # Only a request for the next line shows this one was processed;
+                        # a generator closed by an error in the caller leaves it unconsumed
+                        consumed = offset
+                        save()
+                    continue
+
+                save(force=True)
+                try:
+                    st = os.stat(file)
+                except FileNotFoundError:
+                    st = None
+                if st is not None and st.st_ino != inode:
+                    # Rotated: the old handle is drained above, so switch to the new file
+                    if pending:
+                        offset += len(pending)
+                        yield pending
+                        consumed = offset
+                        pending = b""
+                    f.close()
+                    f = open(file, "rb")  # noqa: SIM115 - closed in the outer finally
+                    inode = os.fstat(f.fileno()).st_ino
+                    offset = consumed = 0
+                    continue
+                if st is not None and st.st_size < offset + len(pending):
+                    # Truncated in place
+                    f.seek(0)
+                    pending = b""
+                    offset = consumed = 0
+                    continue
+
+                if timeout is not None and time.monotonic() - idle_since >= timeout:
+                    return
+                watcher.wait(poll_interval)
+        finally:
+            if checkpoint is not None and consumed != saved_offset:
+                _write_checkpoint(checkpoint, f, consumed)
+    finally:
+        if f is not None:
+            f.close()
+        watcher.close()
+
+
+def _check_follow_args(
+    file: str | Path,
+    start: str | int,
+    poll_interval: float,
+    timeout: float | None,
+    checkpoint: str | Path | None,
+) -> None:
+    check_type(file, (str, Path))
+    check_type(start, (str, int))
+    if isinstance(start, str) and start not in ("end", "beginning"):
+        raise ValueError(f"start must be 'end', 'beginning' or an offset, got {start}")
+    if isinstance(start, int) and start < 0:
+        raise ValueError(f"start must be non-negative, got {start}")
+    check_type(poll_interval, (int, float))
+    if timeout is not None:
+        check_type(timeout, (int, float))
+    if checkpoint is not None:
+        check_type(checkpoint, (str, Path))
+
+
+def follow_file(
+    file: str | Path,
+    start: str | int = "end",
+    poll_interval: float = POLL_INTERVAL,
+    timeout: float | None = None,
+    checkpoint: str | Path | None = None,
+    inotify: bool = True,
+) -> Iterator[str]:
+    """
+    Yield the lines of a text file as they are appended, without the trailing newline.
+
+    A line is only yielded once its newline has been written, so a line that a producer
+    is still writing is held back. The reader waits for changes with inotify on Linux and
+    by polling elsewhere. When the file is replaced (rotated), the rest of the old file is
+    read before switching to the new one; when it is truncated, reading restarts from its
+    beginning (a truncation is only noticed if the file is seen shorter than the offset
+    read so far). Lines are split on "\\n" and "\\r\\n". Compressed files are not supported.
+
+    Args:
+        file (Union[str, Path]): The path to the text file; if it does not exist yet, the
+            reader waits for it.
+        start (Union[str, int], optional): Where to start reading: "end" to read only the
+            lines appended from now on, "beginning", or a byte offset, which must not be past
+            the end of the file when it is opened. Defaults to "end".
+        poll_interval (float, optional): Maximum time in seconds between two checks of the
+            file. Defaults to 0.5.
+        timeout (float | None, optional): Stop once no new data has arrived for this many
+            seconds. Defaults to None (follow forever).
+        checkpoint (Union[str, Path, None], optional): A JSON file recording the offset of the
+            lines already processed, written atomically at most once per second, whenever
+            the reader waits for data, and when the iteration stops. If it exists, reading
+            resumes from it and start is ignored, unless the file was replaced meanwhile
+            (detected from its inode and a checksum of its first bytes), in which case it is
+            read from its beginning. A line is counted as processed once the next one is
+            requested, so the last line received before the iteration stops, e.g. because
+            handling it raised, is read again on restart. An empty or corrupt checkpoint is
+            ignored. Defaults to None.
+        inotify (bool, optional): If False, always poll. Defaults to True.
+
+    Returns:
+        Iterator[str]: An iterator over the lines of the file.
+
+    Raises:
+        TypeError: If an argument is not the expected type.
+        ValueError: If start is invalid. An offset past the end of the file is raised from
+            the first iteration, once the file is opened.
+
+    Example:
+        for line in follow_file("train.log", checkpoint="train.log.offset"):
+            handle(line)
+    """
+    _check_follow_args(file, start, poll_interval, timeout, checkpoint)
+    lines = _follow_lines(file, start, poll_interval, timeout, checkpoint, inotify)
+    return (line.decode("utf-8").removesuffix("\r") for line in lines)
+
+
+def follow_jsonl(
+    file: str | Path,
+    start: str | int = "end",
+    poll_interval: float = POLL_INTERVAL,
+    timeout: float | None = None,
+    checkpoint: str | Path | None = None,
+    inotify: bool = True,
+    backend: str | None = None,
+) -> Iterator[dict]:
+    """
+    Yield the records of a JSONL file as they are appended, e.g. by append_jsonl.
+
+    Takes the same arguments as follow_file, plus backend; blank lines are ignored.
+
+    Args:
+        file (Union[str, Path]): The path to the JSONL file.
+        start (Union[str, int], optional): "end", "beginning" or a byte offset not past the
+            end of the file. Defaults to "end".
+        poll_interval (float, optional): Maximum time in seconds between two checks of the
+            file. Defaults to 0.5.
+        timeout (float | None, optional): Stop once no new data has arrived for this many
+            seconds. Defaults to None (follow forever).
+        checkpoint (Union[str, Path, None], optional): A JSON file recording the offset of the
+            records already processed. Defaults to None.
+        inotify (bool, optional): If False, always poll. Defaults to True.
+        backend (str | None, optional): The JSON backend to decode with. Defaults to None
+            (the globally selected backend).
+
+    Returns:
+        Iterator[dict]: An iterator over the JSON objects appended to the file.
+    """
+    _check_follow_args(file, start, poll_interval, timeout, checkpoint)
+    loads = get_json_backend(backend).loads
+    lines = _follow_lines(file, start, poll_interval, timeout, checkpoint, inotify)
+    return (loads(line) for line in lines if line and not line.isspace())
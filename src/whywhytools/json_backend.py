@@ -0,0 +1,167 @@
+"""This module provides a registry of JSON backends used by the JSON and JSONL managers.
+
+A backend is a pair of ``loads``/``dumps`` functions. The fastest installed backend is
+selected automatically (orjson, then msgspec, then ujson, then the standard library),
+and can be overridden globally with ``set_json_backend`` or per call with ``backend=``.
+
+Files written through any backend are byte-identical to what the standard library
+writes with ``ensure_ascii=False``. orjson, msgspec and ujson cannot reproduce the
+``", "``/``": "`` separators and 4-space indentation of the standard library, so the
+third-party backends only accelerate decoding and share the standard library encoder.
+"""
+
+import functools
+import json
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+
+class JsonBackend(NamedTuple):
+    """
+    A named pair of JSON decode and encode functions.
+
+    Attributes:
+        name (str): The registered name of the backend.
+        loads (Callable[[str | bytes], Any]): Decode a JSON document from str or bytes.
+        dumps (Callable[[Any, int | None], str]): Encode an object with the given indent.
+            The result must match ``json.dumps(obj, ensure_ascii=False, indent=indent)``.
+    """
+
+    name: str
+    loads: Callable[[str | bytes], Any]
+    dumps: Callable[[Any, int | None], str]
+
+
+_ENCODERS: dict[int | None, json.JSONEncoder] = {}
+
+
+def _stdlib_dumps(obj: Any, indent: int | None = None) -> str:
+    encoder = _ENCODERS.get(indent)
+    if encoder is None:
+        encoder = _ENCODERS[indent] = json.JSONEncoder(ensure_ascii=False, indent=indent)
+    return encoder.encode(obj)
+
+
+def _fallback_loads(loads: Callable[[str | bytes], Any], error: type[Exception], s: str | bytes) -> Any:
+    try:
+        return loads(s)
+    except error:
+        # Stricter decoders reject NaN, integers beyond 64 bits or lone surrogates,
+        # all of which the standard library accepts.
+        return json.loads(s)
+
+
+def _with_fallback(loads: Callable[[str | bytes], Any], error: type[Exception]) -> Callable[[str | bytes], Any]:
+    """
+    Wrap a third-party decoder so that documents it rejects are retried with the stdlib.
+
+    The wrapper is a partial of a module-level function rather than a closure, so it can be
+    pickled and sent to worker processes.
+    """
+    return functools.partial(_fallback_loads, loads, error)
+
+
+def _load_json() -> JsonBackend:
+    return JsonBackend("json", json.loads, _stdlib_dumps)
+
+
+def _load_orjson() -> JsonBackend:
+    import orjson
+
+    return JsonBackend("orjson", _with_fallback(orjson.loads, orjson.JSONDecodeError), _stdlib_dumps)
+
+
+def _load_msgspec() -> JsonBackend:
+    import msgspec
+
+    return JsonBackend("msgspec", _with_fallback(msgspec.json.decode, msgspec.DecodeError), _stdlib_dumps)
+
+
+def _load_ujson() -> JsonBackend:
+    import ujson
+
+    return JsonBackend("ujson", _with_fallback(ujson.loads, ValueError), _stdlib_dumps)
+
+
+# Factories are tried in this order when no backend is selected explicitly.
+_FACTORIES: dict[str, Callable[[], JsonBackend]] = {
+    "orjson": _load_orjson,
+    "msgspec": _load_msgspec,
+    "ujson": _load_ujson,
+    "json": _load_json,
+}
+_BACKENDS: dict[str, JsonBackend] = {}
+_selected: str | None = None
+_auto: JsonBackend | None = None
+
+
+def register_json_backend(
+    name: str,
+    loads: Callable[[str | bytes], Any],
+    dumps: Callable[[Any, int | None], str] | None = None,
+) -> None:
+    """
+    Register a custom JSON backend.
+
+    Args:
+        name (str): The name used to select the backend.
+        loads (Callable[[str | bytes], Any]): Decode a JSON document from str or bytes.
+        dumps (Callable[[Any, int | None], str] | None, optional): Encode an object with the given
+            indent. It must produce the same text as the standard library with ``ensure_ascii=False``.
+            Defaults to None (use the standard library encoder).
+    """
+    _BACKENDS[name] = JsonBackend(name, loads, dumps or _stdlib_dumps)
+
+
+def get_json_backend(name: str | None = None) -> JsonBackend:
+    """
+    Return a JSON backend by name.
+
+    Args:
+        name (str | None, optional): The backend name. If None, return the globally selected
+            backend, or the fastest installed one if none was selected. Defaults to None.
+
+    Returns:
+        JsonBackend: The requested backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the backend's package is not installed.
+    """
+    global _auto
+    if name is None:
+        name = _selected
+    if name is None:
+        if _auto is None:
+            for candidate in _FACTORIES:
+                try:
+                    _auto = get_json_backend(candidate)
+                    break
+                except ImportError:
+                    continue
+        return _auto
+
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        factory = _FACTORIES.get(name)
+        if factory is None:
+            raise ValueError(f"Unknown JSON backend: {name}")
+        backend = _BACKENDS[name] = factory()
+    return backend
+
+
+def set_json_backend(name: str | None) -> None:
+    """
+    Select the JSON backend used when no ``backend=`` argument is given.
+
+    Args:
+        name (str | None): The backend name, or None to pick the fastest installed backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the backend's package is not installed.
+    """
+    global _selected
+    if name is not None:
+        get_json_backend(name)
+    _selected = name
@@ -1,28 +1,50 @@
 """This module provides utility functions for managing JSON files."""
 
-import json
 import os
 import sys
 from pathlib import Path
 
+from .compression import open_file, resolve_compression
+from .json_backend import get_json_backend
+from .read_cache import cached_read, check_cache_mode
 from .type_checker import check_type
-from .utils import create_parent_dirs
+from .utils import atomic_path, create_parent_dirs
 
 
-def read_json(file: str | Path) -> dict:
+def read_json(
+    file: str | Path,
+    backend: str | None = None,
+    compression: str | None = "infer",
+    cache: bool | str = False,
+) -> dict:
     """
     Read a JSON file and return its content.
 
     Args:
         file (Union[str, Path]): The path to the JSON file.
+        backend (str | None, optional): The JSON backend to decode with. Defaults to None
+            (the globally selected backend).
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        cache (Union[bool, str], optional): If True, keep the parsed object in an in-process
+            cache and return a copy of it while the file's modification time, size and inode
+            are unchanged. If "frozen", return the same read-only object on every hit instead,
+            with dictionaries as MappingProxyType and lists as tuples, which costs nothing.
+            See cache_info(). Defaults to False.
 
     Returns:
         dict: The JSON object read from the file.
     """
     check_type(file, (str, Path))
+    check_cache_mode(cache)
+    if cache:
+        compression = resolve_compression(file, compression)
+        load = lambda: read_json(file, backend, compression)  # noqa: E731
+        return cached_read(file, "read_json", (compression,), load, frozen=cache == "frozen")
+    loads = get_json_backend(backend).loads
 
-    with open(file, mode="r", encoding="utf-8") as reader:
-        df = json.load(reader)
+    with open_file(file, mode="rb", compression=compression) as reader:
+        df = loads(reader.read())
     return df
 
 
@@ -32,6 +54,10 @@ def write_json(
     force: bool = False,
     silent: bool = False,
     raise_on_exists: bool = False,
+    backend: str | None = None,
+    compression: str | None = "infer",
+    atomic: bool = True,
+    fsync: str = "none",
 ) -> None:
     """
     Write a dictionary to a JSON file.
@@ -43,6 +69,14 @@ def write_json(
         silent (bool, optional): If True, suppress print messages. Defaults to False.
         raise_on_exists (bool, optional): If True, raise FileExistsError with full
             traceback instead of exiting cleanly. Defaults to False.
+        backend (str | None, optional): The JSON backend to encode with. Defaults to None
+            (the globally selected backend).
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        atomic (bool, optional): If True, write to a temporary file in the same directory and
+            rename it into place, so the file is never left truncated. Defaults to True.
+        fsync (str, optional): Durability policy: "none", "file" (fsync the file before the
+            rename) or "file+dir" (also fsync the directory). Defaults to "none".
 
     Raises:
         TypeError: If obj or file is not the expected type.
@@ -57,10 +91,15 @@ def write_json(
     create_parent_dirs(file)
 
     check_type(obj, dict)
+    dumps = get_json_backend(backend).dumps
+    compression = resolve_compression(file, compression)
 
-    with open(file, mode="w", encoding="utf-8", newline="\n") as fp:
-        json.dump(obj, fp, ensure_ascii=False, indent=4)
-        print(file=fp)
+    with (
+        atomic_path(file, atomic=atomic, fsync=fsync) as path,
+        open_file(path, mode="w", compression=compression, newline="\n") as fp,
+    ):
+        fp.write(dumps(obj, 4))
+        fp.write("\n")
 
     if not silent:
         print(f"[INFO] save to {file}")
@@ -0,0 +1,225 @@
+"""This module provides line-offset index sidecars for random access into JSONL files."""
+
+import mmap
+import os
+import random
+import sys
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+from .compression import resolve_compression
+from .json_backend import get_json_backend
+from .type_checker import check_type
+from .utils import atomic_path
+
+
+# The index stores offsets in native byte order; the last magic byte records it so an index
+# copied to a machine of the other endianness is treated as stale and rebuilt.
+_MAGIC = b"WWJIDX1" + (b"L" if sys.byteorder == "little" else b"B")
+_HEADER = len(_MAGIC) + 16  # magic, data size, data mtime_ns
+
+
+def index_path(file: str | Path) -> Path:
+    """Return the path of the index sidecar of a JSONL file."""
+    return Path(f"{file}.idx")
+
+
+def _scan_offsets(reader: BinaryIO, start: int) -> array:
+    """Return the start offsets of the non-blank lines from `start` to the end of the file."""
+    offsets = array("Q")
+    reader.seek(start)
+    pos = start
+    for line in reader:
+        if not line.isspace():
+            offsets.append(pos)
+        pos += len(line)
+    return offsets
+
+
+def _header(st: os.stat_result) -> bytes:
+    return _MAGIC + array("Q", [st.st_size, st.st_mtime_ns]).tobytes()
+
+
+def _read_header(idx: BinaryIO) -> tuple[int, int] | None:
+    header = idx.read(_HEADER)
+    if len(header) != _HEADER or not header.startswith(_MAGIC):
+        return None
+    size, mtime_ns = array("Q", header[len(_MAGIC) :])
+    return size, mtime_ns
+
+
+def is_jsonl_index_valid(file: str | Path) -> bool:
+    """
+    Check whether the index sidecar of a JSONL file exists and matches the file.
+
+    The index is stale as soon as the size or modification time of the data file changes.
+
+    Args:
+        file (Union[str, Path]): The path to the JSONL file.
+
+    Returns:
+        bool: True if the index exists and is up to date.
+    """
+    try:
+        st = os.stat(file)
+        with open(index_path(file), mode="rb") as idx:
+            header = _read_header(idx)
+    except FileNotFoundError:
+        return False
+    return header == (st.st_size, st.st_mtime_ns)
+
+
+def build_jsonl_index(file: str | Path) -> Path:
+    """
+    Build the line-offset index sidecar of a JSONL file.
+
+    The sidecar `<file>.idx` holds a small header followed by one uint64 start offset per
+    non-blank line, so any record can be read with a single seek.
+
+    Args:
+        file (Union[str, Path]): The path to the JSONL file.
+
+    Returns:
+        Path: The path of the index sidecar.
+
+    Raises:
+        TypeError: If file is not the expected type.
+        ValueError: If the file is compressed.
+    """
+    check_type(file, (str, Path))
+    if resolve_compression(file, "infer") is not None:
+        raise ValueError(f"Cannot index compressed file: {file}")
+
+    with open(file, mode="rb", buffering=1 << 20) as reader:
+        st = os.fstat(reader.fileno())
+        offsets = _scan_offsets(reader, 0)
+
+    path = index_path(file)
+    with atomic_path(path) as tmp_path, open(tmp_path, mode="wb") as idx:
+        idx.write(_header(st))
+        offsets.tofile(idx)
+    return path
+
+
+def extend_jsonl_index(file: str | Path) -> None:
+    """
+    Extend the index sidecar of a JSONL file with the records appended since it was built.
+
+    Only the bytes added after the indexed size are scanned. If the index is missing or the
+    file was otherwise modified, the index is left untouched (it will be rebuilt on next use).
+
+    Args:
+        file (Union[str, Path]): The path to the JSONL file.
+    """
+    path = index_path(file)
+    try:
+        # Entered by the with statement below; only a missing index is an expected error
+        idx = open(path, mode="r+b")  # noqa: SIM115
+    except FileNotFoundError:
+        return
+    with idx, open(file, mode="rb", buffering=1 << 20) as reader:
+        header = _read_header(idx)
+        st = os.fstat(reader.fileno())
+        if header is None or header[0] > st.st_size:
+            return
+        offsets = _scan_offsets(reader, header[0])
+        # Write the offsets before the header so an interrupted update leaves a stale index
+        idx.seek(0, os.SEEK_END)
+        offsets.tofile(idx)
+        idx.seek(0)
+        idx.write(_header(st))
+
+
+class JsonlFile:
+    """
+    Random access to the records of a JSONL file through its line-offset index.
+
+    The index sidecar is built on first use and rebuilt whenever the data file's size or
+    modification time no longer matches it. Records are decoded on access only.
+
+    Example:
+        with JsonlFile("data.jsonl") as data:
+            print(len(data), data[0], data[-1], data[10:20], data.sample(5))
+    """
+
+    def __init__(self, file: str | Path, backend: str | None = None):
+        """
+        Open a JSONL file for random access.
+
+        Args:
+            file (Union[str, Path]): The path to the JSONL file.
+            backend (str | None, optional): The JSON backend to decode with. Defaults to None
+                (the globally selected backend).
+
+        Raises:
+            TypeError: If file is not the expected type.
+            ValueError: If the file is compressed.
+        """
+        check_type(file, (str, Path))
+        if not is_jsonl_index_valid(file):
+            build_jsonl_index(file)
+
+        self.file = file
+        self._loads = get_json_backend(backend).loads
+        # Owned by the instance for random access, and closed by close() or context exit
+        self._reader = open(file, mode="rb")  # noqa: SIM115
+        with open(index_path(file), mode="rb") as idx:
+            self._size = _read_header(idx)[0]
+            self._mmap = mmap.mmap(idx.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = memoryview(self._mmap)[_HEADER:].cast("Q")
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _read(self, i: int) -> dict:
+        start = self._offsets[i]
+        end = self._offsets[i + 1] if i + 1 < len(self._offsets) else self._size
+        self._reader.seek(start)
+        return self._loads(self._reader.read(end - start))
+
+    def __getitem__(self, index: int | slice) -> dict | list[dict]:
+        if isinstance(index, slice):
+            return [self._read(i) for i in range(*index.indices(len(self)))]
+        check_type(index, int)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("JsonlFile index out of range")
+        return self._read(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(len(self)):
+            yield self._read(i)
+
+    def sample(self, k: int, seed: int | None = None) -> list[dict]:
+        """
+        Return k distinct records chosen at random.
+
+        Args:
+            k (int): The number of records to sample.
+            seed (int | None, optional): The random seed. Defaults to None.
+
+        Returns:
+            list[dict]: The sampled records.
+
+        Raises:
+            ValueError: If k is negative or larger than the number of records.
+        """
+        check_type(k, int)
+        return [self._read(i) for i in random.Random(seed).sample(range(len(self)), k)]
+
+    def close(self) -> None:
+        """Close the data file and release the index mapping."""
+        if self._reader.closed:
+            return
+        self._offsets.release()
+        self._mmap.close()
+        self._reader.close()
+
+    def __enter__(self) -> "JsonlFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
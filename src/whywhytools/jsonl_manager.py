@@ -1,55 +1,529 @@
 """This module provides utility functions for managing JSONL (JSON Lines) files."""
 
+import functools
 import json
 import os
 import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import suppress
+from itertools import islice
 from pathlib import Path
+from typing import Any, BinaryIO
 
-from .type_checker import check_list_type, check_type
-from .utils import create_parent_dirs
+from .compression import open_file, resolve_compression
+from .json_backend import get_json_backend
+from .jsonl_index import extend_jsonl_index, is_jsonl_index_valid
+from .read_cache import cached_read, check_cache_mode
+from .schema import is_msgspec_struct, record_decoder
+from .type_checker import VALIDATE_MODES, check_list_type, check_type
+from .utils import atomic_path, create_parent_dirs, iter_mmap_lines
 
 
-def read_jsonl(file: str | Path) -> list[dict]:
+READ_BUFFER_SIZE = 1 << 20  # 1 MiB
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+
+def _check_range(skip: int, limit: int | None) -> None:
+    """Validate the skip/limit arguments shared by the JSONL readers."""
+    check_type(skip, int)
+    if skip < 0:
+        raise ValueError(f"skip must be non-negative, got {skip}")
+    if limit is not None:
+        check_type(limit, int)
+        if limit < 0:
+            raise ValueError(f"limit must be non-negative, got {limit}")
+
+
+_MISSING = object()
+
+
+def _equals(value: Any) -> Callable[[Any], bool]:
+    """Build a test of equality with a `where` value, following JSON rather than Python types."""
+    if value is None or isinstance(value, bool):
+        # true, false and null only equal themselves, not 1, 0 or 0.0
+        return lambda field: field is value
+    if isinstance(value, (int, float)):
+        return lambda field: field == value and not isinstance(field, bool)
+    return lambda field: field == value
+
+
+def _match_where(where: dict) -> Callable[[dict], bool]:
+    """Build the predicate of a `where` dict: every field equals its value."""
+    conditions = [(key, _equals(value)) for key, value in where.items()]
+    if len(conditions) == 1:
+        # Spares the generator of all() in the common single-field case
+        ((key, equals),) = conditions
+        return lambda obj: equals(obj.get(key, _MISSING))
+    return lambda obj: all(equals(obj.get(key, _MISSING)) for key, equals in conditions)
+
+
+def _where_needles(where: dict) -> list[bytes]:
+    """
+    Return byte strings that every raw line matching `where` must contain.
+
+    Only values with a single JSON spelling are used: null, true, false, and strings of
+    printable ASCII without quotes, slashes or backslashes. Any string can still be written
+    with escapes, so lines containing a backslash are never skipped by the pre-filter.
+    """
+    needles = []
+    for value in where.values():
+        if value is None or isinstance(value, bool):
+            needles.append(json.dumps(value).encode("ascii"))
+        elif isinstance(value, str) and value.isascii() and value.isprintable() and not set(value) & set('"\\/'):
+            needles.append(f'"{value}"'.encode("ascii"))
+    return needles
+
+
+def _project(fields: list[str]) -> Callable[[dict], dict]:
+    return lambda obj: {key: obj[key] for key in fields if key in obj}
+
+
+def _iter_raw_lines(
+    file: str | Path,
+    buffer_size: int,
+    compression: str | None,
+    use_mmap: bool,
+) -> Iterator[bytes]:
+    if use_mmap:
+        for line in iter_mmap_lines(file):
+            if line and not line.isspace():
+                yield line
+        return
+    with open_file(file, mode="rb", compression=compression, buffering=buffer_size) as reader:
+        for line in reader:
+            if not line.isspace():
+                yield line
+
+
+def _iter_records(
+    file: str | Path,
+    skip: int,
+    limit: int | None,
+    buffer_size: int,
+    loads: Callable[[bytes], dict],
+    compression: str | None,
+    use_mmap: bool,
+    fields: list[str] | None = None,
+    where: Callable[[dict], bool] | dict | None = None,
+    decode: Callable[[dict], Any] | None = None,
+) -> Iterator[dict]:
+    stop = None if limit is None else skip + limit
+    lines = _iter_raw_lines(file, buffer_size, compression, use_mmap)
+    if where is None:
+        # Skipped records are not decoded
+        records = map(loads, islice(lines, skip, stop))
+    else:
+        if isinstance(where, dict):
+            needles = _where_needles(where)
+            # Drop lines that cannot match before paying for a full decode
+            if len(needles) == 1:
+                needle = needles[0]
+                lines = (line for line in lines if needle in line or b"\\" in line)
+            elif needles:
+                lines = (line for line in lines if all(needle in line for needle in needles) or b"\\" in line)
+            where = _match_where(where)
+        records = islice(filter(where, map(loads, lines)), skip, stop)
+    if fields is not None:
+        records = map(_project(fields), records)
+    if decode is not None:
+        records = map(decode, records)
+    yield from records
+
+
+def iter_jsonl(
+    file: str | Path,
+    skip: int = 0,
+    limit: int | None = None,
+    buffer_size: int = READ_BUFFER_SIZE,
+    backend: str | None = None,
+    compression: str | None = "infer",
+    mmap: bool = False,
+    fields: list[str] | None = None,
+    where: Callable[[dict], bool] | dict | None = None,
+    schema: type | None = None,
+) -> Iterator[Any]:
+    """
+    Lazily read a JSONL file and yield one dictionary at a time.
+
+    The file is read through a large buffer and only the current record is kept in
+    memory, so peak memory does not grow with the file size. Blank lines are ignored.
+
+    Args:
+        file (Union[str, Path]): The path to the JSONL file.
+        skip (int, optional): Number of records to skip before yielding. Skipped records
+            are not decoded. Defaults to 0.
+        limit (int | None, optional): Maximum number of records to yield. Defaults to None (no limit).
+        buffer_size (int, optional): Size in bytes of the read buffer. Defaults to 1 MiB.
+        backend (str | None, optional): The JSON backend to decode with. Defaults to None
+            (the globally selected backend).
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        mmap (bool, optional): If True, memory-map the file and scan it for newlines in place
+            instead of reading it through a buffer. Defaults to False.
+        fields (list[str] | None, optional): Keep only these keys of each record; missing
+            keys are left out. Defaults to None (all keys).
+        where (Union[Callable[[dict], bool], dict, None], optional): Only yield the records
+            for which the function returns True, or whose fields equal every value of the
+            dict as JSON values (True and None do not match 1 or 0). With a dict, lines that
+            cannot match are skipped before decoding when possible. skip and limit count
+            matching records. Defaults to None.
+        schema (type | None, optional): A dataclass, TypedDict or msgspec Struct to decode
+            each record into, validating its field types in the same pass; see
+            schema.record_decoder. TypedDicts become named tuples. where is applied to the
+            records before they are decoded. Defaults to None (plain dictionaries).
+
+    Returns:
+        Iterator[Any]: An iterator over the JSON objects in the file, or over the records
+        of the schema.
+
+    Raises:
+        TypeError: If an argument is not the expected type, or if a record does not match
+            the schema.
+        ValueError: If skip or limit is negative, if mmap is True for a compressed file, if
+            fields is combined with schema, or if a record lacks a required field.
+    """
+    check_type(file, (str, Path))
+    _check_range(skip, limit)
+    check_type(buffer_size, int)
+    loads = get_json_backend(backend).loads
+    compression = resolve_compression(file, compression)
+    if mmap and compression is not None:
+        raise ValueError("mmap cannot be used with compressed files")
+    if fields is not None:
+        check_list_type(fields, str, var_name="fields")
+    if where is not None and not isinstance(where, dict) and not callable(where):
+        raise TypeError(f"where must be a callable or a dict, got {type(where).__name__}")
+
+    decode = None
+    if schema is not None:
+        if fields is not None:
+            raise ValueError("fields cannot be combined with schema, which selects the fields")
+        if is_msgspec_struct(schema):
+            import msgspec
+
+            if where is None:
+                # msgspec decodes and validates straight from the raw line
+                loads = msgspec.json.Decoder(schema).decode
+            else:
+                decode = functools.partial(msgspec.convert, type=schema)
+        else:
+            decode = record_decoder(schema)
+
+    return _iter_records(file, skip, limit, buffer_size, loads, compression, mmap, fields, where, decode)
+
+
+def read_jsonl(
+    file: str | Path,
+    skip: int = 0,
+    limit: int | None = None,
+    backend: str | None = None,
+    compression: str | None = "infer",
+    mmap: bool = False,
+    fields: list[str] | None = None,
+    where: Callable[[dict], bool] | dict | None = None,
+    cache: bool | str = False,
+    schema: type | None = None,
+) -> list[Any]:
     """
     Read a JSONL file and return a list of dictionaries.
 
     Args:
         file (Union[str, Path]): The path to the JSONL file.
+        skip (int, optional): Number of records to skip. Defaults to 0.
+        limit (int | None, optional): Maximum number of records to return. Defaults to None (no limit).
+        backend (str | None, optional): The JSON backend to decode with. Defaults to None
+            (the globally selected backend).
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        mmap (bool, optional): If True, memory-map the file and scan it for newlines in place
+            instead of reading it through a buffer. Defaults to False.
+        fields (list[str] | None, optional): Keep only these keys of each record. Defaults to None.
+        where (Union[Callable[[dict], bool], dict, None], optional): Only return the records
+            for which the function returns True, or whose fields equal every value of the
+            dict as JSON values (True and None do not match 1 or 0). Defaults to None.
+        cache (Union[bool, str], optional): If True, keep the records in an in-process cache
+            and return a copy of them while the file's modification time, size and inode are
+            unchanged. If "frozen", return the same read-only tuple of records on every hit,
+            with dictionaries as MappingProxyType and lists as tuples (schema records are
+            shared as is). where must be a dict. See cache_info(). Defaults to False.
+        schema (type | None, optional): A dataclass, TypedDict or msgspec Struct to decode
+            each record into, validating its field types in the same pass. Declaring a
+            dataclass with slots=True, or using a TypedDict (decoded into named tuples),
+            takes several times less memory than dictionaries. Defaults to None.
+
+    Returns:
+        list[Any]: A list containing the JSON objects read from the file, or the records
+        of the schema.
+
+    Raises:
+        TypeError: If a record does not match the schema.
+        ValueError: If cache is True and where is a callable, or if a record lacks a
+            required field of the schema.
+    """
+    check_cache_mode(cache)
+    if cache:
+        check_type(file, (str, Path))
+        if callable(where):
+            # A function is not a stable part of the cache key
+            raise ValueError("where must be a dict when cache is enabled")
+        compression = resolve_compression(file, compression)
+        return cached_read(
+            file,
+            "read_jsonl",
+            (skip, limit, compression, fields, where, schema),
+            lambda: read_jsonl(file, skip, limit, backend, compression, mmap, fields, where, schema=schema),
+            frozen=cache == "frozen",
+        )
+    return list(
+        iter_jsonl(
+            file,
+            skip=skip,
+            limit=limit,
+            backend=backend,
+            compression=compression,
+            mmap=mmap,
+            fields=fields,
+            where=where,
+            schema=schema,
+        )
+    )
+
+
+def _split_ranges(file: str | Path, parts: int) -> list[tuple[int, int]]:
+    """Split a file into at most `parts` byte ranges that start and end on line boundaries."""
+    size = os.path.getsize(file)
+    bounds = [0]
+    with open(file, mode="rb") as reader:
+        for i in range(1, parts):
+            pos = size * i // parts
+            if pos <= bounds[-1]:
+                continue
+            # Step back one byte so a guess that already sits on a line start is kept
+            reader.seek(pos - 1)
+            reader.readline()
+            pos = reader.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+
+# The decoder of a worker process of parallel_iter_jsonl, set by _init_worker
+_worker_loads: Callable[[str | bytes], Any] = json.loads
+
+
+def _init_worker(loads: Callable[[str | bytes], Any]) -> None:
+    # The decoder is handed over instead of the backend name, since backends registered in
+    # the parent are unknown to workers started with spawn or forkserver
+    global _worker_loads
+    _worker_loads = loads
+
+
+def _read_range(file: str | Path, start: int, end: int) -> list[dict]:
+    """Decode the records in the byte range [start, end) of a JSONL file."""
+    loads = _worker_loads
+    with open(file, mode="rb") as reader:
+        reader.seek(start)
+        data = reader.read(end - start)
+    return [loads(line) for line in data.splitlines() if line and not line.isspace()]
+
+
+def _iter_parallel(
+    file: str | Path,
+    ranges: list[tuple[int, int]],
+    workers: int,
+    ordered: bool,
+    loads: Callable[[str | bytes], Any],
+) -> Iterator[dict]:
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    # Only a bounded window of ranges is in flight, so a slow consumer does not make
+    # decoded results pile up in memory.
+    todo = iter(ranges)
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(loads,))
+    pending = deque(executor.submit(_read_range, file, start, end) for start, end in islice(todo, 2 * workers))
+    try:
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            records = future.result()
+
+            task = next(todo, None)
+            if task is not None:
+                pending.append(executor.submit(_read_range, file, *task))
+            yield from records
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def parallel_iter_jsonl(
+    file: str | Path,
+    workers: int | None = None,
+    ordered: bool = True,
+    backend: str | None = None,
+    compression: str | None = "infer",
+) -> Iterator[dict]:
+    """
+    Decode a JSONL file on multiple processes and yield its records.
+
+    The file is split at newline-aligned byte offsets into a few ranges per worker, and
+    each range is decoded in a ProcessPoolExecutor. Decoded records are sent back to the
+    calling process, so the speed-up is largest for records that are expensive to decode.
+    Compressed files cannot be split and are decoded in the calling process.
+
+    Args:
+        file (Union[str, Path]): The path to the JSONL file.
+        workers (int | None, optional): Number of worker processes. Defaults to None (os.cpu_count()).
+        ordered (bool, optional): If True, yield records in file order. If False, yield the
+            records of each range as soon as it is decoded. Defaults to True.
+        backend (str | None, optional): The JSON backend to decode with. Defaults to None
+            (the globally selected backend). Its loads function is sent to the workers, so
+            with the spawn or forkserver start methods a backend registered with
+            register_json_backend must use a picklable (module-level) function.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
 
     Returns:
-        list[dict]: A list containing the JSON objects read from the file.
+        Iterator[dict]: An iterator over the JSON objects in the file.
+
+    Raises:
+        TypeError: If an argument is not the expected type.
+        ValueError: If workers is less than 1.
     """
     check_type(file, (str, Path))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    check_type(workers, int)
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    check_type(ordered, bool)
+    json_backend = get_json_backend(backend)
+
+    compression = resolve_compression(file, compression)
+
+    if workers == 1 or compression is not None:
+        return iter_jsonl(file, backend=json_backend.name, compression=compression)
+    ranges = _split_ranges(file, workers * 4)
+    return _iter_parallel(file, ranges, workers, ordered, json_backend.loads)
+
+
+def parallel_read_jsonl(
+    file: str | Path,
+    workers: int | None = None,
+    backend: str | None = None,
+    compression: str | None = "infer",
+) -> list[dict]:
+    """
+    Read a JSONL file on multiple processes and return a list of dictionaries.
+
+    Args:
+        file (Union[str, Path]): The path to the JSONL file.
+        workers (int | None, optional): Number of worker processes. Defaults to None (os.cpu_count()).
+        backend (str | None, optional): The JSON backend to decode with. Defaults to None
+            (the globally selected backend).
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+
+    Returns:
+        list[dict]: A list containing the JSON objects read from the file, in file order.
+    """
+    return list(parallel_iter_jsonl(file, workers=workers, ordered=True, backend=backend, compression=compression))
+
+
+def _prepare_records(obj_list: dict | Iterable[dict], validate: str) -> Iterable[dict]:
+    """Normalize the records argument of the JSONL writers, checking lists up front."""
+    if validate not in VALIDATE_MODES:
+        raise ValueError(f"validate must be one of {', '.join(VALIDATE_MODES)}, got {validate}")
+    if isinstance(obj_list, dict):
+        return [obj_list]
+    if isinstance(obj_list, (str, bytes, bytearray, Mapping)):
+        # Iterable, but over characters, bytes or keys rather than records
+        raise TypeError(f"obj_list must be dict or Iterable[dict], got {type(obj_list).__name__}")
+    if isinstance(obj_list, list):
+        check_list_type(obj_list, dict, var_name="obj_list", validate=validate)
+        return obj_list
+    check_type(obj_list, Iterable, var_name="obj_list")
+    if validate == "off":
+        return obj_list
+    return _checked_records(obj_list)
 
-    df = []
-    with open(file, mode="r", encoding="utf-8") as reader:
-        line = reader.readline()
-        while line:
-            obj = json.loads(line)
-            df.append(obj)
-            line = reader.readline()
-    return df
+
+def _checked_records(obj_iter: Iterable[dict]) -> Iterator[dict]:
+    # Lazy iterables can only be checked while they are consumed
+    for i, obj in enumerate(obj_iter):
+        if not isinstance(obj, dict):
+            raise TypeError(f"obj_list must be Iterable[dict]; got {type(obj).__name__} at index {i}")
+        yield obj
+
+
+def _write_records(fp: BinaryIO, obj_list: Iterable[dict], dumps: Callable, buffer_size: int) -> None:
+    """Encode records in batches and issue a single write() per batch."""
+    batch: list[str] = []
+    pending = 0
+    for obj in obj_list:
+        line = dumps(obj, None)
+        batch.append(line)
+        pending += len(line) + 1
+        if pending >= buffer_size:
+            batch.append("")
+            fp.write("\n".join(batch).encode("utf-8"))
+            batch.clear()
+            pending = 0
+    if batch:
+        batch.append("")
+        fp.write("\n".join(batch).encode("utf-8"))
 
 
 def write_jsonl(
-    obj_list: dict | list[dict],
+    obj_list: dict | Iterable[dict],
     file: str | Path,
     force: bool = False,
     silent: bool = False,
     raise_on_exists: bool = False,
+    backend: str | None = None,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    compression: str | None = "infer",
+    validate: str = "full",
+    atomic: bool = True,
+    fsync: str = "none",
 ) -> None:
     """
     Write a list of dictionaries to a JSONL file.
 
+    Records are encoded in batches of about buffer_size characters, each written with a
+    single write() call. Any iterable, including a generator, is streamed to the file
+    without being materialized.
+
     Args:
-        obj_list (Union[dict, list[dict]]): A single dictionary or a list of dictionaries to write.
+        obj_list (Union[dict, Iterable[dict]]): A single dictionary or an iterable of dictionaries to write.
         file (Union[str, Path]): The path to the output JSONL file.
         force (bool, optional): If True, overwrite the file if it exists. Defaults to False.
         silent (bool, optional): If True, suppress print messages. Defaults to False.
         raise_on_exists (bool, optional): If True, raise FileExistsError with full
             traceback instead of exiting cleanly. Defaults to False.
+        backend (str | None, optional): The JSON backend to encode with. Defaults to None
+            (the globally selected backend).
+        buffer_size (int, optional): Approximate size of each write batch. Defaults to 1 MiB.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        validate (str, optional): How many records to type-check: "full", "sample" (at most
+            1000 evenly spaced records of a list) or "off". Defaults to "full".
+        atomic (bool, optional): If True, write to a temporary file in the same directory and
+            rename it into place, so the file is never left truncated. Defaults to True.
+        fsync (str, optional): Durability policy: "none", "file" (fsync the file before the
+            rename) or "file+dir" (also fsync the directory). Defaults to "none".
 
     Raises:
+        TypeError: If obj_list or one of its elements is not the expected type.
         FileExistsError: If the file exists, force is False, and raise_on_exists is True.
     """
     check_type(file, (str, Path))
@@ -60,35 +534,75 @@ def write_jsonl(
         sys.exit(msg)  # exit 1
     create_parent_dirs(file)
 
-    if isinstance(obj_list, dict):
-        obj_list = [obj_list]
-    check_list_type(obj_list, dict)
+    obj_list = _prepare_records(obj_list, validate)
+    check_type(buffer_size, int)
+    dumps = get_json_backend(backend).dumps
+    compression = resolve_compression(file, compression)
 
-    with open(file, mode="w", encoding="utf-8", newline="\n") as fp:
-        for obj in obj_list:
-            json.dump(obj, fp, ensure_ascii=False)
-            print(file=fp)
+    with (
+        atomic_path(file, atomic=atomic, fsync=fsync) as path,
+        open_file(path, mode="wb", compression=compression) as fp,
+    ):
+        _write_records(fp, obj_list, dumps, buffer_size)
 
     if not silent:
         print(f"[INFO] save to {file}")
 
 
-def append_jsonl(obj_list: dict | list[dict], file: str | Path) -> None:
+def append_jsonl(
+    obj_list: dict | Iterable[dict],
+    file: str | Path,
+    backend: str | None = None,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    compression: str | None = "infer",
+    validate: str = "full",
+) -> None:
     """
     Append a list of dictionaries to an existing JSONL file.
 
+    If the file has an up-to-date index sidecar (see build_jsonl_index), the index is
+    extended with the appended records.
+
     Args:
-        obj_list (Union[dict, list[dict]]): A single dictionary or a list of dictionaries to append.
+        obj_list (Union[dict, Iterable[dict]]): A single dictionary or an iterable of dictionaries to append.
         file (Union[str, Path]): The path to the JSONL file.
+        backend (str | None, optional): The JSON backend to encode with. Defaults to None
+            (the globally selected backend).
+        buffer_size (int, optional): Approximate size of each write batch. Defaults to 1 MiB.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        validate (str, optional): How many records to type-check: "full", "sample" (at most
+            1000 evenly spaced records of a list) or "off". Defaults to "full".
+
+    Raises:
+        TypeError: If obj_list or one of its elements is not the expected type. Records of
+            an iterator are checked as they are written, so batches may already be on disk
+            when a bad record is found; the file is then truncated back to its original
+            size, so nothing is appended.
     """
     check_type(file, (str, Path))
     create_parent_dirs(file)
 
-    if isinstance(obj_list, dict):
-        obj_list = [obj_list]
-    check_list_type(obj_list, dict)
+    obj_list = _prepare_records(obj_list, validate)
+    check_type(buffer_size, int)
+    dumps = get_json_backend(backend).dumps
+    compression = resolve_compression(file, compression)
+    indexed = compression is None and is_jsonl_index_valid(file)
+
+    original_size = os.path.getsize(file) if os.path.exists(file) else None
+    try:
+        with open_file(file, mode="ab", compression=compression) as fp:
+            _write_records(fp, obj_list, dumps, buffer_size)
+    except BaseException:
+        # Roll back the batches already flushed; compressed appends add a new stream after
+        # the original bytes, so truncating works for them too
+        if original_size is None:
+            # The file may never have been created if opening it failed
+            with suppress(FileNotFoundError):
+                os.remove(file)
+        else:
+            os.truncate(file, original_size)
+        raise
 
-    with open(file, mode="a", encoding="utf-8", newline="\n") as fp:
-        for obj in obj_list:
-            json.dump(obj, fp, ensure_ascii=False)
-            print(file=fp)
+    if indexed:
+        extend_jsonl_index(file)
@@ -0,0 +1,378 @@
+"""This module provides a JSONL writer that splits its output into many shard files."""
+
+import os
+import re
+import sys
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import methodcaller
+from pathlib import Path
+from typing import Any
+
+from .compression import EXTENSIONS, open_file, resolve_compression
+from .json_backend import get_json_backend
+from .json_manager import read_json, write_json
+from .type_checker import check_type
+from .utils import create_parent_dirs
+
+
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+
+def _split_name(name: str) -> tuple[str, str]:
+    """Split a file name into its stem and its extension, compression suffix included."""
+    base, compressed = name, ""
+    suffix = os.path.splitext(name)[1]
+    if suffix.lower() in EXTENSIONS:
+        base, compressed = name[: -len(suffix)], suffix
+    # Only the last dot of the rest starts the extension, so `my.data.jsonl` keeps `my.data`
+    stem, dot, ext = base.rpartition(".")
+    if not dot or not stem:
+        return base, compressed
+    return stem, f".{ext}{compressed}"
+
+
+def shard_name(file: str | Path, index: int, num_shards: int) -> Path:
+    """
+    Return the path of a shard, e.g. `out/data-00003-of-00128.jsonl.gz` for `out/data.jsonl.gz`.
+
+    Args:
+        file (Union[str, Path]): The base path passed to ShardedJsonlWriter.
+        index (int): The shard index.
+        num_shards (int): The total number of shards.
+
+    Returns:
+        Path: The path of the shard.
+    """
+    path = Path(file)
+    stem, ext = _split_name(path.name)
+    return path.with_name(f"{stem}-{index:05d}-of-{num_shards:05d}{ext}")
+
+
+def manifest_path(file: str | Path) -> Path:
+    """Return the path of the manifest written by ShardedJsonlWriter for a base path."""
+    path = Path(file)
+    return path.with_name(f"{_split_name(path.name)[0]}.manifest.json")
+
+
+def _existing_shards(file: str | Path) -> list[Path]:
+    """Return the shard files of a base path on disk, whether or not a manifest lists them."""
+    path = Path(file)
+    stem, ext = _split_name(path.name)
+    pattern = re.compile(rf"{re.escape(stem)}-\d{{5}}-of-\d{{5}}{re.escape(ext)}")
+    if not path.parent.is_dir():
+        return []
+    return [entry for entry in path.parent.iterdir() if pattern.fullmatch(entry.name)]
+
+
+class _Shard:
+    def __init__(self, index: int, tmp_path: Path, compression: str | None):
+        self.index = index
+        self.tmp_path = tmp_path
+        self.compression = compression
+        self.records = 0
+        self.bytes = 0
+        self.batch: list[bytes] = []
+        self.pending = 0
+        self._fp = None
+
+    # The methods below run on the shard's writer thread
+
+    def write(self, data: bytes) -> None:
+        if self._fp is None:
+            self._fp = open_file(self.tmp_path, mode="wb", compression=self.compression)
+        self._fp.write(data)
+
+    def close(self) -> None:
+        if self._fp is None:
+            # Empty partitions still get a file so every shard index exists
+            self._fp = open_file(self.tmp_path, mode="wb", compression=self.compression)
+        self._fp.close()
+
+
+class ShardedJsonlWriter:
+    """
+    Write records to many JSONL shards such as `data-00000-of-00128.jsonl`.
+
+    Without a key, records fill one shard after another, rolling over after max_records
+    records or max_bytes uncompressed bytes; with num_shards alone they are dealt round-robin.
+    With a key, each record goes to the shard chosen by a stable hash of its key, so equal
+    keys always land in the same shard. Records are encoded in the calling thread and each
+    shard's batches are written by one of `workers` threads, so several shards (and their
+    compression) are written concurrently.
+
+    Shards are written under temporary names and renamed to their final `-of-NNNNN` names on
+    close, together with a manifest `<stem>.manifest.json` listing each shard's record
+    count and byte size. If the block raises, the temporary files are removed.
+
+    Example:
+        with ShardedJsonlWriter("out/data.jsonl.gz", max_records=100_000) as writer:
+            writer.write_many(records)
+    """
+
+    def __init__(
+        self,
+        file: str | Path,
+        max_records: int | None = None,
+        max_bytes: int | None = None,
+        num_shards: int | None = None,
+        key: str | Callable[[dict], Any] | None = None,
+        workers: int = 4,
+        force: bool = False,
+        silent: bool = False,
+        raise_on_exists: bool = False,
+        backend: str | None = None,
+        buffer_size: int = WRITE_BUFFER_SIZE,
+        compression: str | None = "infer",
+    ):
+        """
+        Open a sharded JSONL writer.
+
+        Args:
+            file (Union[str, Path]): The base path; `out/data.jsonl` produces shards named
+                `out/data-00000-of-00010.jsonl` and the manifest `out/data.manifest.json`.
+            max_records (int | None, optional): Roll over to a new shard after this many
+                records. Defaults to None.
+            max_bytes (int | None, optional): Roll over before a shard exceeds this many
+                uncompressed bytes (a single larger record gets a shard of its own).
+                Defaults to None.
+            num_shards (int | None, optional): A fixed number of shards, filled by key hash
+                or round-robin. Defaults to None.
+            key (Union[str, Callable[[dict], Any], None], optional): A field name, or a function
+                of the record, whose value selects the shard. Requires num_shards. Defaults to None.
+            workers (int, optional): Number of writer threads. Defaults to 4.
+            force (bool, optional): If True, replace the shards of a previous run, whether
+                listed in an existing manifest or left without one. They are removed only
+                once close() has written the new shards and manifest. Defaults to False.
+            silent (bool, optional): If True, suppress print messages. Defaults to False.
+            raise_on_exists (bool, optional): If True, raise FileExistsError with full
+                traceback instead of exiting cleanly. Defaults to False.
+            backend (str | None, optional): The JSON backend to encode with. Defaults to None
+                (the globally selected backend).
+            buffer_size (int, optional): Approximate size of each write batch per shard.
+                Defaults to 1 MiB.
+            compression (str | None, optional): The compression codec, "infer" to detect it
+                from the file extension, or None for no compression. Defaults to "infer".
+
+        Raises:
+            ValueError: If the sharding arguments are missing, inconsistent or not positive.
+            FileExistsError: If the manifest or shards of the base path exist, force is False,
+                and raise_on_exists is True.
+        """
+        check_type(file, (str, Path))
+        for name, value in (("max_records", max_records), ("max_bytes", max_bytes), ("num_shards", num_shards)):
+            if value is not None:
+                check_type(value, int, var_name=name)
+                if value < 1:
+                    raise ValueError(f"{name} must be at least 1, got {value}")
+        check_type(workers, int)
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if num_shards is not None and (max_records is not None or max_bytes is not None):
+            raise ValueError("num_shards cannot be combined with max_records or max_bytes")
+        if key is not None and num_shards is None:
+            raise ValueError("key requires num_shards")
+        if num_shards is None and max_records is None and max_bytes is None:
+            raise ValueError("One of max_records, max_bytes or num_shards is required")
+
+        manifest = manifest_path(file)
+        # Shards without a manifest are left by a run that did not close, or by another tool
+        existing = _existing_shards(file)
+        if manifest.exists() or existing:
+            if not force:
+                msg = f"[ERROR] {manifest if manifest.exists() else existing[0]} already exists."
+                if raise_on_exists:
+                    raise FileExistsError(msg)
+                sys.exit(msg)  # exit 1
+            if manifest.exists():
+                existing += [manifest.with_name(shard["file"]) for shard in read_json(manifest)["shards"]]
+        # Removed by close() once the new shards and manifest are in place, so a run that
+        # fails leaves the previous output untouched
+        self._stale = set(existing)
+        create_parent_dirs(file)
+
+        self.file = file
+        self._max_records = max_records
+        self._max_bytes = max_bytes
+        self._num_shards = num_shards
+        if isinstance(key, str):
+            # Records without the field all go to the shard of None
+            key = methodcaller("get", key)
+        self._key = key
+        self._silent = silent
+        self._dumps = get_json_backend(backend).dumps
+        check_type(buffer_size, int)
+        self._buffer_size = buffer_size
+        self._compression = resolve_compression(file, compression)
+        self._tag = os.urandom(4).hex()
+
+        self._executors = [ThreadPoolExecutor(max_workers=1) for _ in range(workers)]
+        self._inflight: deque[Future] = deque()
+        self._shards: list[_Shard] = []
+        self._count = 0
+        self._closed = False
+        self._finished = False
+        if num_shards is not None:
+            for _ in range(num_shards):
+                self._new_shard()
+
+    def _new_shard(self) -> _Shard:
+        index = len(self._shards)
+        final = shard_name(self.file, index, 0)
+        shard = _Shard(index, final.with_name(f".{final.name}.{self._tag}.tmp"), self._compression)
+        self._shards.append(shard)
+        return shard
+
+    def _submit(self, shard: _Shard, func: Callable, *args: Any) -> None:
+        # One single-threaded executor per shard keeps each shard's writes in order
+        future = self._executors[shard.index % len(self._executors)].submit(func, *args)
+        self._inflight.append(future)
+        # Bound the encoded data waiting for the writer threads
+        while len(self._inflight) > 4 * len(self._executors):
+            self._inflight.popleft().result()
+
+    def _flush(self, shard: _Shard) -> None:
+        if shard.batch:
+            self._submit(shard, shard.write, b"".join(shard.batch))
+            shard.batch.clear()
+            shard.pending = 0
+
+    def _select(self, obj: dict, size: int) -> _Shard:
+        if self._key is not None:
+            key = self._key(obj)
+            raw = key.encode("utf-8") if isinstance(key, str) else self._dumps(key, None).encode("utf-8")
+            # crc32 is stable across processes, unlike hash() of a str
+            return self._shards[zlib.crc32(raw) % self._num_shards]
+        if self._num_shards is not None:
+            return self._shards[self._count % self._num_shards]
+        shard = self._shards[-1] if self._shards else self._new_shard()
+        full = (self._max_records is not None and shard.records >= self._max_records) or (
+            self._max_bytes is not None and shard.records and shard.bytes + size > self._max_bytes
+        )
+        if full:
+            self._flush(shard)
+            self._submit(shard, shard.close)
+            shard = self._new_shard()
+        return shard
+
+    def write(self, obj: dict) -> None:
+        """
+        Write one record to its shard.
+
+        Args:
+            obj (dict): The dictionary to write.
+
+        Raises:
+            TypeError: If obj is not a dictionary.
+            ValueError: If the writer is closed.
+        """
+        if self._closed:
+            raise ValueError("I/O operation on closed ShardedJsonlWriter")
+        check_type(obj, dict)
+        data = (self._dumps(obj, None) + "\n").encode("utf-8")
+        shard = self._select(obj, len(data))
+        shard.batch.append(data)
+        shard.pending += len(data)
+        shard.records += 1
+        shard.bytes += len(data)
+        self._count += 1
+        if shard.pending >= self._buffer_size:
+            self._flush(shard)
+
+    def write_many(self, obj_list: Iterable[dict]) -> None:
+        """
+        Write every record of an iterable.
+
+        Args:
+            obj_list (Iterable[dict]): The dictionaries to write.
+        """
+        for obj in obj_list:
+            self.write(obj)
+
+    def _finish(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        try:
+            for shard in self._shards:
+                self._flush(shard)
+                if self._num_shards is not None or shard is self._shards[-1]:
+                    self._submit(shard, shard.close)
+            while self._inflight:
+                self._inflight.popleft().result()
+        finally:
+            for executor in self._executors:
+                executor.shutdown(wait=True)
+
+    def close(self) -> dict:
+        """
+        Flush and close every shard, rename them to their final names and write the manifest.
+
+        The shards of a previous run replaced with force=True are removed last. If closing
+        fails, the temporary files are removed and the previous output is left in place.
+
+        Returns:
+            dict: The manifest, with the shard list and the total record and byte counts.
+        """
+        if self._closed:
+            return self.manifest
+        try:
+            self._finish()
+
+            num_shards = len(self._shards)
+            shards = []
+            for shard in self._shards:
+                final = shard_name(self.file, shard.index, num_shards)
+                os.replace(shard.tmp_path, final)
+                shards.append({"file": final.name, "records": shard.records, "bytes": os.path.getsize(final)})
+            manifest = {
+                "num_shards": num_shards,
+                "total_records": self._count,
+                "total_bytes": sum(shard["bytes"] for shard in shards),
+                "compression": self._compression,
+                "shards": shards,
+            }
+            write_json(manifest, manifest_path(self.file), force=True, silent=True)
+        except BaseException:
+            self._remove_tmp_files()
+            self._closed = True
+            raise
+        self.manifest = manifest
+        self._closed = True
+        for path in self._stale - {manifest_path(self.file).with_name(shard["file"]) for shard in shards}:
+            path.unlink(missing_ok=True)
+
+        if not self._silent:
+            print(f"[INFO] save {num_shards} shards to {manifest_path(self.file).parent}")
+        return self.manifest
+
+    def _remove_tmp_files(self) -> None:
+        for shard in self._shards:
+            shard.tmp_path.unlink(missing_ok=True)
+
+    def abort(self) -> None:
+        """
+        Stop writing and remove the temporary shard files.
+
+        Raises:
+            Exception: The error of a writer thread, if one failed; the temporary files are
+                removed first. Inside a with block that raised, it is chained to that error.
+        """
+        if self._closed:
+            return
+        try:
+            self._finish()
+        finally:
+            self._remove_tmp_files()
+            self._closed = True
+
+    def __enter__(self) -> "ShardedJsonlWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
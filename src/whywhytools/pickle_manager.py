@@ -1,42 +1,144 @@
 """This module provides utility functions for managing Pickle files."""
 
+import io
 import os
 import pickle
+import struct
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+from .compression import open_file, resolve_compression
+from .read_cache import cached_read, check_cache_mode
 from .type_checker import check_type
-from .utils import create_parent_dirs
+from .utils import atomic_path, create_parent_dirs
 
 
-def load_pickle(file: str | Path) -> Any:
+# Out-of-band container: magic, pickle length, buffer count, then one (offset, length) pair
+# per buffer, the pickle stream, and the buffers, each starting on an ALIGNMENT boundary.
+# Regular pickle streams start with the PROTO opcode (0x80), so the magic cannot collide.
+OUT_OF_BAND_MAGIC = b"WWPKLOB1"
+_HEADER = struct.Struct("<QQ")
+_ENTRY = struct.Struct("<QQ")
+ALIGNMENT = 64
+OUT_OF_BAND_MIN_SIZE = 1 << 16  # smaller buffers stay in the pickle stream
+
+
+def _load_out_of_band(f: BinaryIO) -> Any:
+    import mmap
+
+    # Copy-on-write, so arrays are writable without ever changing the file
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mm)
+    start = len(OUT_OF_BAND_MAGIC)
+    pickle_len, count = _HEADER.unpack_from(view, start)
+    start += _HEADER.size
+    buffers = []
+    for _ in range(count):
+        offset, length = _ENTRY.unpack_from(view, start)
+        buffers.append(view[offset : offset + length])
+        start += _ENTRY.size
+    # The buffers keep the mapping alive for as long as the loaded objects use them
+    return pickle.loads(view[start : start + pickle_len], buffers=buffers)
+
+
+def load_pickle(file: str | Path, compression: str | None = "infer", cache: bool = False) -> Any:
     """
     Load an object from a pickle file.
 
+    Files written with save_pickle(out_of_band=True) are memory-mapped, and their large
+    buffers (e.g. NumPy arrays) are used in place instead of being copied.
+
     Args:
         file (Union[str, Path]): The path to the pickle file.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        cache (bool, optional): If True, keep the loaded object in an in-process cache and
+            return a copy of it while the file's modification time, size and inode are
+            unchanged. Large buffers such as NumPy arrays are shared read-only instead of
+            copied, so they stay memory-mapped for out-of-band files. See cache_info().
+            Defaults to False.
 
     Returns:
         Any: The object loaded from the pickle file.
     """
     check_type(file, (str, Path))
+    compression = resolve_compression(file, compression)
+    check_cache_mode(cache, frozen=False)
+    if cache:
+        return cached_read(file, "load_pickle", (compression,), lambda: load_pickle(file, compression))
 
-    with open(file, "rb") as f:
+    with open_file(file, "rb", compression=compression) as f:
+        if compression is None:
+            if f.read(len(OUT_OF_BAND_MAGIC)) == OUT_OF_BAND_MAGIC:
+                return _load_out_of_band(f)
+            f.seek(0)
         obj = pickle.load(f)
     return obj
 
 
+class _OutOfBandPickler(pickle.Pickler):
+    def reducer_override(self, obj: Any) -> Any:
+        # bytearray is pickled in-band by default; wrapping it lets large ones go out-of-band.
+        # A bytearray owns its memory, so load_pickle rebuilds it with one copy of the mapping.
+        if type(obj) is bytearray and len(obj) >= OUT_OF_BAND_MIN_SIZE:
+            return bytearray, (pickle.PickleBuffer(obj),)
+        return NotImplemented
+
+
+def _dump_out_of_band(obj: Any, f: BinaryIO, protocol: int) -> None:
+    buffers: list[memoryview] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        view = buffer.raw()
+        if view.nbytes < OUT_OF_BAND_MIN_SIZE:
+            return True  # serialize in-band
+        buffers.append(view)
+        return False
+
+    stream = io.BytesIO()
+    _OutOfBandPickler(stream, protocol=protocol, buffer_callback=buffer_callback).dump(obj)
+    data = stream.getbuffer()
+
+    offset = len(OUT_OF_BAND_MAGIC) + _HEADER.size + _ENTRY.size * len(buffers) + data.nbytes
+    entries = []
+    for view in buffers:
+        offset += -offset % ALIGNMENT
+        entries.append(_ENTRY.pack(offset, view.nbytes))
+        offset += view.nbytes
+
+    f.write(OUT_OF_BAND_MAGIC + _HEADER.pack(data.nbytes, len(buffers)) + b"".join(entries))
+    f.write(data)
+    position = f.tell()
+    for view in buffers:
+        f.write(b"\0" * (-position % ALIGNMENT))
+        position += -position % ALIGNMENT
+        # Written straight from the object's memory, without an intermediate copy
+        f.write(view)
+        position += view.nbytes
+
+
 def save_pickle(
     obj,
     file: str | Path,
     force: bool = False,
     silent: bool = False,
     raise_on_exists: bool = False,
+    compression: str | None = "infer",
+    atomic: bool = True,
+    fsync: str = "none",
+    protocol: int = pickle.HIGHEST_PROTOCOL,
+    out_of_band: bool = False,
 ) -> None:
     """
     Save an object to a pickle file.
 
+    With out_of_band=True, the large buffers of protocol 5 (NumPy arrays, PickleBuffer
+    objects, bytearrays of 64 KiB or more) are written straight from memory as 64-byte
+    aligned segments after the pickle stream, and load_pickle maps them back with mmap
+    instead of copying them. Only NumPy arrays and PickleBuffer objects load zero-copy;
+    bytearrays own their memory, so each one is copied once out of the mapping.
+
     Args:
         obj (Any): The object to save.
         file (Union[str, Path]): The path to the output pickle file.
@@ -44,9 +146,19 @@ def save_pickle(
         silent (bool, optional): If True, suppress print messages. Defaults to False.
         raise_on_exists (bool, optional): If True, raise FileExistsError with full
             traceback instead of exiting cleanly. Defaults to False.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        atomic (bool, optional): If True, write to a temporary file in the same directory and
+            rename it into place, so the file is never left truncated. Defaults to True.
+        fsync (str, optional): Durability policy: "none", "file" (fsync the file before the
+            rename) or "file+dir" (also fsync the directory). Defaults to "none".
+        protocol (int, optional): The pickle protocol. Defaults to pickle.HIGHEST_PROTOCOL.
+        out_of_band (bool, optional): If True, store large buffers out-of-band for zero-copy
+            loading of NumPy arrays and PickleBuffer objects. Requires protocol 5 and no compression. Defaults to False.
 
     Raises:
         TypeError: If file is not the expected type.
+        ValueError: If out_of_band is used with a protocol below 5 or with compression.
         FileExistsError: If the file exists, force is False, and raise_on_exists is True.
     """
     check_type(file, (str, Path))
@@ -55,10 +167,19 @@ def save_pickle(
         if raise_on_exists:
             raise FileExistsError(msg)
         sys.exit(msg)  # exit 1
+    check_type(protocol, int)
+    compression = resolve_compression(file, compression)
+    if out_of_band and protocol < 5:
+        raise ValueError(f"out_of_band requires protocol 5 or higher, got {protocol}")
+    if out_of_band and compression is not None:
+        raise ValueError("out_of_band cannot be used with compressed files")
     create_parent_dirs(file)
 
-    with open(file, "wb") as f:
-        pickle.dump(obj, f)
+    with atomic_path(file, atomic=atomic, fsync=fsync) as path, open_file(path, "wb", compression=compression) as f:
+        if out_of_band:
+            _dump_out_of_band(obj, f, protocol)
+        else:
+            pickle.dump(obj, f, protocol=protocol)
 
     if not silent:
         print(f"[INFO] save to {file}")
@@ -0,0 +1,237 @@
+"""This module provides an in-process cache of parsed files, invalidated by their stat signature."""
+
+import os
+import pickle
+import threading
+import warnings
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from .utils import parse_size
+
+
+DEFAULT_MAX_SIZE = 256 << 20  # 256 MiB
+CACHE_MODES = (False, True, "frozen")
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of the read cache.
+
+    Attributes:
+        hits (int): Number of reads served from the cache.
+        misses (int): Number of reads that parsed the file, because it was not cached or had changed.
+        entries (int): Number of cached files.
+        size (int): Total size of the cached entries, in bytes.
+        max_size (int): The size above which the least recently used entries are evicted.
+        uncacheable (int): Number of reads whose options or result could not be cached,
+            e.g. because they cannot be pickled. They are also counted as misses.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    size: int
+    max_size: int
+    uncacheable: int
+
+
+class _Entry(NamedTuple):
+    signature: tuple[int, int, int]
+    frozen: bool
+    # frozen: the shared read-only object; otherwise: (pickle stream, read-only buffers)
+    payload: Any
+    size: int
+
+
+# key: (absolute path, loader name, pickled options, frozen) -> entry
+_entries: OrderedDict[tuple[str, str, bytes, bool], _Entry] = OrderedDict()
+_lock = threading.Lock()
+_size = 0
+_max_size = DEFAULT_MAX_SIZE
+_hits = 0
+_misses = 0
+_uncacheable = 0
+_warned: set[tuple[str, str]] = set()
+
+
+def check_cache_mode(cache: bool | str, frozen: bool = True) -> None:
+    """
+    Validate the cache argument of a reader.
+
+    Args:
+        cache (Union[bool, str]): The argument to check.
+        frozen (bool, optional): Whether the reader supports "frozen". Defaults to True.
+
+    Raises:
+        ValueError: If cache is not a supported mode.
+    """
+    if not (cache is True or cache is False or (frozen and cache == "frozen")):
+        modes = CACHE_MODES if frozen else (False, True)
+        raise ValueError(f"cache must be one of {', '.join(map(repr, modes))}, got {cache!r}")
+
+
+def freeze(obj: Any) -> Any:
+    """
+    Return a read-only version of a decoded JSON value, sharing nothing mutable with it.
+
+    Dictionaries become MappingProxyType views of frozen values and lists become tuples;
+    other objects are returned as is.
+    """
+    if obj.__class__ is dict:
+        return MappingProxyType({key: freeze(value) for key, value in obj.items()})
+    if obj.__class__ is list:
+        return tuple(map(freeze, obj))
+    return obj
+
+
+def _dumps(obj: Any) -> tuple[bytes, tuple[memoryview, ...]]:
+    """Pickle an object, keeping its large buffers (e.g. NumPy arrays) out of band and read-only."""
+    buffers: list[memoryview] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=lambda buffer: buffers.append(buffer.raw().toreadonly()))
+    return data, tuple(buffers)
+
+
+def _evict() -> None:
+    global _size
+    while _size > _max_size:
+        _, entry = _entries.popitem(last=False)
+        _size -= entry.size
+
+
+def _skip(file: str, loader: str, reason: str) -> None:
+    global _uncacheable
+    with _lock:
+        _uncacheable += 1
+        first = (file, loader) not in _warned
+        _warned.add((file, loader))
+    if first:
+        warnings.warn(f"{loader}({file!r}, cache=...) is not cached: {reason}", RuntimeWarning, stacklevel=4)
+
+
+def cached_read(
+    file: str | Path,
+    loader: str,
+    options: tuple,
+    load: Callable[[], Any],
+    frozen: bool = False,
+) -> Any:
+    """
+    Return the object parsed from a file, from the cache if the file has not changed.
+
+    An entry is stale once the modification time, size or inode of the file differ from
+    when it was parsed, which a single os.stat detects.
+
+    By default, entries hold the object pickled, and every hit unpickles a copy that the
+    caller can modify freely. Large buffers such as NumPy arrays are kept out of the pickle
+    stream and shared read-only instead of being copied, so arrays come back read-only.
+    With frozen=True, the object is converted once with freeze() and every hit returns
+    that same read-only object, which costs nothing.
+
+    Reads whose options or result cannot be pickled are parsed every time; a
+    RuntimeWarning is emitted the first time, and cache_info().uncacheable counts them.
+
+    Args:
+        file (Union[str, Path]): The path to the file.
+        loader (str): The name of the reading function, part of the cache key.
+        options (tuple): The arguments changing the parsed result, part of the cache key.
+        load (Callable[[], Any]): Parse the file on a miss.
+        frozen (bool, optional): If True, share a read-only object instead of copying.
+            Defaults to False.
+
+    Returns:
+        Any: The parsed object.
+    """
+    global _hits, _misses, _size
+    path = os.path.abspath(file)
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    try:
+        key = (path, loader, pickle.dumps(options, protocol=pickle.HIGHEST_PROTOCOL), frozen)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        # Options such as a locally defined schema class cannot be part of a key
+        with _lock:
+            _misses += 1
+        _skip(path, loader, f"its options cannot be pickled ({e})")
+        return load()
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry.signature == signature:
+            _entries.move_to_end(key)
+            _hits += 1
+        else:
+            _misses += 1
+            entry = None
+    if entry is not None:
+        if entry.frozen:
+            return entry.payload
+        data, buffers = entry.payload
+        return pickle.loads(data, buffers=buffers)
+
+    obj = load()
+    try:
+        data, buffers = _dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError, BufferError) as e:
+        _skip(path, loader, f"its result cannot be pickled ({e})")
+        return obj
+
+    size = len(data) + sum(buffer.nbytes for buffer in buffers)
+    if frozen:
+        obj = freeze(obj)
+        entry = _Entry(signature, True, obj, size)
+    else:
+        entry = _Entry(signature, False, (data, buffers), size)
+        if buffers:
+            # The cached buffers share the memory of obj, so hand out a copy with
+            # read-only buffers like the hits do
+            obj = pickle.loads(data, buffers=buffers)
+    with _lock:
+        previous = _entries.pop(key, None)
+        if previous is not None:
+            _size -= previous.size
+        if size <= _max_size:
+            _entries[key] = entry
+            _size += size
+            _evict()
+    return obj
+
+
+def cache_info() -> CacheInfo:
+    """
+    Return the statistics of the read cache used by read_json, read_jsonl and load_pickle
+    when called with cache=True or cache="frozen".
+
+    Returns:
+        CacheInfo: The hits, misses, number of entries, size, maximum size and number of
+        uncacheable reads of the cache.
+    """
+    with _lock:
+        return CacheInfo(_hits, _misses, len(_entries), _size, _max_size, _uncacheable)
+
+
+def cache_clear() -> None:
+    """Remove every entry of the read cache and reset its statistics."""
+    global _size, _hits, _misses, _uncacheable
+    with _lock:
+        _entries.clear()
+        _warned.clear()
+        _size = _hits = _misses = _uncacheable = 0
+
+
+def set_cache_size(max_size: int | str) -> None:
+    """
+    Set the maximum total size of the read cache, evicting the least recently used
+    entries to fit.
+
+    Args:
+        max_size (Union[int, str]): The size in bytes, or a string such as "1GB".
+    """
+    global _max_size
+    max_size = parse_size(max_size)
+    with _lock:
+        _max_size = max_size
+        _evict()
@@ -5,30 +5,304 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from .type_checker import check_list_type, check_type
+from .utils import atomic_path, create_parent_dirs, parse_size
 
 
-from .type_checker import check_type
-from .utils import create_parent_dirs
+INDEX_SUFFIX = ".index.json"
 
 
-def load_safetensors(file: str | Path, device: str | int = "cpu") -> Any:
+def _index_path(file: str | Path) -> Path | None:
+    """Return the index of a sharded checkpoint given its index or base path, or None."""
+    if str(file).endswith(INDEX_SUFFIX):
+        return Path(file)
+    index = Path(f"{file}{INDEX_SUFFIX}")
+    if not os.path.exists(file) and index.exists():
+        return index
+    return None
+
+
+def _shard_path(file: str | Path, index: int, num_shards: int, tag: str = "") -> Path:
+    path = Path(file)
+    tag = f"-{tag}" if tag else ""
+    return path.with_name(f"{path.stem}-{index:05d}-of-{num_shards:05d}{tag}{path.suffix}")
+
+
+def _read_weight_files(index: Path) -> set[str]:
+    """Return the shard file names referenced by an index, or an empty set without one."""
+    from .json_manager import read_json
+
+    try:
+        return set(read_json(index)["weight_map"].values())
+    except FileNotFoundError:
+        return set()
+
+
+def _remove_sharded(index: Path) -> None:
+    """Remove a sharded checkpoint: its index first, then the shards it referenced."""
+    names = _read_weight_files(index)
+    index.unlink(missing_ok=True)
+    for name in names:
+        index.with_name(name).unlink(missing_ok=True)
+
+
+class SafetensorsFile:
     """
-    Read a PyTorch file and return the loaded object.
+    Lazy access to the tensors of a safetensors file.
+
+    The file is memory-mapped by safetensors' `safe_open`; only the header is parsed when
+    the file is opened, and each tensor (or slice) is read from the mapping on access, so
+    loading a few layers of a large checkpoint reads only their bytes.
+
+    A sharded checkpoint is opened through its `.index.json` (or its base path); each
+    shard is then opened on first access to one of its tensors.
+
+    Example:
+        with open_safetensors("model.safetensors") as f:
+            for key in f.keys():
+                if key.startswith("encoder."):
+                    tensor = f.get_tensor(key)
+            rows = f.get_slice("embed.weight")[:1000]
+    """
+
+    def __init__(self, file: str | Path, device: str | int = "cpu"):
+        """
+        Open a safetensors file.
+
+        Args:
+            file (Union[str, Path]): The path to the safetensors file, or to the index
+                (or base path) of a sharded checkpoint.
+            device (Union[str, int], optional): The device to load tensors on. Defaults to "cpu".
+        """
+        check_type(file, (str, Path))
+        check_type(device, (str, int))
+
+        self.file = file
+        self._device = device
+        self._handles: dict[Path, Any] = {}
+        index = _index_path(file)
+        if index is None:
+            self._index = None
+            self._weight_map = None
+            self._open(Path(file))
+        else:
+            from .json_manager import read_json
+
+            self._index = read_json(index)
+            self._weight_map = {key: index.with_name(name) for key, name in self._index["weight_map"].items()}
+
+    def _open(self, path: Path) -> Any:
+        if self._handles is None:
+            raise ValueError("I/O operation on closed SafetensorsFile")
+        handle = self._handles.get(path)
+        if handle is None:
+            from safetensors import safe_open
+
+            handle = self._handles[path] = safe_open(path, framework="pt", device=self._device).__enter__()
+        return handle
+
+    def _handle_of(self, key: str) -> Any:
+        if self._weight_map is None:
+            return self._open(Path(self.file))
+        if key not in self._weight_map:
+            raise KeyError(key)
+        return self._open(self._weight_map[key])
+
+    def keys(self) -> list[str]:
+        """Return the names of the tensors in the file."""
+        if self._weight_map is not None:
+            return list(self._weight_map)
+        return list(self._open(Path(self.file)).keys())
+
+    def metadata(self) -> dict[str, str] | None:
+        """Return the metadata saved in the header (or in the index of a sharded checkpoint), or None."""
+        if self._index is not None:
+            return self._index.get("metadata")
+        return self._open(Path(self.file)).metadata()
+
+    def get_tensor(self, key: str) -> Any:
+        """
+        Read one tensor.
+
+        Args:
+            key (str): The name of the tensor.
+
+        Returns:
+            torch.Tensor: The tensor.
+        """
+        return self._handle_of(key).get_tensor(key)
+
+    def get_slice(self, key: str) -> Any:
+        """
+        Return a lazy slice object of one tensor; indexing it, e.g. `f.get_slice(key)[:10]`,
+        reads only the selected rows. It also provides get_shape() and get_dtype().
+
+        Args:
+            key (str): The name of the tensor.
+
+        Returns:
+            Any: The safetensors slice object.
+        """
+        return self._handle_of(key).get_slice(key)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.get_tensor(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def close(self) -> None:
+        """Release the memory mappings. Tensors already read stay valid."""
+        if self._handles is None:
+            return
+        for handle in self._handles.values():
+            handle.__exit__(None, None, None)
+        self._handles = None
+
+    def __enter__(self) -> "SafetensorsFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_safetensors(file: str | Path, device: str | int = "cpu") -> SafetensorsFile:
+    """
+    Open a safetensors file for lazy, per-tensor access.
+
+    Args:
+        file (Union[str, Path]): The path to the safetensors file, or to the index (or base
+            path) of a sharded checkpoint.
+        device (Union[str, int], optional): The device to load tensors on. Defaults to "cpu".
+
+    Returns:
+        SafetensorsFile: A handle exposing keys(), get_tensor(), get_slice() and metadata().
+    """
+    return SafetensorsFile(file, device=device)
+
+
+def _select_keys(available: list[str], keys: list[str] | None, prefix: str | tuple[str, ...] | None) -> list[str]:
+    if keys is not None:
+        check_list_type(keys, str, var_name="keys")
+        missing = set(keys).difference(available)
+        if missing:
+            raise KeyError(f"Tensors not found: {', '.join(sorted(missing))}")
+        selected = list(dict.fromkeys(keys))
+    else:
+        selected = available
+    if prefix is not None:
+        check_type(prefix, (str, tuple))
+        selected = [key for key in selected if key.startswith(prefix)]
+    return selected
+
+
+def _load_shard(path: Path, keys: list[str], all_keys: bool, device: str | int) -> dict[str, Any]:
+    if all_keys:
+        from safetensors.torch import load_file
+
+        return load_file(path, device=device)
+    with open_safetensors(path, device=device) as f:
+        return {key: f.get_tensor(key) for key in keys}
+
+
+def _load_sharded(
+    index: Path,
+    device: str | int,
+    keys: list[str] | None,
+    prefix: str | tuple[str, ...] | None,
+    workers: int | None,
+) -> dict[str, Any]:
+    from .json_manager import read_json
+
+    weight_map = read_json(index)["weight_map"]
+    selected = _select_keys(list(weight_map), keys, prefix)
+    by_shard: dict[str, list[str]] = {}
+    for key in selected:
+        by_shard.setdefault(weight_map[key], []).append(key)
+    shard_sizes: dict[str, int] = {}
+    for name in weight_map.values():
+        shard_sizes[name] = shard_sizes.get(name, 0) + 1
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Only the shards holding a selected tensor are opened
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_load_shard, index.with_name(name), names, len(names) == shard_sizes[name], device)
+            for name, names in by_shard.items()
+        ]
+        loaded: dict[str, Any] = {}
+        for future in futures:
+            loaded.update(future.result())
+    return {key: loaded[key] for key in selected}
+
+
+def load_safetensors(
+    file: str | Path,
+    device: str | int = "cpu",
+    keys: list[str] | None = None,
+    prefix: str | tuple[str, ...] | None = None,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """
+    Read a safetensors file, or a sharded checkpoint, and return its tensors.
+
+    With keys or prefix, only the selected tensors are read from the memory-mapped file.
+    A sharded checkpoint is loaded through its `.index.json`, either passed directly or
+    found next to a base path such as `model.safetensors` that does not exist itself. Its
+    shards are loaded in parallel threads, and only the shards holding selected tensors
+    are read.
 
     Args:
-        file (Union[str, Path]): The path to the PyTorch file.
-        map_location (Any, optional): A function, torch.device, string or a dict specifying how to remap storage locations.
-        **kwargs: Additional keyword arguments to pass to torch.load.
+        file (Union[str, Path]): The path to the safetensors file, or to the index (or base
+            path) of a sharded checkpoint.
+        device (Union[str, int], optional): The device to load tensors on. Defaults to "cpu".
+        keys (list[str] | None, optional): Only load these tensors. Defaults to None (all).
+        prefix (Union[str, tuple[str, ...], None], optional): Only load the tensors whose name
+            starts with this prefix (or one of these prefixes). Defaults to None.
+        workers (int | None, optional): Number of threads loading shards. Defaults to None
+            (the ThreadPoolExecutor default).
 
     Returns:
-        Any: The object read from the PyTorch file.
+        dict[str, torch.Tensor]: The tensors, keyed by name.
+
+    Raises:
+        KeyError: If one of keys is not in the file.
     """
     check_type(file, (str, Path))
     check_type(device, (str, int))
 
-    from safetensors.torch import load_file
+    index = _index_path(file)
+    if index is not None:
+        return _load_sharded(index, device, keys, prefix, workers)
+
+    if keys is None and prefix is None:
+        from safetensors.torch import load_file
 
-    return load_file(file, device=device)
+        return load_file(file, device=device)
+
+    with open_safetensors(file, device=device) as f:
+        return {key: f.get_tensor(key) for key in _select_keys(f.keys(), keys, prefix)}
+
+
+def _plan_shards(obj: dict[str, Any], max_size: int) -> list[list[str]]:
+    """Pack the tensors, in order, into shards of at most max_size bytes."""
+    shards: list[list[str]] = [[]]
+    size = 0
+    for key, tensor in obj.items():
+        nbytes = tensor.numel() * tensor.element_size()
+        if shards[-1] and size + nbytes > max_size:
+            shards.append([])
+            size = 0
+        shards[-1].append(key)
+        size += nbytes
+    return shards
 
 
 def save_safetensors(
@@ -38,13 +312,30 @@ def save_safetensors(
     force: bool = False,
     silent: bool = False,
     raise_on_exists: bool = False,
+    atomic: bool = True,
+    fsync: str = "none",
+    max_shard_size: int | str | None = None,
 ) -> None:
     """
-    Write an object to a PyTorch file.
+    Write a dictionary of tensors to a safetensors file, or to several shards.
+
+    With max_shard_size, a state dict larger than the limit is split, in order, into shards
+    named like `model-00001-of-00004.safetensors` next to `file`, and a
+    `model.safetensors.index.json` holding `metadata.total_size` and the `weight_map` of
+    each tensor to its shard is written last. A state dict within the limit is written
+    to `file` as usual.
+
+    A checkpoint at the same base path, sharded or not, counts as an existing file. When
+    it is overwritten, no file the previous checkpoint uses is replaced: a new shard whose
+    name the previous index references is written as e.g.
+    `model-00001-of-00004-1a2b3c4d.safetensors` instead, and the files the previous
+    checkpoint used are removed only after the new index (or file) is in place. An
+    interrupted save therefore leaves the previous checkpoint loadable, and removes the
+    shards it had written.
 
     Args:
-        obj (Any): The object to write to the file.
-        file (Union[str, Path]): The path to the output PyTorch file.
+        obj (Any): The dictionary of tensors to write.
+        file (Union[str, Path]): The path to the output safetensors file.
         metadata (dict[str, str] | None, optional): Optional text only metadata you might want to save in your header.
             For instance it can be useful to specify more about the underlying
             tensors. This is purely informative and does not affect tensor loading.
@@ -52,21 +343,79 @@ def save_safetensors(
         silent (bool, optional): If True, suppress print messages. Defaults to False.
         raise_on_exists (bool, optional): If True, raise FileExistsError with full
             traceback instead of exiting cleanly. Defaults to False.
+        atomic (bool, optional): If True, write to a temporary file in the same directory and
+            rename it into place, so the file is never left truncated. Defaults to True.
+        fsync (str, optional): Durability policy: "none", "file" (fsync the file before the
+            rename) or "file+dir" (also fsync the directory). Defaults to "none".
+        max_shard_size (Union[int, str, None], optional): The maximum size of a shard, in bytes
+            or as a string such as "5GB" or "500MiB". A tensor larger than the limit gets a
+            shard of its own. Defaults to None (a single file).
 
     Raises:
-        FileExistsError: If the file exists, force is False, and raise_on_exists is True.
+        FileExistsError: If the file or index exists, force is False, and raise_on_exists is True.
     """
     check_type(file, (str, Path))
-    if os.path.exists(file) and not force:
-        msg = f"[ERROR] {file} already exists."
-        if raise_on_exists:
-            raise FileExistsError(msg)
-        sys.exit(msg)  # exit 1
+    shards = None
+    if max_shard_size is not None:
+        check_type(obj, dict)
+        shards = _plan_shards(obj, parse_size(max_shard_size))
+        if len(shards) == 1:
+            shards = None
+    index = Path(f"{file}{INDEX_SUFFIX}")
+    # A sharded checkpoint and a single file at the same base path replace each other
+    for target in (file, index):
+        if os.path.exists(target) and not force:
+            msg = f"[ERROR] {target} already exists."
+            if raise_on_exists:
+                raise FileExistsError(msg)
+            sys.exit(msg)  # exit 1
     create_parent_dirs(file)
 
     from safetensors.torch import save_file
 
-    save_file(obj, file, metadata=metadata)
+    if shards is None:
+        with atomic_path(file, atomic=atomic, fsync=fsync) as path:
+            save_file(obj, path, metadata=metadata)
+        # A sharded checkpoint at the same base path is replaced by the single file
+        _remove_sharded(index)
+        if not silent:
+            print(f"[INFO] save to {file}")
+        return
+
+    from .json_manager import write_json
+
+    # Read the shards of the checkpoint being replaced before its index is overwritten
+    old_index = _read_weight_files(index)
+    # Shards must not overwrite those the previous index uses until the new index is written,
+    # so colliding names get a tag unique to this save
+    names = {_shard_path(file, i, len(shards)).name for i in range(1, len(shards) + 1)}
+    tag = os.urandom(4).hex() if names & old_index else ""
+    weight_map = {}
+    total_size = 0
+    written = []
+    try:
+        for i, keys in enumerate(shards, start=1):
+            shard = _shard_path(file, i, len(shards), tag)
+            written.append(shard.name)
+            tensors = {key: obj[key] for key in keys}
+            with atomic_path(shard, atomic=atomic, fsync=fsync) as path:
+                save_file(tensors, path, metadata=metadata)
+            weight_map.update(dict.fromkeys(keys, shard.name))
+            total_size += sum(tensor.numel() * tensor.element_size() for tensor in tensors.values())
+
+        # Written after the shards, so an interrupted save leaves the previous index in place
+        index_obj = {"metadata": {**(metadata or {}), "total_size": total_size}, "weight_map": weight_map}
+        write_json(index_obj, index, force=True, silent=True, atomic=atomic, fsync=fsync)
+    except BaseException:
+        # Remove the shards of this save that the index on disk does not reference
+        for name in set(written) - _read_weight_files(index):
+            index.with_name(name).unlink(missing_ok=True)
+        raise
+    # Only now remove what the new index no longer references; a single file at the base
+    # path would otherwise take precedence over the index when loading
+    Path(file).unlink(missing_ok=True)
+    for name in old_index - set(weight_map.values()):
+        index.with_name(name).unlink(missing_ok=True)
 
     if not silent:
-        print(f"[INFO] save to {file}")
+        print(f"[INFO] save {len(shards)} shards to {index}")
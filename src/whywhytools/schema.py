@@ -0,0 +1,233 @@
+"""This module provides decoders that turn JSON objects into typed records in a single validating pass."""
+
+import dataclasses
+import types
+import typing
+from collections.abc import Callable
+from typing import Any
+
+
+_MISSING = object()
+_NONE_TYPE = type(None)
+
+# A field spec: the exact classes the JSON value may have (None for any), and a function
+# converting a value of one of those classes (None to keep it as is). JSON decoders only
+# produce exact instances of these classes, so a set lookup on the class replaces
+# isinstance and keeps bool apart from int.
+_Spec = tuple[frozenset | None, Callable[[Any], Any] | None]
+
+_SCALARS = {
+    str: frozenset({str}),
+    int: frozenset({int}),
+    float: frozenset({float, int}),
+    bool: frozenset({bool}),
+    _NONE_TYPE: frozenset({_NONE_TYPE}),
+    None: frozenset({_NONE_TYPE}),
+    list: frozenset({list}),
+    dict: frozenset({dict}),
+}
+
+
+def is_msgspec_struct(schema: Any) -> bool:
+    """Return True if schema is a msgspec Struct class, without importing msgspec."""
+    return isinstance(schema, type) and any(
+        base.__name__ == "Struct" and base.__module__.startswith("msgspec") for base in schema.__mro__
+    )
+
+
+def _type_names(allowed: frozenset) -> str:
+    return " or ".join(sorted("null" if t is _NONE_TYPE else t.__name__ for t in allowed))
+
+
+def _check(value: Any, allowed: frozenset | None, convert: Callable | None, where: str) -> Any:
+    if allowed is not None and value.__class__ not in allowed:
+        raise TypeError(f"{where} must be {_type_names(allowed)}, got {type(value).__name__}")
+    return value if convert is None else convert(value)
+
+
+def _list_converter(item: _Spec, as_tuple: bool) -> Callable[[list], Any]:
+    allowed, convert = item
+
+    def convert_list(value: list) -> Any:
+        if convert is None and (allowed is None or all(v.__class__ in allowed for v in value)):
+            return tuple(value) if as_tuple else value
+        items = [_check(v, allowed, convert, f"item {i}") for i, v in enumerate(value)]
+        return tuple(items) if as_tuple else items
+
+    return convert_list
+
+
+def _dict_converter(item: _Spec) -> Callable[[dict], dict]:
+    allowed, convert = item
+
+    def convert_dict(value: dict) -> dict:
+        if convert is None and (allowed is None or all(v.__class__ in allowed for v in value.values())):
+            return value
+        return {k: _check(v, allowed, convert, f"value of {k!r}") for k, v in value.items()}
+
+    return convert_dict
+
+
+def _field_spec(tp: Any, parents: tuple[type, ...]) -> _Spec:
+    """Build the spec of a type annotation; parents are the schemas being built around it."""
+    if tp is Any or tp is object:
+        return None, None
+    if tp in _SCALARS:
+        return _SCALARS[tp], None
+    if dataclasses.is_dataclass(tp) or typing.is_typeddict(tp):
+        return frozenset({dict}), _record_decoder(tp, parents)
+
+    origin, args = typing.get_origin(tp), typing.get_args(tp)
+    if origin is list:
+        return frozenset({list}), _list_converter(_field_spec(args[0], parents), as_tuple=False) if args else None
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return frozenset({list}), _list_converter(_field_spec(args[0], parents), as_tuple=True)
+    if origin is dict:
+        return frozenset({dict}), _dict_converter(_field_spec(args[1], parents)) if args else None
+    if origin is typing.Union or origin is types.UnionType:
+        specs = [_field_spec(arg, parents) for arg in args]
+        if any(allowed is None for allowed, _ in specs):
+            return None, None
+        allowed = frozenset().union(*(allowed for allowed, _ in specs))
+        converters = {}
+        for member_allowed, convert in specs:
+            if convert is not None:
+                for cls in member_allowed:
+                    converters.setdefault(cls, convert)
+        if not converters:
+            return allowed, None
+        return allowed, lambda value: converters.get(value.__class__, _identity)(value)
+    raise TypeError(f"Unsupported type annotation in schema: {tp!r}")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# TypedDict class -> the named tuple its records are decoded into
+_record_types: dict[type, type] = {}
+
+
+def _typeddict_record(schema: type) -> type:
+    """
+    Return the named tuple of a TypedDict, created once so that records of the same schema
+    share a class. The class is not importable, so its instances pickle through the
+    TypedDict instead, which lets read_jsonl(cache=True) keep them.
+    """
+    record = _record_types.get(schema)
+    if record is None:
+        from collections import namedtuple
+
+        record = namedtuple(schema.__name__, list(typing.get_type_hints(schema)), rename=True)
+        record.__reduce__ = lambda self: (_rebuild_record, (schema, tuple(self)))
+        _record_types[schema] = record
+    return record
+
+
+def _rebuild_record(schema: type, values: tuple) -> tuple:
+    return _typeddict_record(schema)._make(values)
+
+
+def record_decoder(schema: type) -> Callable[[dict], Any]:
+    """
+    Build a function that validates a decoded JSON object against a schema and returns
+    it as a compact record.
+
+    A dataclass is instantiated with its fields; declare it with slots=True for
+    instances without a per-object __dict__. A TypedDict is turned into a named tuple of
+    the same name and keys, with None for missing keys that are not required. Keys
+    outside the schema are dropped. Values must have the annotated JSON type: str, int,
+    float (which also accepts int), bool, None, Any, list[T], tuple[T, ...] (decoded from
+    an array), dict[str, T], unions and Optional, and nested dataclasses or TypedDicts.
+
+    Args:
+        schema (type): A dataclass or TypedDict class.
+
+    Returns:
+        Callable[[dict], Any]: The decoder. It raises TypeError if a value has the wrong
+        type and ValueError if a required field is missing.
+
+    Raises:
+        TypeError: If schema is not a dataclass or TypedDict, has an unsupported annotation,
+            refers to itself (directly or through nested schemas), or has InitVar fields.
+    """
+    return _record_decoder(schema, ())
+
+
+def _record_decoder(schema: type, parents: tuple[type, ...]) -> Callable[[dict], Any]:
+    if schema in parents:
+        # Each nested schema gets its own unrolled decoder, so a cycle would never end
+        raise TypeError(f"Unsupported recursive schema: {schema.__name__} refers to itself")
+    parents += (schema,)
+    hints = typing.get_type_hints(schema)
+    specs = []
+    keywords = False
+    if dataclasses.is_dataclass(schema) and isinstance(schema, type):
+        for name, tp in hints.items():
+            if tp is dataclasses.InitVar or isinstance(tp, dataclasses.InitVar):
+                # fields() leaves InitVars out, so the decoder could not pass them to __init__
+                raise TypeError(f"Unsupported InitVar field in schema: {schema.__name__}.{name}")
+        for field in dataclasses.fields(schema):
+            if not field.init:
+                continue
+            default, factory = field.default, None
+            if field.default_factory is not dataclasses.MISSING:
+                factory = field.default_factory
+            elif default is dataclasses.MISSING:
+                default = _MISSING
+            keywords = keywords or field.kw_only
+            specs.append((field.name, *_field_spec(hints[field.name], parents), default, factory))
+        make = schema
+    elif typing.is_typeddict(schema):
+        required = schema.__required_keys__
+        for name, tp in hints.items():
+            specs.append((name, *_field_spec(tp, parents), _MISSING if name in required else None, None))
+        make = _typeddict_record(schema)
+    else:
+        raise TypeError(f"schema must be a dataclass, TypedDict or msgspec Struct, got {schema!r}")
+
+    return _compile_decoder(schema.__name__, specs, make, keywords)
+
+
+def _compile_decoder(name: str, specs: list, make: Callable, keywords: bool) -> Callable[[dict], Any]:
+    """
+    Generate the source of a decoder unrolled over the fields, as dataclasses does for
+    __init__, which decodes 1.5 to 2 times faster than a loop over the specs.
+    """
+
+    def fallback(index: int, value: Any) -> Any:
+        # Missing fields and type errors leave the fast path
+        key, allowed, _, default, factory = specs[index]
+        if value is not _MISSING:
+            raise TypeError(f"{name}.{key} must be {_type_names(allowed)}, got {type(value).__name__}")
+        if factory is not None:
+            return factory()
+        if default is _MISSING:
+            raise ValueError(f"{name}.{key} is missing")
+        return default
+
+    namespace = {"_MISSING": _MISSING, "_fallback": fallback, "_make": make}
+    lines = [
+        "def decode(obj):",
+        "    if obj.__class__ is not dict:",
+        f"        raise TypeError('{name} must be decoded from a JSON object, got ' + type(obj).__name__)",
+        "    get = obj.get",
+    ]
+    for i, (key, allowed, convert, _, _) in enumerate(specs):
+        namespace[f"_allowed{i}"], namespace[f"_convert{i}"] = allowed, convert
+        lines.append(f"    v{i} = get({key!r}, _MISSING)")
+        if allowed is None:
+            lines += [f"    if v{i} is _MISSING:", f"        v{i} = _fallback({i}, v{i})"]
+            if convert is not None:
+                lines += ["    else:", f"        v{i} = _convert{i}(v{i})"]
+        else:
+            lines.append(f"    if v{i}.__class__ in _allowed{i}:")
+            lines.append(f"        v{i} = _convert{i}(v{i})" if convert is not None else "        pass")
+            lines += ["    else:", f"        v{i} = _fallback({i}, v{i})"]
+    if keywords:
+        arguments = ", ".join(f"{key}=v{i}" for i, (key, *_) in enumerate(specs))
+    else:
+        arguments = ", ".join(f"v{i}" for i in range(len(specs)))
+    lines.append(f"    return _make({arguments})")
+    exec("\n".join(lines), namespace)
+    return namespace["decode"]
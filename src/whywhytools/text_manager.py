@@ -2,13 +2,72 @@
 
 import os
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+from .compression import open_file, resolve_compression
 from .type_checker import check_list_type, check_type
-from .utils import create_parent_dirs
+from .utils import atomic_path, create_parent_dirs, iter_mmap_lines
 
 
-def read_file(file: str | Path, lines: bool = False) -> str | list[str]:
+def _iter_lines(file: str | Path, use_mmap: bool, compression: str | None) -> Iterator[str]:
+    if use_mmap:
+        for line in iter_mmap_lines(file):
+            yield line.decode("utf-8").removesuffix("\r")
+        return
+    with open_file(file, mode="r", compression=compression) as reader:
+        for line in reader:
+            yield line.removesuffix("\n")
+
+
+def _read_mmap(file: str | Path) -> str:
+    """Decode a whole file from a memory mapping, translating newlines as text mode does."""
+    import mmap
+
+    with open(file, mode="rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return ""
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Decoding from the mapping skips the bytes copy that read() holds next to the string
+            content = str(mm, "utf-8")
+            if mm.find(b"\r") == -1:
+                return content
+    return content.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def iter_file(file: str | Path, mmap: bool = False, compression: str | None = "infer") -> Iterator[str]:
+    """
+    Lazily read a text file and yield its lines without the trailing newline.
+
+    Args:
+        file (Union[str, Path]): The path to the text file.
+        mmap (bool, optional): If True, memory-map the file and scan it for newlines in place,
+            so only the current line is held in memory. Lines are split on "\n" and "\r\n".
+            Defaults to False.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+
+    Returns:
+        Iterator[str]: An iterator over the lines of the file.
+
+    Raises:
+        ValueError: If mmap is True for a compressed file.
+    """
+    check_type(file, (str, Path))
+    compression = resolve_compression(file, compression)
+    if mmap and compression is not None:
+        raise ValueError("mmap cannot be used with compressed files")
+
+    return _iter_lines(file, mmap, compression)
+
+
+def read_file(
+    file: str | Path,
+    lines: bool = False,
+    compression: str | None = "infer",
+    mmap: bool = False,
+) -> str | list[str]:
     """
     Read a text file and return its content.
 
@@ -16,13 +75,30 @@ def read_file(file: str | Path, lines: bool = False) -> str | list[str]:
         file (Union[str, Path]): The path to the text file.
         lines (bool, optional): If True, return a list of strings, one for each line.
             Defaults to False.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        mmap (bool, optional): If True, memory-map the file instead of reading it into a
+            buffer. With lines=True, the list is built from a scan of the mapping instead of
+            splitting one string holding the whole file, and lines are split on "\n" and
+            "\r\n". With lines=False, the string is decoded straight from the mapping, without
+            the intermediate copy of the bytes. Either way this halves the peak memory the
+            process allocates; the mapped pages belong to the page cache. Defaults to False.
 
     Returns:
         Union[str, list[str]]: The content of the file as a single string or a list of strings.
+
+    Raises:
+        ValueError: If mmap is True for a compressed file.
     """
     check_type(file, (str, Path))
+    if mmap:
+        if lines:
+            return list(iter_file(file, mmap=True, compression=compression))
+        if resolve_compression(file, compression) is not None:
+            raise ValueError("mmap cannot be used with compressed files")
+        return _read_mmap(file)
 
-    with open(file, mode="r", encoding="utf-8") as reader:
+    with open_file(file, mode="r", compression=compression) as reader:
         content = reader.read()
         if lines:
             content = content.splitlines()
@@ -36,6 +112,10 @@ def write_file(
     force: bool = False,
     silent: bool = False,
     raise_on_exists: bool = False,
+    compression: str | None = "infer",
+    validate: str = "full",
+    atomic: bool = True,
+    fsync: str = "none",
 ) -> None:
     """
     Write a string or a list of strings to a text file.
@@ -47,6 +127,14 @@ def write_file(
         silent (bool, optional): If True, suppress print messages. Defaults to False.
         raise_on_exists (bool, optional): If True, raise FileExistsError with full
             traceback instead of exiting cleanly. Defaults to False.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        validate (str, optional): How many lines to type-check: "full", "sample" (at most
+            1000 evenly spaced lines) or "off". Defaults to "full".
+        atomic (bool, optional): If True, write to a temporary file in the same directory and
+            rename it into place, so the file is never left truncated. Defaults to True.
+        fsync (str, optional): Durability policy: "none", "file" (fsync the file before the
+            rename) or "file+dir" (also fsync the directory). Defaults to "none".
 
     Raises:
         FileExistsError: If the file exists, force is False, and raise_on_exists is True.
@@ -61,9 +149,13 @@ def write_file(
 
     if isinstance(lines, str):
         lines = [lines]
-    check_list_type(lines, str)
+    check_list_type(lines, str, validate=validate)
+    compression = resolve_compression(file, compression)
 
-    with open(file, mode="w", encoding="utf-8", newline="\n") as fp:
+    with (
+        atomic_path(file, atomic=atomic, fsync=fsync) as path,
+        open_file(path, mode="w", compression=compression, newline="\n") as fp,
+    ):
         for line in lines:
             print(line, file=fp)
 
@@ -71,21 +163,30 @@ def write_file(
         print(f"[INFO] save to {file}")
 
 
-def append_file(lines: str | list[str], file: str | Path) -> None:
+def append_file(
+    lines: str | list[str],
+    file: str | Path,
+    compression: str | None = "infer",
+    validate: str = "full",
+) -> None:
     """
     Append a string or a list of strings to an existing text file.
 
     Args:
         lines (Union[str, list[str]]): A single string or a list of strings to append.
         file (Union[str, Path]): The path to the text file.
+        compression (str | None, optional): The compression codec, "infer" to detect it from
+            the file extension, or None for no compression. Defaults to "infer".
+        validate (str, optional): How many lines to type-check: "full", "sample" (at most
+            1000 evenly spaced lines) or "off". Defaults to "full".
     """
     check_type(file, (str, Path))
     create_parent_dirs(file)
 
     if isinstance(lines, str):
         lines = [lines]
-    check_list_type(lines, str)
+    check_list_type(lines, str, validate=validate)
 
-    with open(file, mode="a", encoding="utf-8", newline="\n") as fp:
+    with open_file(file, mode="a", compression=compression, newline="\n") as fp:
         for line in lines:
             print(line, file=fp)
@@ -6,10 +6,16 @@ from pathlib import Path
 from typing import Any
 
 from .type_checker import check_type
-from .utils import create_parent_dirs
+from .utils import atomic_path, create_parent_dirs
 
 
-def load_pt(file: str | Path, map_location: Any = None, weights_only: bool = False, **kwargs: Any) -> Any:
+def load_pt(
+    file: str | Path,
+    map_location: Any = None,
+    weights_only: bool = False,
+    mmap: bool | None = None,
+    **kwargs: Any,
+) -> Any:
     """
     Read a PyTorch file and return the loaded object.
 
@@ -17,6 +23,10 @@ def load_pt(file: str | Path, map_location: Any = None, weights_only: bool = Fal
         file (Union[str, Path]): The path to the PyTorch file.
         map_location (Any, optional): A function, torch.device, string or a dict specifying how to remap storage locations.
         weights_only (bool, optional): If True, only weights will be loaded. Defaults to False.
+        mmap (bool | None, optional): If True, memory-map the file so tensor storages are
+            paged in on access instead of being copied into RAM up front. Requires
+            torch >= 2.1. Defaults to None (True when weights_only is True, torch supports
+            it and the file uses the zip format of torch >= 1.6, which mmap requires).
         **kwargs: Additional keyword arguments to pass to torch.load.
 
     Returns:
@@ -25,15 +35,62 @@ def load_pt(file: str | Path, map_location: Any = None, weights_only: bool = Fal
     check_type(file, (str, Path))
     import torch
 
+    if mmap is None:
+        import zipfile
+
+        version = tuple(int(part) for part in torch.__version__.split(".")[:2])
+        mmap = weights_only and version >= (2, 1) and zipfile.is_zipfile(file)
+    if mmap:
+        # Only passed when set, since torch < 2.1 has no mmap argument
+        kwargs["mmap"] = True
+
     return torch.load(file, map_location=map_location, weights_only=weights_only, **kwargs)
 
 
+def _flatten_tensors(obj: Any, prefix: str, out: dict[str, dict]) -> None:
+    if isinstance(obj, dict):
+        items = obj.items()
+    elif isinstance(obj, (list, tuple)):
+        items = enumerate(obj)
+    else:
+        if hasattr(obj, "dtype") and hasattr(obj, "shape"):
+            out[prefix] = {"dtype": str(obj.dtype).removeprefix("torch."), "shape": list(obj.shape)}
+        return
+    for key, value in items:
+        _flatten_tensors(value, f"{prefix}.{key}" if prefix else str(key), out)
+
+
+def inspect_pt(file: str | Path, weights_only: bool = True) -> dict[str, dict]:
+    """
+    List the tensors of a PyTorch file with their dtypes and shapes, without reading their data.
+
+    The file is loaded onto the "meta" device, which keeps the tensor metadata and skips
+    the storages, so even very large checkpoints are inspected in milliseconds. Nested
+    dicts, lists and tuples are flattened into dotted keys such as `model.layer.weight`
+    or `optimizer.0`; other values are left out.
+
+    Args:
+        file (Union[str, Path]): The path to the PyTorch file.
+        weights_only (bool, optional): If True, refuse to unpickle arbitrary objects.
+            Defaults to True.
+
+    Returns:
+        dict[str, dict]: Maps each tensor key to {"dtype": str, "shape": list[int]}.
+    """
+    check_type(file, (str, Path))
+    out: dict[str, dict] = {}
+    _flatten_tensors(load_pt(file, map_location="meta", weights_only=weights_only), "", out)
+    return out
+
+
 def save_pt(
     obj: Any,
     file: str | Path,
     force: bool = False,
     silent: bool = False,
     raise_on_exists: bool = False,
+    atomic: bool = True,
+    fsync: str = "none",
     **kwargs: Any,
 ) -> None:
     """
@@ -46,6 +103,10 @@ def save_pt(
         silent (bool, optional): If True, suppress print messages. Defaults to False.
         raise_on_exists (bool, optional): If True, raise FileExistsError with full
             traceback instead of exiting cleanly. Defaults to False.
+        atomic (bool, optional): If True, write to a temporary file in the same directory and
+            rename it into place, so the file is never left truncated. Defaults to True.
+        fsync (str, optional): Durability policy: "none", "file" (fsync the file before the
+            rename) or "file+dir" (also fsync the directory). Defaults to "none".
         **kwargs: Additional keyword arguments to pass to torch.save.
 
     Raises:
@@ -61,7 +122,8 @@ def save_pt(
 
     import torch
 
-    torch.save(obj, file, **kwargs)
+    with atomic_path(file, atomic=atomic, fsync=fsync) as path:
+        torch.save(obj, path, **kwargs)
 
     if not silent:
         print(f"[INFO] save to {file}")
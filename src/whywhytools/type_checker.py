@@ -1,10 +1,13 @@
 """This module provides utility functions for type checking."""
 
-import inspect
-import re
+from itertools import repeat
 from typing import Any
 
 
+VALIDATE_MODES = ("full", "sample", "off")
+SAMPLE_SIZE = 1000
+
+
 def get_var_name(variable: Any, back_frames: int = 2) -> str:
     """
     Attempt to find the name of the variable in the caller's frames.
@@ -17,6 +20,10 @@ def get_var_name(variable: Any, back_frames: int = 2) -> str:
     Returns:
         str: The name of the variable if found, otherwise "variable".
     """
+    # Only needed on the failure path, so they are not imported with the package
+    import inspect
+    import re
+
     try:
         frame = inspect.currentframe()
         prev_frame = None
@@ -71,25 +78,50 @@ def check_type(variable: Any, expected_type: type | tuple[type, ...], var_name:
         raise TypeError(f"{var_name} must be {type_names}, got {type(variable).__name__}")
 
 
-def check_list_type(variable_list: Any, expected_type: type | tuple[type, ...], var_name: str = None):
+def check_list_type(
+    variable_list: Any,
+    expected_type: type | tuple[type, ...],
+    var_name: str = None,
+    validate: str = "full",
+):
     """
     Check if a variable is a list and all its elements are instances of the expected type(s).
 
+    The element check runs as a single C-level pass, and the variable name is only looked
+    up when the check fails, so a passing check costs close to nothing.
+
     Args:
         variable_list (Any): The variable to check.
         expected_type (Union[type, Tuple[type, ...]]): The expected type or a tuple of expected types for the elements.
         var_name (str, optional): The name of the variable to use in the error message.
                                   If None, an attempt is made to detect it automatically.
+        validate (str, optional): How many elements to check: "full" checks every element,
+            "sample" checks at most 1000 evenly spaced elements, and "off" only checks that
+            the variable is a list. Defaults to "full".
 
     Raises:
         TypeError: If the variable is not a list, or if any element is not an instance of the expected type(s).
+        ValueError: If validate is not a known mode.
     """
-    if var_name is None:
-        var_name = get_var_name(variable_list)
+    if validate not in VALIDATE_MODES:
+        raise ValueError(f"validate must be one of {', '.join(VALIDATE_MODES)}, got {validate}")
 
     if not isinstance(variable_list, list):
+        if var_name is None:
+            var_name = get_var_name(variable_list)
         raise TypeError(f"{var_name} must be a list, got {type(variable_list).__name__}")
 
+    if validate == "off":
+        return
+    items = variable_list
+    if validate == "sample" and len(items) > SAMPLE_SIZE:
+        # Ceiling division, so that the stride never yields more than SAMPLE_SIZE elements
+        items = items[:: -(-len(items) // SAMPLE_SIZE)]
+    if all(map(isinstance, items, repeat(expected_type))):
+        return
+
+    if var_name is None:
+        var_name = get_var_name(variable_list)
     for i, item in enumerate(variable_list):
         if not isinstance(item, expected_type):
             if isinstance(expected_type, tuple):
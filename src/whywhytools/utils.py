@@ -1,11 +1,193 @@
 """This module provides common file system utilities."""
 
+import mmap
 import os
+import stat
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+from .type_checker import check_type
+
 
 def create_parent_dirs(file: str | Path) -> None:
     """Ensure the parent directories of a file exist."""
     dir_path = os.path.dirname(file)
     if dir_path != "":
         os.makedirs(dir_path, exist_ok=True)
+
+
+FSYNC_POLICIES = ("none", "file", "file+dir")
+
+
+def _fsync_file(file: str | Path) -> None:
+    fd = os.open(file, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(dir_path: str) -> None:
+    if os.name != "posix":
+        # Directories cannot be opened for fsync on Windows
+        return
+    fd = os.open(dir_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_path(file: str | Path, atomic: bool = True, fsync: str = "none") -> Iterator[str | Path]:
+    """
+    Yield the path a writer should write to so that `file` is replaced atomically.
+
+    With atomic=True, the yielded path is a temporary file in the same directory that is
+    renamed onto `file` once the block exits cleanly, and removed if it raises. A killed
+    process therefore never leaves a truncated `file` behind. If `file` is a symlink, the
+    file it points to is replaced and the link is kept.
+
+    Args:
+        file (Union[str, Path]): The path of the final file.
+        atomic (bool, optional): If False, yield `file` itself. Defaults to True.
+        fsync (str, optional): Durability policy: "none", "file" (fsync the file before the
+            rename) or "file+dir" (also fsync the directory after the rename). Defaults to "none".
+
+    Returns:
+        Iterator[Union[str, Path]]: A context manager yielding the path to write to.
+
+    Raises:
+        ValueError: If fsync is not a known policy.
+    """
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}, got {fsync}")
+    # Write through symlinks: renaming onto the link itself would replace it with a regular file
+    target = os.path.realpath(file)
+    dir_path = os.path.dirname(target)
+
+    if not atomic:
+        yield file
+        if fsync != "none":
+            _fsync_file(file)
+        if fsync == "file+dir":
+            _fsync_dir(dir_path)
+        return
+
+    tmp_path = os.path.join(dir_path, f".{os.path.basename(target)}.{os.urandom(4).hex()}.tmp")
+    try:
+        yield tmp_path
+        if os.path.exists(target):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(target).st_mode))
+        if fsync != "none":
+            _fsync_file(tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if fsync == "file+dir":
+        _fsync_dir(dir_path)
+
+
+@contextmanager
+def file_lock(fd: int, shared: bool = False) -> Iterator[None]:
+    """
+    Hold an advisory `flock` lock on an open file for the duration of the block.
+
+    The lock is shared between the processes that cooperate by taking it too; it does not
+    stop other writers.
+
+    Args:
+        fd (int): The file descriptor of the open file.
+        shared (bool, optional): If True, take a shared (read) lock instead of an
+            exclusive one. Defaults to False.
+
+    Returns:
+        Iterator[None]: A context manager holding the lock.
+
+    Raises:
+        NotImplementedError: If the platform has no fcntl module (Windows).
+    """
+    try:
+        import fcntl
+    except ImportError as e:
+        raise NotImplementedError("File locking requires fcntl, which is not available on this platform") from e
+
+    fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def iter_mmap_lines(file: str | Path) -> Iterator[bytes]:
+    """
+    Memory-map a file and yield its lines as bytes, without the trailing newline.
+
+    Newlines are searched directly in the mapped buffer and only the current line is
+    copied out, so the resident footprint stays near zero regardless of the file size.
+
+    Args:
+        file (Union[str, Path]): The path to the file.
+
+    Returns:
+        Iterator[bytes]: An iterator over the lines of the file.
+    """
+    with open(file, mode="rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            # Empty files cannot be mapped
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            find = mm.find
+            start = 0
+            while start < size:
+                end = find(b"\n", start)
+                if end == -1:
+                    end = size
+                yield mm[start:end]
+                start = end + 1
+
+
+_SIZE_UNITS = {
+    "B": 1,
+    "KB": 10**3,
+    "MB": 10**6,
+    "GB": 10**9,
+    "TB": 10**12,
+    "KIB": 1 << 10,
+    "MIB": 1 << 20,
+    "GIB": 1 << 30,
+    "TIB": 1 << 40,
+}
+
+
+def parse_size(size: int | str) -> int:
+    """
+    Convert a size such as "5GB" (decimal units) or "512MiB" (binary units) to bytes.
+
+    Args:
+        size (Union[int, str]): A number of bytes, or a number followed by a unit.
+
+    Returns:
+        int: The size in bytes.
+
+    Raises:
+        ValueError: If the size cannot be parsed.
+    """
+    if isinstance(size, int):
+        return size
+    check_type(size, str)
+    text = size.strip().upper()
+    number = text.rstrip("KMGTIB ")
+    unit = text[len(number) :].strip() or "B"
+    if unit not in _SIZE_UNITS or not number:
+        raise ValueError(f"Cannot parse size: {size}")
+    try:
+        return int(float(number) * _SIZE_UNITS[unit])
+    except ValueError:
+        raise ValueError(f"Cannot parse size: {size}") from None
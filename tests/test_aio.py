@@ -0,0 +1,111 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from whywhytools import aio
+from whywhytools.jsonl_manager import read_jsonl, write_jsonl
+from whywhytools.text_manager import read_file
+
+
+def test_async_functions(tmp_path: Path):
+    async def main():
+        json_file = tmp_path / "data.json"
+        await aio.awrite_json({"key": "value"}, json_file, silent=True)
+        jsonl_file = tmp_path / "data.jsonl"
+        # Many operations in flight at once
+        await asyncio.gather(
+            aio.awrite_jsonl([{"a": 1}], jsonl_file, silent=True),
+            aio.asave_pickle([1, 2, 3], tmp_path / "data.pkl", silent=True),
+            aio.awrite_file(["x", "y"], tmp_path / "data.txt", silent=True),
+        )
+        return await asyncio.gather(
+            aio.aread_json(json_file),
+            aio.aread_jsonl(jsonl_file),
+            aio.aload_pickle(tmp_path / "data.pkl"),
+            aio.aread_file(tmp_path / "data.txt", lines=True),
+        )
+
+    assert asyncio.run(main()) == [{"key": "value"}, [{"a": 1}], [1, 2, 3], ["x", "y"]]
+    assert aio.aread_json.__name__ == "aread_json"
+
+
+def test_async_iterators(tmp_path: Path):
+    jsonl_file = tmp_path / "data.jsonl"
+    data = [{"id": i} for i in range(25)]
+    write_jsonl(data, jsonl_file, silent=True)
+    text_file = tmp_path / "data.txt"
+    text_file.write_text("a\nb\nc\n")
+
+    async def main():
+        records = [obj async for obj in aio.aiter_jsonl(jsonl_file, batch_size=4)]
+        lines = [line async for line in aio.aiter_file(text_file, batch_size=2)]
+        skipped = [obj async for obj in aio.aiter_jsonl(jsonl_file, skip=20)]
+        return records, lines, skipped
+
+    assert asyncio.run(main()) == (data, ["a", "b", "c"], data[20:])
+
+
+def test_async_jsonl_writer(tmp_path: Path):
+    test_file = tmp_path / "out.jsonl"
+    data = [{"id": i} for i in range(100)]
+
+    async def main():
+        async with aio.AsyncJsonlWriter(test_file, mode="w", max_pending=8, batch_size=16) as writer:
+            for obj in data:
+                await writer.write(obj)
+            await writer.flush()
+            assert not test_file.exists()  # renamed into place on close
+        assert read_jsonl(test_file) == data
+        async with aio.AsyncJsonlWriter(test_file) as writer:
+            await writer.write({"id": 100})
+            await writer.flush()
+            assert read_jsonl(test_file) == data + [{"id": 100}]
+
+        # A failed block leaves the previous file untouched
+        with pytest.raises(RuntimeError):
+            async with aio.AsyncJsonlWriter(test_file, mode="w", force=True) as writer:
+                await writer.write({"id": -1})
+                await writer.flush()
+                raise RuntimeError
+        assert list(tmp_path.iterdir()) == [test_file]
+
+    asyncio.run(main())
+    assert read_jsonl(test_file) == data + [{"id": 100}]
+
+
+def test_async_text_writer(tmp_path: Path):
+    test_file = tmp_path / "out.txt.gz"
+
+    async def main():
+        async with aio.AsyncTextWriter(test_file, mode="w") as writer:
+            for line in ["one", "two"]:
+                await writer.write(line)
+            with pytest.raises(TypeError):
+                await writer.write(3)
+
+    asyncio.run(main())
+    assert read_file(test_file, lines=True) == ["one", "two"]
+
+
+def test_async_writer_errors(tmp_path: Path):
+    test_file = tmp_path / "out.jsonl"
+    test_file.touch()
+
+    async def main():
+        with pytest.raises(FileExistsError):
+            async with aio.AsyncJsonlWriter(test_file, mode="w"):
+                pass
+        with pytest.raises(RuntimeError, match="not open"):
+            await aio.AsyncJsonlWriter(test_file).write({})
+        with pytest.raises(TypeError):
+            async with aio.AsyncJsonlWriter(test_file) as writer:
+                await writer.write({"bad": object()})
+
+    asyncio.run(main())
+    with pytest.raises(ValueError):
+        aio.AsyncJsonlWriter(test_file, mode="r")
+    with pytest.raises(ValueError, match="batch_size"):
+        aio.AsyncTextWriter(test_file, batch_size=0)
+    with pytest.raises(ValueError):
+        aio.set_max_workers(0)
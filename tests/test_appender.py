@@ -0,0 +1,82 @@
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from whywhytools.appender import JsonlAppender, TextAppender
+from whywhytools.jsonl_index import build_jsonl_index, is_jsonl_index_valid
+from whywhytools.jsonl_manager import read_jsonl
+from whywhytools.text_manager import read_file
+
+
+def test_jsonl_appender(tmp_path: Path):
+    test_file = tmp_path / "logs" / "out.jsonl"
+    with JsonlAppender(test_file, flush_bytes=1 << 20, flush_interval=None) as log:
+        log.write({"id": 0})
+        assert test_file.read_bytes() == b""  # still buffered
+        log.flush()
+        assert read_jsonl(test_file) == [{"id": 0}]
+        log.write_many({"id": i} for i in range(1, 5))
+    assert log.closed
+    assert read_jsonl(test_file) == [{"id": i} for i in range(5)]
+
+    with pytest.raises(ValueError):
+        log.write({"id": 5})
+    with JsonlAppender(test_file, flush_bytes=1) as log:
+        log.write({"id": 5})
+        assert read_jsonl(test_file)[-1] == {"id": 5}
+        with pytest.raises(TypeError):
+            log.write([1])
+        with pytest.raises(TypeError, match="at index 1"):
+            log.write_many([{"id": 6}, 7])  # lists are checked before anything is appended
+    assert read_jsonl(test_file)[-1] == {"id": 5}
+
+
+def test_jsonl_appender_index_and_finalizer(tmp_path: Path):
+    test_file = tmp_path / "out.jsonl"
+    with JsonlAppender(test_file) as log:
+        log.write({"id": 0})
+    build_jsonl_index(test_file)
+
+    with JsonlAppender(test_file, flush_bytes=1) as log:
+        log.write_many([{"id": 1}, {"id": 2}])
+        assert is_jsonl_index_valid(test_file)  # extended on flush
+
+    log = JsonlAppender(test_file, flush_interval=None)
+    log.write({"id": 3})
+    del log  # never closed: the buffer is written when it is collected
+    assert read_jsonl(test_file) == [{"id": i} for i in range(4)]
+    assert is_jsonl_index_valid(test_file)
+
+
+def test_text_appender(tmp_path: Path):
+    test_file = tmp_path / "out.txt.gz"
+    with TextAppender(test_file, flush_interval=0) as log:
+        log.write("first")
+        log.write_many(["second", "third"])
+    with TextAppender(test_file) as log:
+        log.write("fourth")
+    assert read_file(test_file, lines=True) == ["first", "second", "third", "fourth"]
+
+    with pytest.raises(ValueError, match="lock"):
+        TextAppender(test_file, lock=True)
+
+
+def _append_worker(file: Path, worker: int) -> None:
+    with JsonlAppender(file, flush_bytes=256, lock=True) as log:
+        for i in range(500):
+            log.write({"worker": worker, "i": i, "pad": "x" * 50})
+
+
+def test_jsonl_appender_lock(tmp_path: Path):
+    test_file = tmp_path / "shared.jsonl"
+    processes = [multiprocessing.Process(target=_append_worker, args=(test_file, w)) for w in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    records = read_jsonl(test_file)
+    assert len(records) == 2000
+    for w in range(4):
+        assert [obj["i"] for obj in records if obj["worker"] == w] == list(range(500))
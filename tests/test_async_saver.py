@@ -0,0 +1,63 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from whywhytools.async_saver import AsyncSaver
+from whywhytools.json_manager import read_json
+from whywhytools.pickle_manager import load_pickle
+
+
+def test_async_saver(tmp_path: Path):
+    data = {"values": [1, 2, 3]}
+    with AsyncSaver(copy=True) as saver:
+        future = saver.save_pickle(data, tmp_path / "data.pkl", silent=True)
+        saver.write_json(data, tmp_path / "data.json", silent=True)
+        data["values"].append(4)  # the queued copy is unaffected
+        assert future.result() is None
+    assert load_pickle(tmp_path / "data.pkl") == {"values": [1, 2, 3]}
+    assert read_json(tmp_path / "data.json") == {"values": [1, 2, 3]}
+
+    with pytest.raises(RuntimeError):
+        saver.submit(print)
+
+
+def test_async_saver_backpressure_and_order(tmp_path: Path):
+    release = threading.Event()
+    order = []
+    saver = AsyncSaver(max_pending=1)
+    saver.submit(release.wait)
+    saver.submit(order.append, 1)  # fills the queue
+    blocked = threading.Thread(target=saver.submit, args=(order.append, 2))
+    blocked.start()
+    blocked.join(timeout=0.1)
+    assert blocked.is_alive()  # submitting waits while the queue is full
+    release.set()
+    blocked.join()
+    assert saver.wait_all() == []  # only failed futures are kept
+    assert order == [1, 2]
+    assert not saver._pending
+    saver.close()
+
+
+def test_async_saver_errors(tmp_path: Path):
+    test_file = tmp_path / "data.json"
+    test_file.write_text("{}")
+
+    saver = AsyncSaver()
+    future = saver.write_json({}, test_file)  # raises instead of exiting the thread
+    with pytest.raises(FileExistsError):
+        future.result()
+    assert saver.wait_all(raise_on_error=False) == [future]
+    saver.write_json({}, test_file)
+    with pytest.raises(FileExistsError):
+        saver.wait_all()
+    assert saver.wait_all() == []
+    saver.close()
+
+    with pytest.raises(SystemExit), AsyncSaver() as saver:
+        saver.write_json({}, test_file, raise_on_exists=False).result()
+    with pytest.raises(FileExistsError), AsyncSaver() as saver:
+        saver.write_json({}, test_file)
+    with pytest.raises(ValueError):
+        AsyncSaver(max_pending=0)
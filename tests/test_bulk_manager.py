@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from whywhytools.bulk_manager import ReadManyError, infer_loader, read_many
+from whywhytools.json_manager import read_json, write_json
+from whywhytools.jsonl_manager import read_jsonl, write_jsonl
+from whywhytools.pickle_manager import load_pickle, save_pickle
+
+
+def test_read_many_order_and_glob(tmp_path: Path):
+    files = [tmp_path / f"{i:02d}.json" for i in range(12)]
+    for i, file in enumerate(reversed(files)):
+        write_json({"i": i}, file, silent=True)
+
+    expected = [read_json(file) for file in files]
+    assert read_many(files, workers=4) == expected
+    assert read_many(str(tmp_path / "*.json"), workers=4) == expected
+    assert read_many(files, workers=1) == expected
+    assert read_many(files, executor="process", workers=2) == expected
+    assert read_many(files[:2], as_dict=True) == dict(zip(files[:2], expected[:2]))
+
+
+def test_read_many_infers_loader(tmp_path: Path):
+    save_pickle([1, 2], tmp_path / "a.pkl.gz", silent=True)
+    write_jsonl([{"a": 1}], tmp_path / "b.jsonl", silent=True)
+    (tmp_path / "c.txt").write_text("text\n")
+
+    assert infer_loader("a.pkl.gz") is load_pickle
+    assert infer_loader("b.jsonl") is read_jsonl
+    assert read_many([tmp_path / "a.pkl.gz", tmp_path / "b.jsonl", tmp_path / "c.txt"]) == [
+        [1, 2],
+        [{"a": 1}],
+        "text\n",
+    ]
+    assert read_many([tmp_path / "c.txt"], loader=lambda p: Path(p).name) == ["c.txt"]
+
+    with pytest.raises(ValueError, match="loader"):
+        read_many([tmp_path / "data.csv"])
+
+
+def test_read_many_errors(tmp_path: Path):
+    good = tmp_path / "good.json"
+    write_json({"ok": True}, good, silent=True)
+    missing = tmp_path / "missing.json"
+
+    with pytest.raises(ReadManyError) as exc_info:
+        read_many([good, missing, good], workers=2)
+    assert list(exc_info.value.errors) == [missing]
+    assert exc_info.value.results[0] == {"ok": True}
+    assert isinstance(exc_info.value.results[1], FileNotFoundError)
+
+    results = read_many([missing, good], errors="return")
+    assert isinstance(results[0], FileNotFoundError)
+    assert results[1] == {"ok": True}
+
+    with pytest.raises(ValueError):
+        read_many([good], executor="fiber")
+    with pytest.raises(ValueError):
+        read_many([good], workers=0)
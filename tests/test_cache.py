@@ -0,0 +1,85 @@
+import os
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+import pytest
+
+from whywhytools.cache import disk_cache
+
+
+def test_disk_cache(tmp_path: Path):
+    calls = []
+
+    @disk_cache(tmp_path / "cache")
+    def square(x, power=2):
+        calls.append(x)
+        return {"value": x**power}
+
+    assert square(3) == {"value": 9}
+    assert square(3) == {"value": 9}
+    assert square(x=3, power=2) == {"value": 9}  # same bound arguments, same entry
+    assert square(3, 3) == {"value": 27}
+    assert calls == [3, 3]
+    assert square.cache_path(3).exists()
+    assert square.cache_path(3).suffix == ".pkl"
+    assert square.__name__ == "square"
+
+
+def test_disk_cache_json(tmp_path: Path):
+    @disk_cache(tmp_path, format="json")
+    def words(text):
+        return {"words": text.split()}
+
+    assert words("a b c") == {"words": ["a", "b", "c"]}
+    assert words.cache_path("a b c").suffix == ".json"
+    assert words("a b c") == {"words": ["a", "b", "c"]}
+
+    @disk_cache(tmp_path, format="json")
+    def pair(x):
+        return {"pair": (x, x)}
+
+    assert pair(1) == pair(1) == {"pair": [1, 1]}  # the filling call also returns lists
+
+
+def test_disk_cache_max_size(tmp_path: Path):
+    @disk_cache(tmp_path, max_size=2500)
+    def blob(i):
+        return bytes(1000)
+
+    for i in range(3):
+        blob(i)
+        os.utime(blob.cache_path(i), ns=(i, i))
+    blob(0)  # touches entry 0, leaving entry 1 the least recently used
+    blob(3)
+    assert len(list(tmp_path.glob("*.pkl"))) == 2
+    assert not blob.cache_path(1).exists()
+    assert blob.cache_path(0).exists() and blob.cache_path(3).exists()
+
+
+def test_disk_cache_invalid_format(tmp_path: Path):
+    with pytest.raises(ValueError):
+        disk_cache(tmp_path, format="yaml")
+
+
+def _slow_fill(key, counter):
+    with open(counter, "a") as f:
+        f.write("x")
+    time.sleep(0.05)
+    return key
+
+
+def _cached_fill(cache_dir, key, counter):
+    # Decorated in the worker, so the cache directory can come from tmp_path
+    return disk_cache(cache_dir)(_slow_fill)(key, counter)
+
+
+def test_disk_cache_concurrent_fill(tmp_path: Path):
+    pytest.importorskip("fcntl")
+    counter = tmp_path / "counter"
+    cache_dir = tmp_path / "cache"
+    with Pool(4) as pool:
+        args = [(cache_dir, "k", str(counter))] * 8
+        assert pool.starmap(_cached_fill, args) == ["k"] * 8
+    assert counter.read_text() == "x"
+    assert [path.suffix for path in cache_dir.iterdir()] == [".pkl"]  # no lock file is left
@@ -0,0 +1,89 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from whywhytools.compression import infer_compression, open_file
+from whywhytools.json_manager import read_json, write_json
+from whywhytools.jsonl_manager import append_jsonl, iter_jsonl, parallel_read_jsonl, read_jsonl, write_jsonl
+from whywhytools.pickle_manager import load_pickle, save_pickle
+from whywhytools.text_manager import append_file, read_file, write_file
+
+
+def _available(ext: str) -> bool:
+    codec = infer_compression(f"x{ext}")
+    module = {"zstd": "zstandard", "lz4": "lz4"}.get(codec)
+    if module is None:
+        return True
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+EXTENSIONS = [
+    pytest.param(ext, marks=pytest.mark.skipif(not _available(ext), reason="codec not installed"))
+    for ext in (".gz", ".bz2", ".xz", ".zst", ".lz4")
+]
+
+
+def test_infer_compression():
+    assert infer_compression("data.jsonl.gz") == "gzip"
+    assert infer_compression(Path("model.pkl.lz4")) == "lz4"
+    assert infer_compression("data.JSON.XZ") == "xz"
+    assert infer_compression("data.jsonl.zst") == "zstd"
+    assert infer_compression("data.jsonl") is None
+
+
+@pytest.mark.parametrize("ext", EXTENSIONS)
+def test_compressed_jsonl(tmp_path: Path, ext: str):
+    test_file = tmp_path / f"test.jsonl{ext}"
+    data = [{"id": i, "text": "hello " * i} for i in range(50)]
+
+    write_jsonl(data, test_file, silent=True)
+    assert read_jsonl(test_file) == data
+    assert list(iter_jsonl(test_file, skip=10, limit=5)) == data[10:15]
+    assert parallel_read_jsonl(test_file, workers=2) == data
+
+    # Appending adds a new frame, and readers decode all of them
+    append_jsonl(data, test_file)
+    assert read_jsonl(test_file) == data + data
+
+
+@pytest.mark.parametrize("ext", EXTENSIONS)
+def test_compressed_json_text_and_pickle(tmp_path: Path, ext: str):
+    json_file = tmp_path / f"test.json{ext}"
+    write_json({"name": "測試"}, json_file, silent=True)
+    assert read_json(json_file) == {"name": "測試"}
+
+    text_file = tmp_path / f"test.txt{ext}"
+    write_file(["Line 1", "Line 2"], text_file, silent=True)
+    append_file("Line 3", text_file)
+    assert read_file(text_file, lines=True) == ["Line 1", "Line 2", "Line 3"]
+
+    pickle_file = tmp_path / f"test.pkl{ext}"
+    save_pickle({"values": [1, 2, 3]}, pickle_file, silent=True)
+    assert load_pickle(pickle_file) == {"values": [1, 2, 3]}
+
+
+def test_explicit_compression(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    write_jsonl({"id": 1}, test_file, silent=True, compression="gzip")
+
+    with gzip.open(test_file, "rt", encoding="utf-8") as reader:
+        assert reader.read() == '{"id": 1}\n'
+    assert read_jsonl(test_file, compression="gzip") == [{"id": 1}]
+
+    # compression=None disables inference from the extension
+    raw_file = tmp_path / "raw.jsonl.gz"
+    write_jsonl({"id": 2}, raw_file, silent=True, compression=None)
+    assert raw_file.read_bytes() == b'{"id": 2}\n'
+
+
+def test_open_file_invalid_args(tmp_path: Path):
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        open_file(tmp_path / "test.txt", "wb", compression="rar")
+
+    with pytest.raises(ValueError, match="Unsupported mode"):
+        open_file(tmp_path / "test.txt", "r+")
@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from whywhytools.follow import follow_file, follow_jsonl
+from whywhytools.jsonl_manager import append_jsonl
+
+
+def _write_later(actions, delay=0.1):
+    def run():
+        for action in actions:
+            time.sleep(delay)
+            action()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def _append(file, data: bytes):
+    return lambda: open(file, "ab").write(data)
+
+
+@pytest.mark.parametrize("inotify", [True, False])
+def test_follow_file(tmp_path: Path, inotify: bool):
+    test_file = tmp_path / "log.txt"
+    test_file.write_text("old\n")
+    writer = _write_later([_append(test_file, b"one\ntw"), _append(test_file, b"o\r\nthree\n")])
+
+    lines = list(follow_file(test_file, poll_interval=0.05, timeout=0.5, inotify=inotify))
+    writer.join()
+    assert lines == ["one", "two", "three"]  # "tw" is held back until its newline arrives
+
+    assert list(follow_file(test_file, start="beginning", timeout=0)) == ["old", "one", "two", "three"]
+    assert list(follow_file(test_file, start=4, timeout=0)) == ["one", "two", "three"]
+    # An offset past the end is an error rather than a truncation restarting from 0
+    with pytest.raises(ValueError, match="past the end"):
+        next(follow_file(test_file, start=10_000, timeout=0))
+
+
+def test_follow_jsonl_waits_for_file(tmp_path: Path):
+    test_file = tmp_path / "data.jsonl"
+    writer = _write_later([lambda: append_jsonl([{"id": 0}, {"id": 1}], test_file)])
+    assert list(follow_jsonl(test_file, start="beginning", poll_interval=0.05, timeout=0.5)) == [
+        {"id": 0},
+        {"id": 1},
+    ]
+    writer.join()
+
+
+def test_follow_rotation_and_truncation(tmp_path: Path):
+    test_file = tmp_path / "log.txt"
+    test_file.write_text("a\n")
+
+    def rotate():
+        with open(test_file, "ab") as f:
+            f.write(b"b\nc")  # the last line of a rotated file is yielded without its newline
+        os.rename(test_file, tmp_path / "log.txt.1")
+        test_file.write_text("d\nlonger line\n")
+
+    def truncate():
+        test_file.write_text("e\n")
+
+    writer = _write_later([rotate, truncate], delay=0.2)
+    lines = list(follow_file(test_file, start="beginning", poll_interval=0.05, timeout=0.6))
+    writer.join()
+    assert lines == ["a", "b", "c", "d", "longer line", "e"]
+
+
+def test_follow_checkpoint(tmp_path: Path):
+    test_file = tmp_path / "data.jsonl"
+    checkpoint = tmp_path / "offset.json"
+    append_jsonl([{"id": i} for i in range(5)], test_file)
+
+    reader = follow_jsonl(test_file, start="beginning", timeout=0, checkpoint=checkpoint)
+    assert [next(reader) for _ in range(3)] == [{"id": 0}, {"id": 1}, {"id": 2}]
+    reader.close()
+
+    # A restarted reader resumes after the records it requested a successor of; the last
+    # record received is read again, and start is ignored
+    append_jsonl([{"id": 5}], test_file)
+    assert [r["id"] for r in follow_jsonl(test_file, timeout=0, checkpoint=checkpoint)] == [2, 3, 4, 5]
+    assert list(follow_jsonl(test_file, timeout=0, checkpoint=checkpoint)) == []
+
+    # A file replaced while the reader was stopped is read from its beginning
+    os.remove(test_file)
+    append_jsonl([{"id": 0}] * 7, test_file)
+    assert len(list(follow_jsonl(test_file, timeout=0, checkpoint=checkpoint))) == 7
+
+
+def test_follow_checkpoint_failing_consumer(tmp_path: Path):
+    test_file = tmp_path / "data.jsonl"
+    checkpoint = tmp_path / "offset.json"
+    append_jsonl([{"id": i} for i in range(5)], test_file)
+
+    with pytest.raises(RuntimeError):
+        for record in follow_jsonl(test_file, start="beginning", timeout=0, checkpoint=checkpoint):
+            if record["id"] == 2:
+                raise RuntimeError("handler failed")
+    # The record whose handler raised is not lost
+    assert [r["id"] for r in follow_jsonl(test_file, timeout=0, checkpoint=checkpoint)] == [2, 3, 4]
+
+
+@pytest.mark.parametrize("content", ["", "{not json", '{"offset": "x", "inode": 1, "fingerprint": 0}'])
+def test_follow_corrupt_checkpoint(tmp_path: Path, content: str):
+    test_file = tmp_path / "data.jsonl"
+    checkpoint = tmp_path / "offset.json"
+    append_jsonl([{"id": 0}], test_file)
+    checkpoint.write_text(content)
+    assert list(follow_jsonl(test_file, start="beginning", timeout=0, checkpoint=checkpoint)) == [{"id": 0}]
+
+
+def test_follow_invalid_start(tmp_path: Path):
+    with pytest.raises(ValueError):
+        follow_file(tmp_path / "log.txt", start="middle")
+    with pytest.raises(ValueError):
+        follow_jsonl(tmp_path / "log.txt", start=-1)
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import whywhytools
+
+
+# Generous enough for slow CI runners; the lazy package itself costs a few milliseconds
+IMPORT_BUDGET_US = 50_000
+
+HEAVY_MODULES = ["json", "pickle", "inspect", "re", "concurrent.futures", "multiprocessing", "mmap"]
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(Path(whywhytools.__file__).parents[1]))
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def test_public_api():
+    for name in whywhytools.__all__:
+        assert callable(getattr(whywhytools, name))
+        assert name in dir(whywhytools)
+
+    with pytest.raises(AttributeError):
+        whywhytools.does_not_exist
+
+
+def test_import_is_lazy():
+    code = "import sys; before = set(sys.modules); import whywhytools; print(*sorted(set(sys.modules) - before))"
+    loaded = set(_run_python(code).stdout.split())
+    assert "whywhytools" in loaded
+    assert not {name for name in loaded if name.startswith("whywhytools.")}
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_submodule_attributes():
+    # Submodules load on first access, without an explicit import
+    code = "import whywhytools; print(whywhytools.json_manager.read_json.__module__, whywhytools.utils.__name__)"
+    assert _run_python(code).stdout.split() == ["whywhytools.json_manager", "whywhytools.utils"]
+    assert "jsonl_manager" in dir(whywhytools)
+    for name in whywhytools._SUBMODULES:
+        assert (Path(whywhytools.__file__).parent / f"{name}.py").exists()
+
+
+def test_import_time_budget():
+    result = _run_python("import whywhytools")
+
+    # Lines look like "import time:   self [us] | cumulative | module"
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "whywhytools":
+            assert int(fields[1]) < IMPORT_BUDGET_US
+            break
+    else:
+        pytest.fail("whywhytools was not found in the -X importtime output")
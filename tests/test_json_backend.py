@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from whywhytools.json_backend import get_json_backend, register_json_backend, set_json_backend
+from whywhytools.json_manager import read_json, write_json
+from whywhytools.jsonl_manager import append_jsonl, read_jsonl, write_jsonl
+
+
+def _installed_backends() -> list[str]:
+    names = []
+    for name in ("json", "orjson", "msgspec", "ujson"):
+        try:
+            get_json_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+BACKENDS = _installed_backends()
+
+DATA = [
+    {"id": 1, "text": "hello world", "unicode": "你好, café ✓", "escape": 'quote " slash \\ tab \t'},
+    {"nested": {"list": [1, 2.5, -0.0, 1e-7, 1e300], "empty": {}, "none": None}, "flag": True},
+    {"big": 2**70, "nan": float("nan"), 7: "int key"},
+]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_jsonl_output_matches_stdlib(tmp_path: Path, backend: str):
+    test_file = tmp_path / "test.jsonl"
+    expected = "".join(json.dumps(obj, ensure_ascii=False) + "\n" for obj in DATA).encode("utf-8")
+
+    write_jsonl(DATA, test_file, silent=True, backend=backend)
+    assert test_file.read_bytes() == expected
+
+    test_file.unlink()
+    append_jsonl(DATA, test_file, backend=backend)
+    assert test_file.read_bytes() == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_json_output_matches_stdlib(tmp_path: Path, backend: str):
+    test_file = tmp_path / "test.json"
+    obj = {"records": DATA[:2], "name": "whywhytools"}
+    expected = (json.dumps(obj, ensure_ascii=False, indent=4) + "\n").encode("utf-8")
+
+    write_json(obj, test_file, silent=True, backend=backend)
+    assert test_file.read_bytes() == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_decoding_matches_stdlib(tmp_path: Path, backend: str):
+    test_file = tmp_path / "test.jsonl"
+    write_jsonl(DATA[:2], test_file, silent=True, backend="json")
+    assert read_jsonl(test_file, backend=backend) == DATA[:2]
+
+    # Documents rejected by stricter decoders fall back to the standard library
+    (tmp_path / "strict.json").write_text('{"big": 1180591620717411303424, "nan": NaN}', encoding="utf-8")
+    loaded = read_json(tmp_path / "strict.json", backend=backend)
+    assert loaded["big"] == 2**70
+    assert loaded["nan"] != loaded["nan"]
+
+
+def test_set_json_backend(tmp_path: Path):
+    calls = []
+
+    def loads(s):
+        calls.append(s)
+        return json.loads(s)
+
+    register_json_backend("counting", loads)
+    test_file = tmp_path / "test.json"
+    write_json({"v": 1}, test_file, silent=True)
+
+    set_json_backend("counting")
+    try:
+        assert get_json_backend().name == "counting"
+        assert read_json(test_file) == {"v": 1}
+        assert len(calls) == 1
+    finally:
+        set_json_backend(None)
+    assert get_json_backend().name in BACKENDS
+
+
+def test_unknown_json_backend():
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        get_json_backend("does-not-exist")
+
+    with pytest.raises(ValueError):
+        set_json_backend("does-not-exist")
@@ -0,0 +1,74 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from whywhytools.jsonl_index import JsonlFile, build_jsonl_index, index_path, is_jsonl_index_valid
+from whywhytools.jsonl_manager import append_jsonl, write_jsonl
+
+
+def test_build_jsonl_index(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    test_file.write_text('{"id": 0}\n\n{"id": 1}\r\n{"id": 2}', encoding="utf-8")
+
+    assert not is_jsonl_index_valid(test_file)
+    path = build_jsonl_index(test_file)
+    assert path == index_path(test_file)
+    assert is_jsonl_index_valid(test_file)
+
+    with JsonlFile(test_file) as data:
+        assert len(data) == 3
+        assert [data[0], data[1], data[2]] == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_jsonl_file_access(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    records = [{"id": i, "text": "é" * i} for i in range(100)]
+    write_jsonl(records, test_file, silent=True)
+
+    # The index is built on first use
+    with JsonlFile(test_file) as data:
+        assert len(data) == 100
+        assert data[42] == records[42]
+        assert data[-1] == records[-1]
+        assert data[10:20] == records[10:20]
+        assert data[::-25] == records[::-25]
+        assert list(data) == records
+
+        sample = data.sample(10, seed=0)
+        assert len(sample) == 10
+        assert all(obj in records for obj in sample)
+        assert data.sample(10, seed=0) == sample
+
+        with pytest.raises(IndexError):
+            data[100]
+
+
+def test_jsonl_index_append_and_invalidation(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    write_jsonl([{"id": 0}, {"id": 1}], test_file, silent=True)
+    build_jsonl_index(test_file)
+
+    # append_jsonl extends a valid index in place
+    append_jsonl([{"id": 2}, {"id": 3}], test_file)
+    assert is_jsonl_index_valid(test_file)
+    with JsonlFile(test_file) as data:
+        assert data[:] == [{"id": i} for i in range(4)]
+
+    # Any other modification makes the index stale, and it is rebuilt on open
+    write_jsonl({"id": "new"}, test_file, force=True, silent=True)
+    os.utime(test_file, ns=(0, 0))
+    assert not is_jsonl_index_valid(test_file)
+    with JsonlFile(test_file) as data:
+        assert data[:] == [{"id": "new"}]
+
+
+def test_jsonl_index_empty_and_compressed(tmp_path: Path):
+    empty_file = tmp_path / "empty.jsonl"
+    empty_file.touch()
+    with JsonlFile(empty_file) as data:
+        assert len(data) == 0
+        assert data[:] == []
+
+    with pytest.raises(ValueError, match="compressed"):
+        build_jsonl_index(tmp_path / "test.jsonl.gz")
@@ -1,6 +1,17 @@
 import pytest
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
-from whywhytools.jsonl_manager import read_jsonl, write_jsonl, append_jsonl
+from types import MappingProxyType
+from typing import TypedDict
+from whywhytools.json_backend import register_json_backend
+from whywhytools.jsonl_manager import (
+    append_jsonl,
+    iter_jsonl,
+    parallel_iter_jsonl,
+    parallel_read_jsonl,
+    read_jsonl,
+    write_jsonl,
+)
 
 
 def test_write_and_read_jsonl(tmp_path: Path):
@@ -58,3 +69,293 @@ def test_jsonl_manager_type_error(tmp_path: Path):
 
     with pytest.raises(TypeError):
         read_jsonl(123)
+
+
+def test_iter_jsonl(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    data = [{"id": i} for i in range(10)]
+    write_jsonl(data, test_file, silent=True)
+
+    records = iter_jsonl(test_file)
+    assert next(records) == data[0]
+    assert list(records) == data[1:]
+
+    assert list(iter_jsonl(test_file, skip=3, limit=4)) == data[3:7]
+    assert list(iter_jsonl(test_file, skip=20)) == []
+    assert list(iter_jsonl(test_file, limit=0)) == []
+    assert read_jsonl(test_file, skip=8) == data[8:]
+
+
+def test_iter_jsonl_blank_lines(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    test_file.write_text('{"id": 1}\n\n{"id": 2}\r\n\n', encoding="utf-8")
+
+    assert read_jsonl(test_file) == [{"id": 1}, {"id": 2}]
+
+
+def test_iter_jsonl_invalid_args(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    write_jsonl({"id": 1}, test_file, silent=True)
+
+    # Arguments are validated eagerly, before iteration starts
+    with pytest.raises(TypeError):
+        iter_jsonl(123)
+
+    with pytest.raises(ValueError):
+        iter_jsonl(test_file, skip=-1)
+
+    with pytest.raises(ValueError):
+        iter_jsonl(test_file, limit=-1)
+
+
+def test_parallel_read_jsonl(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    data = [{"id": i, "text": "x" * (i % 37)} for i in range(1000)]
+    write_jsonl(data, test_file, silent=True)
+
+    assert parallel_read_jsonl(test_file, workers=3) == data
+    assert parallel_read_jsonl(test_file, workers=1) == data
+
+    unordered = list(parallel_iter_jsonl(test_file, workers=3, ordered=False))
+    assert sorted(unordered, key=lambda obj: obj["id"]) == data
+
+
+@pytest.mark.parametrize("backend", ["registered", None])
+def test_parallel_read_jsonl_spawn(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, backend: str | None):
+    import concurrent.futures
+    import functools
+    import json
+    import multiprocessing
+
+    # Workers started with spawn do not inherit the registry of the parent
+    spawn = functools.partial(concurrent.futures.ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", spawn)
+    register_json_backend("registered", json.loads)
+
+    test_file = tmp_path / "test.jsonl"
+    data = [{"id": i} for i in range(100)]
+    write_jsonl(data, test_file, silent=True)
+    assert parallel_read_jsonl(test_file, workers=2, backend=backend) == data
+
+
+def test_parallel_read_jsonl_small_files(tmp_path: Path):
+    # More workers than records, blank lines and empty files
+    test_file = tmp_path / "test.jsonl"
+    test_file.write_text('{"id": 1}\n\n{"id": 2}\n', encoding="utf-8")
+    assert parallel_read_jsonl(test_file, workers=8) == [{"id": 1}, {"id": 2}]
+
+    empty_file = tmp_path / "empty.jsonl"
+    empty_file.touch()
+    assert parallel_read_jsonl(empty_file, workers=2) == []
+
+    with pytest.raises(ValueError):
+        parallel_read_jsonl(test_file, workers=0)
+
+
+def test_write_jsonl_iterable(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    data = [{"id": i, "text": "ü" * i} for i in range(100)]
+
+    # Generators are streamed; a tiny buffer forces many batches
+    write_jsonl((obj for obj in data), test_file, silent=True, buffer_size=64)
+    assert read_jsonl(test_file) == data
+
+    append_jsonl(iter(data), test_file, buffer_size=1)
+    assert read_jsonl(test_file) == data + data
+
+    with pytest.raises(TypeError, match="got int at index 1"):
+        append_jsonl(iter([{"id": 1}, 2]), test_file)
+
+    # Batches flushed before the bad record are rolled back
+    with pytest.raises(TypeError, match="got int at index 50"):
+        append_jsonl(iter([*data[:50], 2]), test_file, buffer_size=1)
+    assert read_jsonl(test_file) == data + data
+
+    with pytest.raises(TypeError):
+        append_jsonl(123, test_file)
+    for bad in ("records", b"records", MappingProxyType({"id": 1})):
+        with pytest.raises(TypeError, match="must be dict or Iterable"):
+            append_jsonl(bad, test_file)
+    with pytest.raises(TypeError):
+        write_jsonl("records", tmp_path / "str.jsonl", silent=True)
+    assert not (tmp_path / "str.jsonl").exists()
+
+
+def test_append_jsonl_open_error_not_masked(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from whywhytools import jsonl_manager
+
+    def fail(*args, **kwargs):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr(jsonl_manager, "open_file", fail)
+    with pytest.raises(PermissionError, match="denied"):
+        append_jsonl([{"id": 1}], tmp_path / "new.jsonl")
+    assert not (tmp_path / "new.jsonl").exists()
+
+
+def test_read_jsonl_mmap(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    test_file.write_text('{"id": 1}\n\n{"id": 2}\r\n{"id": 3}', encoding="utf-8")
+
+    assert read_jsonl(test_file, mmap=True) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert list(iter_jsonl(test_file, skip=1, limit=1, mmap=True)) == [{"id": 2}]
+
+    empty_file = tmp_path / "empty.jsonl"
+    empty_file.touch()
+    assert read_jsonl(empty_file, mmap=True) == []
+
+
+def test_write_jsonl_atomic(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    write_jsonl({"id": 1}, test_file, silent=True)
+
+    def records():
+        yield {"id": 2}
+        raise RuntimeError("producer failed")
+
+    # A failed overwrite leaves the previous content in place
+    with pytest.raises(RuntimeError):
+        write_jsonl(records(), test_file, force=True, silent=True, buffer_size=1)
+    assert read_jsonl(test_file) == [{"id": 1}]
+
+    # Without atomic writes, the records written before the failure remain
+    with pytest.raises(RuntimeError):
+        write_jsonl(records(), test_file, force=True, silent=True, buffer_size=1, atomic=False)
+    assert read_jsonl(test_file) == [{"id": 2}]
+
+    write_jsonl({"id": 3}, test_file, force=True, silent=True, fsync="file+dir")
+    assert read_jsonl(test_file) == [{"id": 3}]
+
+
+def test_read_jsonl_fields_and_where(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    data = [{"id": i, "lang": ["en", "fr", "zh"][i % 3], "text": "x" * i, "flag": None} for i in range(30)]
+    write_jsonl(data, test_file, silent=True)
+    # An escaped spelling of "en" must not be dropped by the raw-bytes pre-filter
+    with open(test_file, "a") as fp:
+        fp.write('{"id": 30, "lang": "\\u0065n"}\n')
+
+    english = [obj for obj in data if obj["lang"] == "en"] + [{"id": 30, "lang": "en"}]
+    assert read_jsonl(test_file, where={"lang": "en"}) == english
+    assert read_jsonl(test_file, where=lambda obj: obj["lang"] == "en") == english
+    assert read_jsonl(test_file, where={"lang": "en"}, fields=["id"], skip=1, limit=2) == [{"id": 3}, {"id": 6}]
+    assert read_jsonl(test_file, where={"flag": None, "id": 4}) == [data[4]]
+    assert read_jsonl(test_file, fields=["id", "missing"], limit=2) == [{"id": 0}, {"id": 1}]
+    assert list(iter_jsonl(test_file, where={"lang": "de"})) == []
+
+    # Values compare as JSON: true is not 1, and 1 matches 1.0 but not true
+    with open(test_file, "w") as fp:
+        fp.write('{"v": true}\n{"v": 1}\n{"v": 1.0}\n{"v": false}\n{"v": 0}\n{"v": null}\n')
+    assert read_jsonl(test_file, where={"v": True}) == [{"v": True}]
+    assert read_jsonl(test_file, where={"v": 1}) == [{"v": 1}, {"v": 1.0}]
+    assert read_jsonl(test_file, where={"v": False}) == [{"v": False}]
+    assert read_jsonl(test_file, where={"v": 0.0}) == [{"v": 0}]
+    assert read_jsonl(test_file, where={"v": None}) == [{"v": None}]
+
+    with pytest.raises(TypeError):
+        iter_jsonl(test_file, where="lang == en")
+    with pytest.raises(TypeError):
+        iter_jsonl(test_file, fields=[1])
+
+
+@dataclass(slots=True)
+class Point:
+    x: int
+    y: float
+    label: str | None = None
+    tags: list[str] = field(default_factory=list)
+
+
+class Row(TypedDict, total=False):
+    id: int
+    point: Point
+    scores: dict[str, float]
+
+
+def test_read_jsonl_schema(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    write_jsonl(
+        [
+            {"x": 1, "y": 2, "label": "a", "tags": ["t"], "extra": True},
+            {"x": 3, "y": 4.5},
+        ],
+        test_file,
+        silent=True,
+    )
+    points = read_jsonl(test_file, schema=Point)
+    assert points == [Point(1, 2, "a", ["t"]), Point(3, 4.5)]
+    assert not hasattr(points[0], "__dict__")
+    assert [p.x for p in iter_jsonl(test_file, schema=Point, where={"x": 3})] == [3]
+
+    write_jsonl(
+        [{"id": 1, "point": {"x": 0, "y": 0}, "scores": {"f1": 0.5}}, {"id": 2}], test_file, force=True, silent=True
+    )
+    rows = read_jsonl(test_file, schema=Row)
+    assert rows[0] == (1, Point(0, 0), {"f1": 0.5})
+    assert rows[0].point.x == 0
+    assert rows[1].id == 2 and rows[1].scores is None
+
+    write_jsonl([{"x": True, "y": 0}], test_file, force=True, silent=True)
+    with pytest.raises(TypeError, match="Point.x must be int, got bool"):
+        read_jsonl(test_file, schema=Point)
+    write_jsonl([{"x": 1, "y": 0, "tags": ["a", 2]}], test_file, force=True, silent=True)
+    with pytest.raises(TypeError, match="item 1 must be str"):
+        read_jsonl(test_file, schema=Point)
+    write_jsonl([{"y": 0}], test_file, force=True, silent=True)
+    with pytest.raises(ValueError, match="Point.x is missing"):
+        read_jsonl(test_file, schema=Point)
+    with pytest.raises(ValueError):
+        read_jsonl(test_file, schema=Point, fields=["x"])
+    with pytest.raises(TypeError):
+        read_jsonl(test_file, schema=dict)
+
+
+@dataclass
+class Node:
+    value: int
+    children: "list[Node]"
+
+
+class Parent(TypedDict):
+    child: "Child | None"
+
+
+class Child(TypedDict):
+    parent: Parent
+
+
+@dataclass
+class Scaled:
+    x: int
+    scale: InitVar[int]
+
+    def __post_init__(self, scale):
+        self.x *= scale
+
+
+def test_read_jsonl_schema_unsupported(tmp_path: Path):
+    test_file = tmp_path / "test.jsonl"
+    write_jsonl([{"value": 1, "children": []}], test_file, silent=True)
+    # Rejected up front instead of recursing until RecursionError
+    with pytest.raises(TypeError, match="Unsupported recursive schema: Node"):
+        read_jsonl(test_file, schema=Node)
+    with pytest.raises(TypeError, match="Unsupported recursive schema: Parent"):
+        read_jsonl(test_file, schema=Parent)
+    with pytest.raises(TypeError, match="Unsupported InitVar field in schema: Scaled.scale"):
+        read_jsonl(test_file, schema=Scaled)
+
+
+def test_read_jsonl_schema_msgspec(tmp_path: Path):
+    msgspec = pytest.importorskip("msgspec")
+
+    class Item(msgspec.Struct):
+        id: int
+        name: str
+
+    test_file = tmp_path / "test.jsonl"
+    write_jsonl([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}], test_file, silent=True)
+    assert read_jsonl(test_file, schema=Item) == [Item(1, "a"), Item(2, "b")]
+    assert read_jsonl(test_file, schema=Item, where={"name": "b"}) == [Item(2, "b")]
+    write_jsonl([{"id": "1", "name": "a"}], test_file, force=True, silent=True)
+    with pytest.raises(msgspec.ValidationError):
+        read_jsonl(test_file, schema=Item)
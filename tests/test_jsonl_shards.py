@@ -0,0 +1,134 @@
+from pathlib import Path
+
+import pytest
+
+from whywhytools.json_manager import read_json
+from whywhytools.jsonl_manager import read_jsonl
+from whywhytools.jsonl_shards import ShardedJsonlWriter, manifest_path, shard_name
+
+
+def _read_shards(tmp_path: Path, manifest: dict) -> list[list[dict]]:
+    return [read_jsonl(tmp_path / shard["file"]) for shard in manifest["shards"]]
+
+
+def test_shard_name():
+    assert shard_name("out/data.jsonl.gz", 3, 128) == Path("out/data-00003-of-00128.jsonl.gz")
+    assert manifest_path("out/data.jsonl.gz") == Path("out/data.manifest.json")
+    # Dots in the stem are kept
+    assert shard_name("out/my.data.jsonl.zst", 0, 2) == Path("out/my.data-00000-of-00002.jsonl.zst")
+    assert manifest_path("out/my.data.jsonl") == Path("out/my.data.manifest.json")
+    assert shard_name("out/data", 1, 2) == Path("out/data-00001-of-00002")
+
+
+def test_rollover_by_records(tmp_path: Path):
+    data = [{"id": i} for i in range(25)]
+    with ShardedJsonlWriter(tmp_path / "data.jsonl", max_records=10, workers=2, silent=True) as writer:
+        writer.write_many(data)
+
+    manifest = read_json(tmp_path / "data.manifest.json")
+    assert [shard["file"] for shard in manifest["shards"]] == [f"data-0000{i}-of-00003.jsonl" for i in range(3)]
+    assert [shard["records"] for shard in manifest["shards"]] == [10, 10, 5]
+    assert manifest["total_records"] == 25
+    assert sum(_read_shards(tmp_path, manifest), []) == data
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_rollover_by_bytes(tmp_path: Path):
+    data = [{"id": i, "pad": "x" * 10} for i in range(20)]
+    line_size = len('{"id": 10, "pad": "xxxxxxxxxx"}\n')
+    with ShardedJsonlWriter(tmp_path / "data.jsonl.gz", max_bytes=3 * line_size, buffer_size=1, silent=True) as writer:
+        writer.write_many(data)
+
+    manifest = writer.manifest
+    assert manifest["compression"] == "gzip"
+    shards = _read_shards(tmp_path, manifest)
+    assert sum(shards, []) == data
+    assert all(len(shard) <= 3 for shard in shards)
+
+
+def test_hash_partition(tmp_path: Path):
+    data = [{"user": f"u{i % 7}", "i": i} for i in range(100)]
+    with ShardedJsonlWriter(tmp_path / "data.jsonl", num_shards=4, key="user", silent=True) as writer:
+        writer.write_many(data)
+
+    shards = _read_shards(tmp_path, writer.manifest)
+    assert len(shards) == 4
+    assert sorted(sum(shards, []), key=lambda obj: obj["i"]) == data
+    users = [{obj["user"] for obj in shard} for shard in shards]
+    assert sum(len(u) for u in users) == 7  # each key lives in exactly one shard
+
+
+def test_existing_and_abort(tmp_path: Path):
+    file = tmp_path / "data.jsonl"
+    with ShardedJsonlWriter(file, num_shards=2, silent=True) as writer:
+        writer.write({"a": 1})
+
+    with pytest.raises(FileExistsError):
+        ShardedJsonlWriter(file, num_shards=2, raise_on_exists=True)
+    with pytest.raises(SystemExit):
+        ShardedJsonlWriter(file, num_shards=2)
+
+    with ShardedJsonlWriter(file, num_shards=3, force=True, silent=True) as writer:
+        writer.write({"a": 2})
+    assert sorted(p.name for p in tmp_path.glob("data-*")) == [f"data-0000{i}-of-00003.jsonl" for i in range(3)]
+
+    with (
+        pytest.raises(RuntimeError),
+        ShardedJsonlWriter(tmp_path / "other.jsonl", max_records=1, silent=True) as writer,
+    ):
+        writer.write({"a": 1})
+        raise RuntimeError
+    assert not list(tmp_path.glob("*other*"))
+
+    with pytest.raises(ValueError):
+        ShardedJsonlWriter(file, key="a", force=True)
+    with pytest.raises(ValueError):
+        ShardedJsonlWriter(file, force=True)
+
+
+def test_existing_shards_without_manifest(tmp_path: Path):
+    file = tmp_path / "my.data.jsonl"
+    orphan = tmp_path / "my.data-00004-of-00005.jsonl"
+    orphan.write_text('{"old": true}\n')
+
+    with pytest.raises(FileExistsError):
+        ShardedJsonlWriter(file, num_shards=2, raise_on_exists=True)
+    assert orphan.exists()
+
+    with ShardedJsonlWriter(file, num_shards=2, force=True, silent=True) as writer:
+        writer.write({"a": 1})
+    assert sorted(p.name for p in tmp_path.glob("my.data-*")) == [f"my.data-0000{i}-of-00002.jsonl" for i in range(2)]
+    assert (tmp_path / "my.data.manifest.json").exists()
+
+
+def test_force_keeps_previous_run_until_close(tmp_path: Path):
+    file = tmp_path / "data.jsonl"
+    with ShardedJsonlWriter(file, num_shards=3, silent=True) as writer:
+        for i in range(6):
+            writer.write({"i": i})
+    previous = read_json(manifest_path(file))
+
+    with pytest.raises(RuntimeError), ShardedJsonlWriter(file, num_shards=2, force=True, silent=True) as writer:
+        writer.write({"i": 0})
+        raise RuntimeError
+    assert read_json(manifest_path(file)) == previous
+    assert sorted(record["i"] for shard in _read_shards(tmp_path, previous) for record in shard) == list(range(6))
+    assert not list(tmp_path.glob(".*.tmp"))
+
+    with ShardedJsonlWriter(file, num_shards=2, force=True, silent=True) as writer:
+        writer.write({"i": 0})
+    assert sorted(p.name for p in tmp_path.glob("data-*")) == [f"data-0000{i}-of-00002.jsonl" for i in range(2)]
+
+
+def test_abort_reports_writer_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from whywhytools import jsonl_shards
+
+    def fail(self, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(jsonl_shards._Shard, "write", fail)
+    writer = ShardedJsonlWriter(tmp_path / "data.jsonl", num_shards=2, buffer_size=1, silent=True)
+    writer.write({"a": 1})  # handed to a writer thread
+    with pytest.raises(OSError, match="disk full"):
+        writer.abort()
+    assert not list(tmp_path.glob(".*.tmp"))
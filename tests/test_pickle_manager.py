@@ -35,3 +35,58 @@ def test_save_pickle_force(tmp_path: Path):
 def test_pickle_manager_type_error():
     with pytest.raises(TypeError):
         load_pickle(123)
+
+
+def test_save_pickle_protocol(tmp_path: Path):
+    import pickle
+
+    test_file = tmp_path / "test.pkl"
+    save_pickle({"a": 1}, test_file, silent=True)
+    assert test_file.read_bytes()[1] == pickle.HIGHEST_PROTOCOL
+    save_pickle({"a": 1}, test_file, force=True, silent=True, protocol=2)
+    assert test_file.read_bytes()[1] == 2
+    assert load_pickle(test_file) == {"a": 1}
+
+
+def test_save_pickle_out_of_band(tmp_path: Path):
+    import pickle
+
+    test_file = tmp_path / "test.pkl"
+    big = bytearray(range(256)) * 1024
+    data = {"big": big, "buffer": pickle.PickleBuffer(bytearray(b"z" * 100_000)), "small": bytearray(b"abc")}
+    save_pickle(data, test_file, silent=True, out_of_band=True)
+
+    loaded = load_pickle(test_file)
+    assert loaded["big"] == big
+    assert bytes(loaded["buffer"]) == b"z" * 100_000
+    # PickleBuffer payloads stay views of the mapping; bytearrays are rebuilt as owned copies
+    assert isinstance(loaded["buffer"], memoryview)
+    assert type(loaded["big"]) is bytearray
+    loaded["big"][0] = 255
+    assert load_pickle(test_file)["big"][0] == 0
+    assert loaded["small"] == bytearray(b"abc")
+
+    with pytest.raises(ValueError):
+        save_pickle(data, tmp_path / "test.pkl.gz", out_of_band=True)
+    with pytest.raises(ValueError):
+        save_pickle(data, tmp_path / "other.pkl", out_of_band=True, protocol=4)
+
+
+def test_load_pickle_out_of_band_numpy(tmp_path: Path):
+    np = pytest.importorskip("numpy")
+
+    test_file = tmp_path / "arrays.pkl"
+    arrays = {"x": np.arange(100_000, dtype=np.float64), "y": np.ones((300, 300), dtype=np.float32)}
+    save_pickle(arrays, test_file, silent=True, out_of_band=True)
+
+    loaded = load_pickle(test_file)
+    for key, array in arrays.items():
+        assert np.array_equal(loaded[key], array)
+        # Backed by the copy-on-write mapping rather than a fresh copy
+        base = loaded[key]
+        while isinstance(base, np.ndarray):
+            base = base.base
+        assert isinstance(base, memoryview)
+        assert loaded[key].ctypes.data % 64 == 0
+    loaded["x"][0] = -1.0
+    assert load_pickle(test_file)["x"][0] == 0.0
@@ -0,0 +1,131 @@
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import TypedDict
+
+import pytest
+
+from whywhytools.json_manager import read_json, write_json
+from whywhytools.jsonl_manager import read_jsonl, write_jsonl
+from whywhytools.pickle_manager import load_pickle, save_pickle
+from whywhytools.read_cache import cache_clear, cache_info, set_cache_size
+
+
+class Point(TypedDict):
+    x: int
+    y: int
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache_clear()
+    yield
+    set_cache_size("256MiB")
+    cache_clear()
+
+
+def test_read_json_cache(tmp_path: Path):
+    test_file = tmp_path / "config.json"
+    write_json({"values": [1, 2]}, test_file, silent=True)
+
+    first = read_json(test_file, cache=True)
+    first["values"].append(3)  # callers get copies, the cached object is unaffected
+    assert read_json(test_file, cache=True) == {"values": [1, 2]}
+    assert cache_info()[:3] == (1, 1, 1)
+
+    write_json({"values": [4]}, test_file, force=True, silent=True)
+    assert read_json(test_file, cache=True) == {"values": [4]}
+    info = cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 2, 1)
+
+    read_json(test_file)  # not cached
+    assert cache_info().misses == 2
+
+
+def test_read_jsonl_and_load_pickle_cache(tmp_path: Path):
+    jsonl_file = tmp_path / "data.jsonl"
+    write_jsonl([{"id": i, "even": i % 2 == 0} for i in range(5)], jsonl_file, silent=True)
+    assert read_jsonl(jsonl_file, where={"even": True}, cache=True) == read_jsonl(jsonl_file, where={"even": True})
+    assert len(read_jsonl(jsonl_file, where={"even": True}, cache=True)) == 3
+    assert len(read_jsonl(jsonl_file, cache=True)) == 5  # different options, different entry
+    assert cache_info()[:3] == (1, 2, 2)
+    with pytest.raises(ValueError):
+        read_jsonl(jsonl_file, where=lambda obj: obj["even"], cache=True)
+
+    pickle_file = tmp_path / "data.pkl"
+    save_pickle({"a": 1}, pickle_file, silent=True)
+    assert load_pickle(pickle_file, cache=True) == load_pickle(pickle_file, cache=True) == {"a": 1}
+    assert cache_info().hits == 2
+
+
+def test_read_cache_eviction(tmp_path: Path):
+    files = []
+    for i in range(3):
+        files.append(tmp_path / f"{i}.json")
+        write_json({"text": "x" * 1000}, files[-1], silent=True)
+
+    set_cache_size(2500)
+    for file in files:
+        read_json(file, cache=True)
+    info = cache_info()
+    assert info.entries == 2 and info.size <= 2500
+
+    read_json(files[0], cache=True)  # evicted as the least recently used
+    assert cache_info().misses == 4
+
+    set_cache_size(0)
+    assert cache_info().entries == 0
+
+    os.remove(files[0])
+    with pytest.raises(FileNotFoundError):
+        read_json(files[0], cache=True)
+
+
+def test_read_cache_frozen(tmp_path: Path):
+    test_file = tmp_path / "config.json"
+    write_json({"values": [1, 2], "nested": {"a": 1}}, test_file, silent=True)
+
+    first = read_json(test_file, cache="frozen")
+    assert read_json(test_file, cache="frozen") is first
+    assert isinstance(first, MappingProxyType) and first["values"] == (1, 2)
+    with pytest.raises(TypeError):
+        first["nested"]["a"] = 2
+    assert read_json(test_file, cache=True) == {"values": [1, 2], "nested": {"a": 1}}  # separate entry
+    assert cache_info()[:3] == (1, 2, 2)
+
+    with pytest.raises(ValueError):
+        read_json(test_file, cache="yes")
+    with pytest.raises(ValueError):
+        load_pickle(test_file, cache="frozen")
+
+
+def test_read_cache_uncacheable(tmp_path: Path):
+    class LocalPoint(TypedDict):
+        x: int
+
+    jsonl_file = tmp_path / "points.jsonl"
+    write_jsonl([{"x": 1, "y": 2}], jsonl_file, silent=True)
+    with pytest.warns(RuntimeWarning, match="not cached"):
+        assert read_jsonl(jsonl_file, schema=LocalPoint, cache=True)[0].x == 1
+    read_jsonl(jsonl_file, schema=LocalPoint, cache=True)  # warned only once
+    info = cache_info()
+    assert (info.hits, info.misses, info.entries, info.uncacheable) == (0, 2, 0, 2)
+
+    # Records of module-level TypedDicts pickle through the TypedDict
+    assert read_jsonl(jsonl_file, schema=Point, cache=True) == read_jsonl(jsonl_file, schema=Point, cache=True)
+    assert cache_info().hits == 1
+
+
+def test_load_pickle_cache_out_of_band(tmp_path: Path):
+    np = pytest.importorskip("numpy")
+    pickle_file = tmp_path / "arrays.pkl"
+    save_pickle({"weights": np.arange(100_000, dtype=np.float32)}, pickle_file, out_of_band=True, silent=True)
+
+    first = load_pickle(pickle_file, cache=True)
+    second = load_pickle(pickle_file, cache=True)
+    assert first is not second and np.array_equal(first["weights"], second["weights"])
+    # The arrays share the cached memory instead of being copied, so they are read-only
+    assert np.shares_memory(first["weights"], second["weights"])
+    assert not second["weights"].flags.writeable
+    with pytest.raises(ValueError):
+        first["weights"][0] = 1
@@ -6,7 +6,8 @@ safetensors = pytest.importorskip("safetensors")
 
 from pathlib import Path
 
-from whywhytools.safetensors_manager import load_safetensors, save_safetensors
+from whywhytools.json_manager import read_json
+from whywhytools.safetensors_manager import load_safetensors, open_safetensors, save_safetensors
 
 
 def test_save_and_load_safetensors(tmp_path: Path):
@@ -79,3 +80,134 @@ def test_save_safetensors_raise_on_exists(tmp_path: Path):
 def test_safetensors_manager_type_error():
     with pytest.raises(TypeError):
         load_safetensors(123)
+
+
+def test_open_safetensors(tmp_path: Path):
+    test_file = tmp_path / "test.safetensors"
+    data = {"encoder.0": torch.arange(6).reshape(3, 2), "encoder.1": torch.ones(2), "head": torch.zeros(4)}
+    save_safetensors(data, test_file, metadata={"step": "10"}, silent=True)
+
+    with open_safetensors(test_file) as f:
+        assert sorted(f.keys()) == sorted(data)
+        assert "head" in f and len(f) == 3
+        assert f.metadata() == {"step": "10"}
+        assert torch.equal(f.get_tensor("encoder.1"), data["encoder.1"])
+        assert torch.equal(f.get_slice("encoder.0")[1:], data["encoder.0"][1:])
+        assert f.get_slice("encoder.0").get_shape() == [3, 2]
+
+
+def test_load_safetensors_filter(tmp_path: Path):
+    test_file = tmp_path / "test.safetensors"
+    data = {"encoder.0": torch.ones(2), "encoder.1": torch.ones(3), "head": torch.zeros(4)}
+    save_safetensors(data, test_file, silent=True)
+
+    assert sorted(load_safetensors(test_file, prefix="encoder.")) == ["encoder.0", "encoder.1"]
+    assert list(load_safetensors(test_file, keys=["head"])) == ["head"]
+    assert list(load_safetensors(test_file, keys=["head", "encoder.0"], prefix="enc")) == ["encoder.0"]
+    with pytest.raises(KeyError):
+        load_safetensors(test_file, keys=["missing"])
+
+
+def test_sharded_safetensors(tmp_path: Path):
+    test_file = tmp_path / "model.safetensors"
+    data = {f"layer.{i}": torch.full((64,), float(i)) for i in range(5)}  # 256 bytes each
+    save_safetensors(data, test_file, metadata={"step": "1"}, max_shard_size=600, silent=True)
+
+    index = read_json(tmp_path / "model.safetensors.index.json")
+    assert index["metadata"] == {"step": "1", "total_size": 5 * 256}
+    assert index["weight_map"]["layer.0"] == "model-00001-of-00003.safetensors"
+    assert index["weight_map"]["layer.4"] == "model-00003-of-00003.safetensors"
+    assert not test_file.exists()
+
+    loaded = load_safetensors(test_file, workers=2)
+    assert list(loaded) == list(data)
+    assert all(torch.equal(loaded[key], data[key]) for key in data)
+    assert list(load_safetensors(tmp_path / "model.safetensors.index.json", keys=["layer.3"])) == ["layer.3"]
+    assert list(load_safetensors(test_file, prefix="layer.4")) == ["layer.4"]
+
+    with open_safetensors(test_file) as f:
+        assert f.keys() == list(data)
+        assert torch.equal(f.get_tensor("layer.2"), data["layer.2"])
+        assert len(f._handles) == 1  # only the shard holding layer.2 was opened
+
+    # Fewer shards on overwrite; the old ones are removed
+    save_safetensors(data, test_file, max_shard_size="1KB", force=True, silent=True)
+    assert sorted(p.name for p in tmp_path.glob("model-*")) == [
+        "model-00001-of-00002.safetensors",
+        "model-00002-of-00002.safetensors",
+    ]
+
+    # A state dict within the limit is written as a single file
+    small_file = tmp_path / "small.safetensors"
+    save_safetensors(data, small_file, max_shard_size="5GB", silent=True)
+    assert small_file.exists()
+    assert not (tmp_path / "small.safetensors.index.json").exists()
+
+
+def test_sharded_safetensors_overwrite(tmp_path: Path, monkeypatch):
+    test_file = tmp_path / "model.safetensors"
+    data = {f"layer.{i}": torch.full((64,), float(i)) for i in range(5)}  # 256 bytes each
+    save_safetensors(data, test_file, max_shard_size=600, silent=True)
+
+    # The sharded checkpoint and a single file at the same base path replace each other
+    with pytest.raises(FileExistsError):
+        save_safetensors(data, test_file, silent=True, raise_on_exists=True)
+    save_safetensors(data, test_file, force=True, silent=True)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["model.safetensors"]
+
+    save_safetensors(data, test_file, max_shard_size=600, force=True, silent=True)
+    assert not test_file.exists()
+    assert len(list(tmp_path.glob("model-*"))) == 3
+
+    # A save interrupted after its shards leaves the previous index and shards loadable
+    import whywhytools.json_manager as json_manager
+
+    def interrupted(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(json_manager, "write_json", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        save_safetensors(data, test_file, max_shard_size="1KB", force=True, silent=True)
+    monkeypatch.undo()
+    loaded = load_safetensors(test_file)
+    assert all(torch.equal(loaded[key], data[key]) for key in data)
+
+
+def test_sharded_safetensors_overwrite_same_shard_count(tmp_path: Path, monkeypatch):
+    import safetensors.torch
+
+    test_file = tmp_path / "model.safetensors"
+    old = {f"layer.{i}": torch.full((64,), float(i)) for i in range(5)}  # 256 bytes each
+    new = {key: tensor + 100 for key, tensor in old.items()}
+    save_safetensors(old, test_file, max_shard_size=600, silent=True)
+
+    # Interrupted on the second shard: no shard the previous index uses was replaced
+    save_file = safetensors.torch.save_file
+    calls = []
+
+    def failing_save_file(*args, **kwargs):
+        calls.append(args[1])
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        return save_file(*args, **kwargs)
+
+    monkeypatch.setattr(safetensors.torch, "save_file", failing_save_file)
+    with pytest.raises(KeyboardInterrupt):
+        save_safetensors(new, test_file, max_shard_size=600, force=True, silent=True)
+    monkeypatch.undo()
+    loaded = load_safetensors(test_file)
+    assert all(torch.equal(loaded[key], old[key]) for key in old)
+
+    # A completed overwrite writes tagged shards, then removes the previous ones
+    save_safetensors(new, test_file, max_shard_size=600, force=True, silent=True)
+    names = set(read_json(tmp_path / "model.safetensors.index.json")["weight_map"].values())
+    assert len(names) == 3 and "model-00001-of-00003.safetensors" not in names
+    assert {p.name for p in tmp_path.glob("model-*")} == names
+    loaded = load_safetensors(test_file)
+    assert all(torch.equal(loaded[key], new[key]) for key in new)
+
+    # The next overwrite goes back to the standard names
+    save_safetensors(old, test_file, max_shard_size=600, force=True, silent=True)
+    assert sorted(p.name for p in tmp_path.glob("model-*")) == [
+        f"model-0000{i}-of-00003.safetensors" for i in range(1, 4)
+    ]
@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from whywhytools.text_manager import append_file, read_file, write_file
+from whywhytools.text_manager import append_file, iter_file, read_file, write_file
 
 
 def test_write_and_read_file(tmp_path: Path):
@@ -60,3 +60,33 @@ def test_text_manager_type_error(tmp_path: Path):
 
     with pytest.raises(TypeError):
         read_file(123)
+
+
+def test_iter_file(tmp_path: Path):
+    test_file = tmp_path / "test.txt"
+    lines = ["Line 1", "", "Línea 3"]
+    write_file(lines, test_file, silent=True)
+
+    assert list(iter_file(test_file)) == lines
+    assert list(iter_file(test_file, mmap=True)) == lines
+
+
+def test_read_file_mmap(tmp_path: Path):
+    test_file = tmp_path / "test.txt"
+    test_file.write_bytes("first\r\nsecond\n\nlast 最後".encode())
+    assert read_file(test_file, lines=True, mmap=True) == read_file(test_file, lines=True)
+
+    empty_file = tmp_path / "empty.txt"
+    empty_file.touch()
+    assert read_file(empty_file, lines=True, mmap=True) == []
+
+    # The whole content is decoded from the mapping, with the newlines of text mode
+    assert read_file(test_file, mmap=True) == read_file(test_file) == "first\nsecond\n\nlast 最後"
+    (tmp_path / "old_mac.txt").write_bytes(b"a\rb\r\nc")
+    assert read_file(tmp_path / "old_mac.txt", mmap=True) == read_file(tmp_path / "old_mac.txt") == "a\nb\nc"
+    assert read_file(empty_file, mmap=True) == ""
+
+    with pytest.raises(ValueError, match="compressed"):
+        iter_file(tmp_path / "test.txt.gz", mmap=True)
+    with pytest.raises(ValueError, match="compressed"):
+        read_file(tmp_path / "test.txt.gz", mmap=True)
@@ -3,7 +3,7 @@ import pytest
 torch = pytest.importorskip("torch")
 
 from pathlib import Path
-from whywhytools.torch_manager import load_pt, save_pt
+from whywhytools.torch_manager import inspect_pt, load_pt, save_pt
 
 
 def test_save_and_load_pt(tmp_path: Path):
@@ -39,3 +39,34 @@ def test_save_pt_force(tmp_path: Path):
 def test_torch_manager_type_error():
     with pytest.raises(TypeError):
         load_pt(123)
+
+
+def test_load_pt_mmap(tmp_path: Path):
+    test_file = tmp_path / "test.pt"
+    data = {"weight": torch.arange(6.0).reshape(2, 3)}
+    save_pt(data, test_file, silent=True)
+
+    for mmap in (None, True, False):
+        loaded = load_pt(test_file, weights_only=True, mmap=mmap)
+        assert torch.equal(loaded["weight"], data["weight"])
+
+    # The legacy format cannot be memory-mapped, so it is not by default
+    legacy_file = tmp_path / "legacy.pt"
+    save_pt(data, legacy_file, silent=True, _use_new_zipfile_serialization=False)
+    assert torch.equal(load_pt(legacy_file, weights_only=True)["weight"], data["weight"])
+
+
+def test_inspect_pt(tmp_path: Path):
+    test_file = tmp_path / "test.pt"
+    data = {
+        "model": {"layer.weight": torch.zeros(4, 2), "layer.bias": torch.zeros(4, dtype=torch.float16)},
+        "optimizer": [torch.zeros(3, dtype=torch.int64)],
+        "step": 10,
+    }
+    save_pt(data, test_file, silent=True)
+
+    assert inspect_pt(test_file) == {
+        "model.layer.weight": {"dtype": "float32", "shape": [4, 2]},
+        "model.layer.bias": {"dtype": "float16", "shape": [4]},
+        "optimizer.0": {"dtype": "int64", "shape": [3]},
+    }
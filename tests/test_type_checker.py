@@ -1,4 +1,5 @@
 import pytest
+from whywhytools import type_checker
 from whywhytools.type_checker import get_var_name, check_type, check_list_type
 
 
@@ -54,3 +55,38 @@ def test_check_list_type_failure():
     str_list = ["a", "b", 3]
     with pytest.raises(TypeError, match="got int at index 2"):
         check_list_type(str_list, str, var_name="str_list")
+
+
+def test_check_list_type_name_lookup_is_lazy(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("get_var_name must only run on failure")
+
+    monkeypatch.setattr(type_checker, "get_var_name", fail)
+    check_list_type(list(range(1000)), int)
+    check_type(1, int)
+
+
+def test_check_list_type_validate_modes():
+    items = ["a"] * 10_000
+    items[1] = 1
+
+    with pytest.raises(TypeError, match="got int at index 1"):
+        check_list_type(items, str, var_name="items", validate="full")
+
+    # Sampling checks evenly spaced elements only, and reports the first bad index
+    check_list_type(items, str, validate="sample")
+    items[10] = 1
+    with pytest.raises(TypeError, match="got int at index 1"):
+        check_list_type(items, str, var_name="items", validate="sample")
+
+    # At most SAMPLE_SIZE elements are checked: a stride of 3 over 2500 items skips index 1250
+    items = ["a"] * 2500
+    items[1250] = 1
+    check_list_type(items, str, validate="sample")
+
+    check_list_type(items, str, validate="off")
+    with pytest.raises(TypeError, match="must be a list"):
+        check_list_type("not a list", str, var_name="s", validate="off")
+
+    with pytest.raises(ValueError):
+        check_list_type(items, str, validate="none")
@@ -0,0 +1,80 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from whywhytools.utils import atomic_path, create_parent_dirs, parse_size
+
+
+def test_create_parent_dirs(tmp_path: Path):
+    test_file = tmp_path / "a" / "b" / "test.txt"
+    create_parent_dirs(test_file)
+    assert test_file.parent.is_dir()
+
+    # A bare file name has no parent to create
+    create_parent_dirs("test.txt")
+
+
+@pytest.mark.parametrize("fsync", ["none", "file", "file+dir"])
+def test_atomic_path(tmp_path: Path, fsync: str):
+    test_file = tmp_path / "test.txt"
+
+    with atomic_path(test_file, fsync=fsync) as path:
+        assert Path(path).parent == tmp_path
+        assert path != test_file
+        Path(path).write_text("content", encoding="utf-8")
+        assert not test_file.exists()
+
+    assert test_file.read_text(encoding="utf-8") == "content"
+    assert os.listdir(tmp_path) == ["test.txt"]
+
+    with atomic_path(test_file, atomic=False, fsync=fsync) as path:
+        assert path == test_file
+
+
+def test_atomic_path_failure_keeps_original(tmp_path: Path):
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("original", encoding="utf-8")
+    os.chmod(test_file, 0o640)
+
+    with pytest.raises(RuntimeError), atomic_path(test_file) as path:
+        Path(path).write_text("partial", encoding="utf-8")
+        raise RuntimeError("killed")
+
+    assert test_file.read_text(encoding="utf-8") == "original"
+    assert os.listdir(tmp_path) == ["test.txt"]
+
+    # The replaced file keeps the permissions of the original
+    with atomic_path(test_file) as path:
+        Path(path).write_text("new", encoding="utf-8")
+    assert test_file.stat().st_mode & 0o777 == 0o640
+
+
+def test_atomic_path_writes_through_symlink(tmp_path: Path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    target = data_dir / "test.txt"
+    target.write_text("original", encoding="utf-8")
+    link = tmp_path / "link.txt"
+    link.symlink_to(target)
+
+    with atomic_path(link) as path:
+        assert Path(path).parent == data_dir
+        Path(path).write_text("new", encoding="utf-8")
+
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf-8") == "new"
+    assert os.listdir(data_dir) == ["test.txt"]
+
+
+def test_atomic_path_invalid_fsync(tmp_path: Path):
+    with pytest.raises(ValueError, match="fsync must be one of"), atomic_path(tmp_path / "test.txt", fsync="always"):
+        pass
+
+
+def test_parse_size():
+    assert parse_size("5GB") == 5 * 10**9
+    assert parse_size("512MiB") == 512 << 20
+    assert parse_size(100) == parse_size("100") == 100
+    with pytest.raises(ValueError):
+        parse_size("lots")